@@ -0,0 +1,311 @@
+import datetime
+import json
+import struct
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .columnar import NAMES, ColumnarCalendar
+from .data_classes import Data, Timings, _MetaTable
+from .timezones import get_timezone
+
+__all__ = ("encode", "decode", "decode_columnar", "MAX_TABLE_SIZE")
+
+MAGIC = b"ALDN"
+VERSION = 1
+
+_DAY, _MONTH, _YEAR = range(3)  # shapes of the encoded data
+
+# magic, version, shape, number of days, size of the table
+_HEADER = struct.Struct("<4sBBII")
+# month (0 if not a year calendar), timestamp, meta, then the template,
+# weekday and day of the gregorian and hijri dates, then the times as
+# minutes since midnight in NAMES order
+_RECORD = struct.Struct("<BqH" + "HHB" * 2 + "H" * len(NAMES))
+#: Most values the table of an encoded calendar can have, its indexes are
+#: 2 bytes.
+MAX_TABLE_SIZE = 1 << 16
+_dumps = json.JSONEncoder(ensure_ascii=False, sort_keys=True).encode
+
+
+class _Table:
+    # The values days have in common, each stored once as JSON and
+    # referred to by index. A value is first looked up by its repr, which
+    # is much cheaper to make, and only encoded when it's not found.
+
+    __slots__ = ("values", "_indexes", "_reprs")
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._indexes: Dict[str, int] = {}
+        self._reprs: Dict[str, int] = {}
+
+    def index(self, value, convert=None) -> int:
+        key = repr(value)
+        i = self._reprs.get(key)
+        if i is None:
+            text = _dumps(value if convert is None else convert(value))
+            i = self._indexes.get(text)
+            if i is None:
+                if len(self.values) == MAX_TABLE_SIZE:
+                    raise ValueError(
+                        "Too many different metas and dates to encode, "
+                        "at most {} are supported.".format(MAX_TABLE_SIZE)
+                    )
+                i = self._indexes[text] = len(self.values)
+                self.values.append(text)
+            self._reprs[key] = i
+        return i
+
+    def encode(self) -> bytes:
+        return ("[" + ",".join(self.values) + "]").encode()
+
+
+def _split(
+    date: dict, readable: Optional[str] = None
+) -> Tuple[dict, dict, int]:
+    # Splits a gregorian or hijri date into what a month of days have in
+    # common, its weekday and its day. A date that isn't in DD-MM-YYYY
+    # format is kept whole, with 0 as its day.
+    template = dict(date)
+    weekday = template.pop("weekday")
+    day = template.get("day")
+    text = template.get("date") or ""
+    if (
+        isinstance(day, str)
+        and len(day) == 2
+        and day.isdigit()
+        and day != "00"
+        and text[:2] == day
+        and (readable is None or readable[:2] == day)
+    ):
+        del template["day"]
+        template["date"] = text[2:]
+        if readable is not None:
+            template["readable"] = readable[2:]
+        return template, weekday, int(day)
+    if readable is not None:
+        template["readable"] = readable
+    return template, weekday, 0
+
+
+def _join(
+    template: dict, weekday: dict, day: int
+) -> Tuple[dict, Optional[str]]:
+    date = dict(template)
+    readable = date.pop("readable", None)
+    date["weekday"] = weekday
+    if day:
+        d = "%02d" % day
+        date["day"] = d
+        date["date"] = d + date["date"]
+        if readable is not None:
+            readable = d + readable
+    return date, readable
+
+
+def _meta(meta: dict) -> dict:
+    # only the id of the method is used by Meta
+    meta = dict(meta)
+    meta["method"] = {"id": meta["method"].get("id")}
+    return meta
+
+
+def _day(day) -> Tuple[dict, Sequence[int]]:
+    # a day as the API returns it, or a Timings, and its times
+    if isinstance(day, Timings):
+        data = day.data
+        raw = {"date": data.date.to_raw(), "meta": data.meta.to_raw()}
+        return raw, day.minutes
+    timings = map(day["timings"].get, NAMES)
+    return day, [int(t[:2]) * 60 + int(t[3:5]) for t in timings]
+
+
+def _days(data) -> Tuple[int, Iterator[Tuple[int, dict]]]:
+    if isinstance(data, Timings):
+        return _DAY, iter([(0, data)])
+    raw = getattr(data, "raw", None)  # a LazyCalendar
+    if raw is not None:
+        return _MONTH, ((0, day) for day in raw)
+    if isinstance(data, list):
+        return _MONTH, ((0, day) for day in data)
+    if "timings" in data:
+        return _DAY, iter([(0, data)])
+    return _YEAR, (
+        (int(month), day)
+        for month in sorted(data, key=int)
+        for day in getattr(data[month], "raw", data[month])
+    )
+
+
+def encode(data: Union[dict, list]) -> bytes:
+    """Encodes timings data as compact bytes.
+
+    Every day is a fixed size record of its times as minutes since
+    midnight and of indexes in a table of the values days share, such as
+    their meta and the parts of their dates that are the same for a
+    month. The table is stored once, as JSON, so decoding doesn't parse
+    anything per day.
+
+    The suffix of the times, e.g. ``" (BST)"``, and the method details
+    that :class:`~aladhan.Meta` doesn't keep are left out. The table can
+    have up to :data:`MAX_TABLE_SIZE` values, far more than a year of days
+    for a few thousand locations need.
+
+    Parameters
+    ----------
+        data: :class:`dict`, :class:`list` or a calendar
+            A day, a month calendar or a year calendar, as returned from
+            the API or as the getters give them,
+            :class:`~aladhan.Timings` included, or a
+            :class:`~aladhan.calendars.LazyCalendar`. What
+            :func:`decode` gives back can be encoded again.
+
+    Returns
+    -------
+        :class:`bytes`
+
+    Raises
+    ------
+        :exc:`ValueError`
+            More than :data:`MAX_TABLE_SIZE` different values to store in
+            the table.
+
+    *New in v1.3.0*
+    """
+    shape, days = _days(data)
+    table = _Table()
+    records = []
+    for month, day in days:
+        day, times = _day(day)
+        date = day["date"]
+        g_template, g_weekday, g_day = _split(
+            date["gregorian"], date["readable"]
+        )
+        h_template, h_weekday, h_day = _split(date["hijri"])
+        records.append(
+            _RECORD.pack(
+                month,
+                int(date["timestamp"]),
+                table.index(day["meta"], _meta),
+                table.index(g_template),
+                table.index(g_weekday),
+                g_day,
+                table.index(h_template),
+                table.index(h_weekday),
+                h_day,
+                *times,
+            )
+        )
+    values = table.encode()
+    return b"".join(
+        [_HEADER.pack(MAGIC, VERSION, shape, len(records), len(values))]
+        + [values]
+        + records
+    )
+
+
+def _read(payload: bytes) -> Tuple[int, list, Iterable[tuple]]:
+    if len(payload) < _HEADER.size:
+        raise ValueError("Not encoded timings data.")
+    magic, version, shape, count, size = _HEADER.unpack_from(payload)
+    if magic != MAGIC:
+        raise ValueError("Not encoded timings data.")
+    if version != VERSION:
+        raise ValueError(
+            "Unsupported encoding version {!r}, expected {!r}.".format(
+                version, VERSION
+            )
+        )
+    start = _HEADER.size + size
+    if len(payload) != start + count * _RECORD.size:
+        raise ValueError("Truncated encoded timings data.")
+    table = json.loads(payload[_HEADER.size : start])
+    return shape, table, _RECORD.iter_unpack(memoryview(payload)[start:])
+
+
+def _shape(shape: int, items: List[tuple]):
+    if shape == _DAY:
+        return items[0][1]
+    if shape == _MONTH:
+        return [item for _, item in items]
+    year = {}
+    for month, item in items:
+        year.setdefault(str(month), []).append(item)
+    return year
+
+
+def decode(payload: bytes, client=None):
+    """Decodes what :func:`encode` gave back into :class:`~aladhan.Timings`.
+
+    The result has the shape the timings and calendar getters give: a
+    :class:`~aladhan.Timings` for a day, a :class:`list` of them for a month
+    calendar, a :class:`dict` of these lists for a year calendar. The days
+    share their :class:`~aladhan.Meta` and :class:`~aladhan.DateType` objects.
+
+    Parameters
+    ----------
+        payload: :class:`bytes`
+            The encoded data.
+
+        client: Optional[:class:`~aladhan.Client`]
+            Given to the :class:`~aladhan.Data` of every day.
+            Default: None
+
+    Raises
+    ------
+        :exc:`ValueError`
+            Not encoded timings data, or encoded by an unsupported version.
+
+    *New in v1.3.0*
+    """
+    shape, table, records = _read(payload)
+    metas = _MetaTable()
+    items = []
+    for record in records:
+        month, timestamp, meta = record[:3]
+        g_date, g_readable = _join(
+            table[record[3]], table[record[4]], record[5]
+        )
+        h_date, _ = _join(table[record[6]], table[record[7]], record[8])
+        date = dict(
+            gregorian=g_date,
+            hijri=h_date,
+            readable=g_readable,
+            timestamp=timestamp,
+        )
+        data = Data._from_minutes(record[9:], date, table[meta], client, metas)
+        items.append((month, data.timings))
+    return _shape(shape, items)
+
+
+def decode_columnar(payload: bytes) -> ColumnarCalendar:
+    """Decodes what :func:`encode` gave back into a
+    :class:`~aladhan.columnar.ColumnarCalendar`, without making any
+    :class:`~aladhan.Data`.
+
+    Raises
+    ------
+        :exc:`ValueError`
+            Not encoded timings data, or encoded by an unsupported version.
+
+    *New in v1.3.0*
+    """
+    _, table, records = _read(payload)
+    calendar = ColumnarCalendar()
+    for record in records:
+        date, _ = _join(table[record[3]], table[record[4]], record[5])
+        d, m, y = date["date"].split("-")
+        calendar._add(
+            datetime.datetime(int(y), int(m), int(d)),
+            get_timezone(table[record[2]]["timezone"]),
+            record[9:],
+        )
+    return calendar
@@ -0,0 +1,235 @@
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from enum import Enum
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
+
+from .exceptions import HTTPException
+from .methods import Method
+
+__all__ = (
+    "canonical_params",
+    "request_key",
+    "quantize",
+    "NegativeCache",
+    "LRUCache",
+)
+
+_COORDINATES = ("latitude", "longitude")
+
+
+def _format_number(value: Union[int, float]) -> str:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return repr(value)
+
+
+def quantize(value: Union[int, float, str], precision: float) -> str:
+    """Rounds a coordinate to the nearest multiple of `precision`.
+
+    Parameters
+    ----------
+        value: :class:`int`, :class:`float` or :class:`str`
+            The coordinate.
+
+        precision: :class:`float`
+            Grid size in degrees, e.g. ``0.01``.
+
+    Returns
+    -------
+        :class:`str`
+            The quantized coordinate, without trailing zeros.
+    """
+    step = Decimal(str(precision))
+    q = (Decimal(str(float(value))) / step).to_integral_value() * step
+    q = q.quantize(step) if step.as_tuple().exponent < 0 else q
+    s = format(q.normalize(), "f")
+    return "0" if s == "-0" else s
+
+
+def _normalize(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, Method):
+        value = value.id
+    if isinstance(value, bool):
+        return value and "true" or "false"
+    if isinstance(value, (int, float)):
+        return _format_number(value)
+    value = getattr(value, "value", value)  # Tune
+    return str(value)
+
+
+def canonical_params(
+    params: Optional[dict], precision: Optional[float] = None
+) -> Dict[str, str]:
+    """Builds a canonical form of request parameters.
+
+    Keys are sorted, ``None`` values are dropped and every value is
+    turned into the string that would be sent to the API, so that
+    ``34``, ``34.0`` and ``"34.0"`` or ``Schools.HANAFI`` and ``1`` end
+    up being the same thing.
+
+    Parameters
+    ----------
+        params: Optional[:class:`dict`]
+            Request parameters.
+
+        precision: Optional[:class:`float`]
+            If given, latitude and longitude are quantized to it.
+
+    Returns
+    -------
+        :class:`dict`
+            The canonical parameters.
+    """
+    if not params:
+        return {}
+    dct = {}
+    for key, value in params.items():
+        if isinstance(value, Method) and value.id == 99:
+            dct.setdefault("methodSettings", value.params_str)
+        value = _normalize(value)
+        if value is None:
+            continue
+        if key in _COORDINATES:
+            if precision:
+                value = quantize(value, precision)
+            else:
+                value = _format_number(float(value))
+        dct[key] = value
+    return dict(sorted(dct.items()))
+
+
+def request_key(
+    endpoint: str, params: Optional[dict], precision: Optional[float] = None
+) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Builds a hashable key that identifies a request.
+
+    Two requests that would get the same response from the API share the
+    same key, so it can be used for caching or coalescing requests.
+
+    Parameters
+    ----------
+        endpoint: :class:`str`
+            Request's endpoint.
+
+        params: Optional[:class:`dict`]
+            Request parameters.
+
+        precision: Optional[:class:`float`]
+            If given, latitude and longitude are quantized to it.
+
+    Returns
+    -------
+        :class:`tuple`
+            The request key.
+    """
+    return endpoint, tuple(canonical_params(params, precision).items())
+
+
+class NegativeCache:
+    """
+    A short lived cache of failed responses.
+
+    Used to re-raise errors such as :exc:`~aladhan.exceptions.BadRequest`
+    for an address that couldn't be geocoded without asking the API again.
+
+    Parameters
+    ----------
+        ttl: :class:`float`
+            Seconds an error is kept for.
+            Default: 60
+
+        maxsize: :class:`int`
+            Maximum number of errors kept, the oldest ones are dropped first.
+            Default: 1024
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = ("ttl", "maxsize", "clock", "_entries")
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries: OrderedDict = OrderedDict()
+
+    def put(self, key: Hashable, exc: HTTPException):
+        """Stores the error raised for `key`."""
+        self._entries.pop(key, None)
+        expires = self.clock() + self.ttl
+        self._entries[key] = (expires, type(exc), exc.response)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key: Hashable) -> Optional[HTTPException]:
+        """Returns a fresh copy of the error stored for `key` if it
+        hasn't expired yet, ``None`` otherwise."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, cls, response = entry
+        if expires <= self.clock():
+            del self._entries[key]
+            return None
+        return cls(dict(response))
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class LRUCache:
+    """
+    A bounded mapping that drops the least recently used item first.
+
+    Parameters
+    ----------
+        maxsize: :class:`int`
+            Maximum number of items kept.
+            Default: 128
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = ("maxsize", "_data")
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable, default=None):
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def put(self, key: Hashable, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default=None):
+        return self._data.pop(key, default)
+
+    def clear(self):
+        self._data.clear()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
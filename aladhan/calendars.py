@@ -0,0 +1,327 @@
+from collections.abc import MutableSequence
+from typing import Iterable, Iterator, List, Optional, Union
+
+from .data_classes import (
+    _TIMINGS,
+    Data,
+    Timings,
+    _check_day,
+    _client,
+    _MetaTable,
+)
+
+__all__ = ("LazyCalendar", "from_raw", "to_raw")
+
+_MONTHS = frozenset(map(str, range(1, 13)))
+
+
+class LazyCalendar(MutableSequence):
+    """
+    A month calendar that builds the :class:`~aladhan.Timings` of a day
+    only when it's accessed.
+
+    It keeps the days as they were returned from the API and behaves like
+    the :class:`list` of :class:`~aladhan.Timings` a calendar getter
+    returns: it can be indexed, sliced, iterated, reversed and compared,
+    and it has the methods of a list. Changing it builds every day, and
+    :attr:`raw` is then a copy kept in step with the changes.
+
+    Unlike a list, a slice or a :meth:`copy` is a LazyCalendar, and ``+``
+    gives a :class:`list`.
+
+    Example
+
+    .. code:: py
+
+        client = aladhan.Client(lazy_calendars=True)
+        calendar = client.get_calendar_by_address(
+            "London", aladhan.CalendarDateArg(2021, 5)
+        )
+        print(calendar[0])  # only the first day is built
+
+    Parameters
+    ----------
+        days: :class:`list` of :class:`dict`
+            The days of a calendar response.
+
+        client: :class:`~aladhan.Client`
+            The client that the days were fetched from.
+
+        memoize: :class:`bool`
+            Whether to keep the built :class:`~aladhan.Timings`, so the
+            same object is given back every time a day is accessed.
+            Default: True
+
+    It can be pickled, with the days and the :class:`~aladhan.Timings`
+    already built, but without its client, see
+    :func:`~aladhan.data_classes.reattach`.
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = ("_days", "_items", "_metas", "client")
+
+    def __init__(
+        self,
+        days: List[dict],
+        client,
+        memoize: bool = True,
+        metas: Optional[_MetaTable] = None,
+    ):
+        self._days = days
+        self._items: Optional[List[Optional[Timings]]]
+        self._items = [None] * len(days) if memoize else None
+        self._metas = _MetaTable() if metas is None else metas
+        self.client = client
+
+    @property
+    def raw(self) -> List[dict]:
+        """:class:`list` of :class:`dict`: The days as they were returned
+        from the API."""
+        return self._days
+
+    @property
+    def memoize(self) -> bool:
+        return self._items is not None
+
+    def _build(self, i: int) -> Timings:
+        items = self._items
+        if items is not None:
+            timings = items[i]
+            if timings is not None:
+                return timings
+        timings = Data(
+            **self._days[i], client=self.client, metas=self._metas
+        ).timings
+        if items is not None:
+            items[i] = timings
+        return timings
+
+    def __getitem__(self, i: Union[int, slice]):
+        if isinstance(i, slice):
+            calendar = LazyCalendar(
+                self._days[i], self.client, False, self._metas
+            )
+            if self._items is not None:
+                calendar._items = self._items[i]
+            return calendar
+        if i < 0:
+            i += len(self._days)
+        if not 0 <= i < len(self._days):
+            raise IndexError("calendar index out of range")
+        return self._build(i)
+
+    def __iter__(self) -> Iterator[Timings]:
+        for i in range(len(self._days)):
+            yield self._build(i)
+
+    def __reversed__(self) -> Iterator[Timings]:
+        for i in range(len(self._days) - 1, -1, -1):
+            yield self._build(i)
+
+    def __len__(self):
+        return len(self._days)
+
+    def _materialize(self) -> List[Timings]:
+        # before a change, every day is built and the raw days copied so
+        # both can be changed together
+        items = self._items
+        if items is None or None in items:
+            items = [self._build(i) for i in range(len(self._days))]
+            self._items = items
+            self._days = list(self._days)
+        return items
+
+    def __setitem__(self, i: Union[int, slice], value):
+        items = self._materialize()
+        if isinstance(i, slice):
+            value = list(value)
+            self._days[i] = list(map(_raw_day, value))
+        else:
+            self._days[i] = _raw_day(value)
+        items[i] = value
+
+    def __delitem__(self, i: Union[int, slice]):
+        items = self._materialize()
+        del self._days[i]
+        del items[i]
+
+    def insert(self, i: int, value: Timings):
+        items = self._materialize()
+        self._days.insert(i, _raw_day(value))
+        items.insert(i, value)
+
+    def extend(self, values: Iterable[Timings]):
+        if values is self:
+            values = list(values)
+        for value in values:
+            self.append(value)
+
+    def clear(self):
+        self._materialize()
+        self._days.clear()
+        self._items.clear()
+
+    def reverse(self):
+        self._materialize().reverse()
+        self._days.reverse()
+
+    def sort(self, *, key=None, reverse: bool = False):
+        """Sorts the days in place, like :meth:`list.sort`."""
+        items = self._materialize()
+        order = sorted(
+            range(len(items)),
+            key=lambda i: items[i] if key is None else key(items[i]),
+            reverse=reverse,
+        )
+        self._items = [items[i] for i in order]
+        self._days = [self._days[i] for i in order]
+
+    def copy(self) -> "LazyCalendar":
+        """Gives a shallow copy, sharing the days already built."""
+        return self[:]
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, LazyCalendar)):
+            return NotImplemented
+        return self is other or list(self) == list(other)
+
+    __hash__ = None
+
+    def __add__(self, other) -> List[Timings]:
+        if not isinstance(other, (list, LazyCalendar)):
+            return NotImplemented
+        return list(self) + list(other)
+
+    def __radd__(self, other) -> List[Timings]:
+        if not isinstance(other, (list, LazyCalendar)):
+            return NotImplemented
+        return list(other) + list(self)
+
+    def __getstate__(self):
+        return self._days, self._items, self._metas
+
+    def __setstate__(self, state):
+        self._days, self._items, self._metas = state
+        self.client = _client.get()
+
+    def __repr__(self):
+        built = self._items and sum(t is not None for t in self._items)
+        return "<LazyCalendar days={0} built={1}>".format(
+            len(self._days), built or 0
+        )
+
+
+def _raw_day(timings: Timings) -> dict:
+    if not isinstance(timings, Timings):
+        raise TypeError(
+            "Expected Timings, got {!r}".format(type(timings).__name__)
+        )
+    return timings.data.to_raw()
+
+
+def _month(days: List[dict], client, lazy: bool, metas: _MetaTable):
+    if lazy:
+        return LazyCalendar(days, client, metas=metas)
+    return [Data(**day, client=client, metas=metas).timings for day in days]
+
+
+def _from_raw(data, client, lazy: bool, metas: Optional[_MetaTable] = None):
+    if isinstance(data, list):  # it is a month calendar
+        return _month(data, client, lazy, _MetaTable())
+    # it is a dict
+    if "timings" not in data:  # it is a year calendar
+        metas = _MetaTable()
+        return {
+            month: _month(days, client, lazy, metas)
+            for month, days in data.items()
+        }
+
+    # it is just a day timings
+    return Data(**data, client=client, metas=metas).timings
+
+
+def _check(data):
+    if isinstance(data, list):  # a month calendar
+        for day in data:
+            _check_day(day, _TIMINGS)
+    elif isinstance(data, dict) and data and data.keys() <= _MONTHS:
+        for days in data.values():
+            if not isinstance(days, list):
+                raise ValueError(
+                    "Expected a list of days for a month, got {!r}".format(
+                        type(days).__name__
+                    )
+                )
+            _check(days)
+    else:  # a day
+        _check_day(data, _TIMINGS)
+
+
+def from_raw(data: Union[dict, list], client=None, lazy: bool = False):
+    """Makes timings or a calendar from what a timings or calendar
+    request returned, as it was returned from the API or given back by
+    :func:`to_raw`, without any request.
+
+    Every day is checked like :meth:`~aladhan.Data.from_raw` does, and the
+    days of a calendar share their :class:`~aladhan.Meta`.
+
+    Parameters
+    ----------
+        data: :class:`dict` or :class:`list`
+            A day, a month calendar or a year calendar.
+
+        client: Optional[:class:`~aladhan.Client`]
+            The client given to every :class:`~aladhan.Data`.
+            Default: None
+
+        lazy: :class:`bool`
+            Whether to make :class:`LazyCalendar` of month calendars.
+            Default: False
+
+    Returns
+    -------
+        :class:`~aladhan.Timings`, :class:`list` of
+        :class:`~aladhan.Timings` or :class:`dict` of :class:`str` and
+        :class:`list` of
+        :class:`~aladhan.Timings`
+            What a getter gives for this data.
+
+    Raises
+    ------
+        :exc:`ValueError`
+            The data is missing something, or has an invalid time or an
+            unknown timezone.
+
+    *New in v1.3.0*
+    """
+    _check(data)
+    return _from_raw(data, client, lazy)
+
+
+def to_raw(calendar) -> Union[dict, list]:
+    """Gives timings or a calendar back as the API returns them, data that
+    :func:`from_raw` makes the same from.
+
+    The days of a :class:`LazyCalendar` are given as they were returned
+    from the API, the others as :meth:`~aladhan.Data.to_raw` gives them.
+
+    Parameters
+    ----------
+        calendar:
+            A :class:`~aladhan.Timings`, a month calendar, a year calendar or a
+            :class:`LazyCalendar`.
+
+    Returns
+    -------
+        :class:`dict` or :class:`list`
+
+    *New in v1.3.0*
+    """
+    if isinstance(calendar, Timings):
+        return calendar.data.to_raw()
+    if isinstance(calendar, LazyCalendar):
+        return list(calendar.raw)
+    if isinstance(calendar, dict):
+        return {month: to_raw(days) for month, days in calendar.items()}
+    return [timings.data.to_raw() for timings in calendar]
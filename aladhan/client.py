@@ -1,7 +1,23 @@
+import asyncio
+import datetime
+from functools import partial
 from typing import Awaitable as Aw
-from typing import Dict, List, Optional, Type
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 from typing import Union as Un
 
+from .cache import LRUCache
+from .calendars import LazyCalendar, _from_raw
+from .columnar import CalendarMatrix, ColumnarCalendar
 from .data_classes import (
     CalendarDateArg,
     Data,
@@ -13,13 +29,21 @@ from .data_classes import (
     Qibla,
     Timings,
     TimingsDateArg,
+    _MetaTable,
 )
 from .http import HTTPClient
 from .methods import Method, all_methods
+from .planner import Location, calendar_requests, location_params
 from .types import IMR, SDR, StatusR
 
 TimingsR = Un[Timings, Aw[Timings]]
-_Calendar = Un[List[Timings], Dict[str, Timings]]
+_Month = Un[List[Timings], LazyCalendar]
+_Calendar = Un[
+    _Month,
+    Dict[str, _Month],
+    Iterator[Timings],
+    AsyncIterator[Timings],
+]
 CalendarR = Un[_Calendar, Aw[_Calendar]]
 QiblaR = Un[Qibla, Aw[Qibla]]
 AsmaR = Un[List[Ism], Aw[List[Ism]]]
@@ -29,6 +53,9 @@ PrayerR = Un[Prayer, Aw[Prayer]]
 IntR = Un[int, Aw[int]]
 StrR = Un[str, Aw[str]]
 ListR = Un[list, Aw[list]]
+_Range = Un[List[Timings], Iterator[Timings], AsyncIterator[Timings]]
+RangeR = Un[_Range, Aw[List[Timings]]]
+MatrixR = Un[CalendarMatrix, Aw[CalendarMatrix]]
 
 __all__ = ("Client",)
 
@@ -87,19 +114,100 @@ class Client:
 
         auto_manage_rate: :class:`bool`
             Whether to handle rate limits automatically or not.
+
+        coordinate_precision: Optional[:class:`float`]
+            If given, coordinates are rounded to this precision (in
+            degrees, e.g. ``0.01``) before being sent, so nearby locations
+            share the same request. Default: ``None``
+
+            *New in v1.3.0*
+
+        adaptive_rate: :class:`bool`
+            Whether to pace requests with an
+            :class:`~aladhan.ratelimit.AIMDRateLimiter` that learns the
+            rate limit from response headers. Default: ``False``
+
+            *New in v1.3.0*
+
+        negative_cache_ttl: Optional[:class:`float`]
+            If given, a :exc:`~aladhan.exceptions.BadRequest` from an address
+            or city getter is remembered for this many seconds and raised
+            again for the same request without calling the API.
+            Default: ``None``
+
+            *New in v1.3.0*
+
+        hedge: :class:`bool`
+            Whether to hedge slow requests with a
+            :class:`~aladhan.hedging.HedgePolicy`. Only used for
+            asynchronous usage. Default: ``False``
+
+            *New in v1.3.0*
+
+        calendar_timings: :class:`bool`
+            Whether timings getters that were given a date should be
+            answered from the month calendar of that date. The month is
+            fetched once and kept, so the following days of the same
+            location and parameters don't need a request. Default: ``False``
+
+            *New in v1.3.0*
+
+        lazy_calendars: :class:`bool`
+            Whether calendar getters should return month calendars as
+            :class:`~aladhan.calendars.LazyCalendar`, that only build the
+            :class:`Timings` of the days that are accessed, instead of
+            lists. Default: ``False``
+
+            *New in v1.3.0*
+
+        weak_backrefs: :class:`bool`
+            Whether the objects of a result should refer back to their
+            :class:`Data` or :class:`NextPrayerData` through weak
+            references, so results are freed as soon as they aren't used
+            instead of by the garbage collector. :attr:`Data.timings` and
+            :attr:`NextPrayerData.prayer` are then made again if they
+            were freed, and :attr:`Meta.data` and :attr:`Date.data` are
+            ``None`` once their Data is freed. Default: ``False``
+
+            *New in v1.3.0*
     """
 
-    __slots__ = "converter", "http"
+    __slots__ = (
+        "converter",
+        "http",
+        "calendar_cache",
+        "lazy_calendars",
+        "weak_backrefs",
+    )
 
-    def __init__(self, is_async: bool = False, auto_manage_rate: bool = True):
+    def __init__(
+        self,
+        is_async: bool = False,
+        auto_manage_rate: bool = True,
+        coordinate_precision: Optional[float] = None,
+        adaptive_rate: bool = False,
+        negative_cache_ttl: Optional[float] = None,
+        hedge: bool = False,
+        calendar_timings: bool = False,
+        lazy_calendars: bool = False,
+        weak_backrefs: bool = False,
+    ):
         self.converter: Un[Type[_AsyncConverter], Type[_SyncConverter]]
         if is_async:
             self.converter = _AsyncConverter
         else:
             self.converter = _SyncConverter
         self.http = HTTPClient(
-            is_async=is_async, auto_manage_rate=auto_manage_rate
+            is_async=is_async,
+            auto_manage_rate=auto_manage_rate,
+            coordinate_precision=coordinate_precision,
+            adaptive_rate=adaptive_rate,
+            negative_cache_ttl=negative_cache_ttl,
+            hedge=hedge,
         )
+        self.calendar_cache = LRUCache(64) if calendar_timings else None
+        self.lazy_calendars = lazy_calendars
+        self.weak_backrefs = weak_backrefs
 
     def close(self):
         """Closes the connection."""
@@ -214,9 +322,11 @@ class Client:
         if params is None:
             params = Parameters()
         params_dict = params.as_dict
-        params_dict.update(
-            dict(longitude=str(longitude), latitude=str(latitude))
-        )
+        params_dict.update(dict(longitude=longitude, latitude=latitude))
+        if date is not None and self.calendar_cache is not None:
+            return self._timings_from_calendar(
+                self.http.get_calendar, date, params_dict
+            )
         return self.converter.to_timings(
             self, self.http.get_timings(date_str, params_dict)
         )
@@ -258,6 +368,10 @@ class Client:
             params = Parameters()
         params_dict = params.as_dict
         params_dict.update(dict(address=address))
+        if date is not None and self.calendar_cache is not None:
+            return self._timings_from_calendar(
+                self.http.get_calendar_by_address, date, params_dict
+            )
         return self.converter.to_timings(
             self, self.http.get_timings_by_address(date_str, params_dict)
         )
@@ -311,16 +425,31 @@ class Client:
         params_dict.update(dict(city=city, country=country, state=state))
         if state is None:
             del params_dict["state"]
+        if date is not None and self.calendar_cache is not None:
+            return self._timings_from_calendar(
+                self.http.get_calendar_by_city, date, params_dict
+            )
         return self.converter.to_timings(
             self, self.http.get_timings_by_city(date_str, params_dict)
         )
 
+    def _timings_from_calendar(
+        self, fetch: Callable, date: TimingsDateArg, params_dict: dict
+    ) -> TimingsR:
+        day, month, year = map(int, date.date.split("-"))
+        params_dict.update(CalendarDateArg(year, month).as_dict)
+        key = self.http.requester.key(fetch.__name__, params_dict)
+        return self.converter.to_calendar_day(
+            self, self.calendar_cache, key, partial(fetch, params_dict), day
+        )
+
     def get_calendar(
         self,
         longitude: Un[int, float],
         latitude: Un[int, float],
         date: CalendarDateArg,
         params: Optional[Parameters] = None,
+        stream: bool = False,
     ) -> CalendarR:
         """
         Get all prayer times for a specific calendar month/year from \
@@ -340,12 +469,24 @@ class Client:
             params: Optional[:class:`Parameters`]
                 Default: ``Parameters()``
 
+            stream: :class:`bool`
+                Whether to parse the response while it's being read and
+                yield the days one by one instead, so a year calendar
+                doesn't have to be held in memory all at once.
+                Default: False
+                *New in v1.3.0*
+
         Returns
         -------
             :class:`list` of :class:`Timings` or dict[:class:`str`, \
             :class:`list` of :class:`Timings`]
                 A month calendar if month parameter was given in date
                 argument otherwise a year calendar.
+                A generator (or an asynchronous generator) of
+                :class:`Timings` if `stream` is True.
+                Month calendars are
+                :class:`~aladhan.calendars.LazyCalendar` if the client
+                was made with `lazy_calendars`.
 
         Raises
         ------
@@ -355,8 +496,12 @@ class Client:
         if params is None:
             params = Parameters()
         params_dict = params.as_dict
-        params_dict.update(longitude=str(longitude), latitude=str(latitude))
+        params_dict.update(longitude=longitude, latitude=latitude)
         params_dict.update(date.as_dict)
+        if stream:
+            return self.converter.iter_calendar(
+                self, self.http.get_calendar(params_dict, date.hijri, True)
+            )
         return self.converter.to_timings(
             self, self.http.get_calendar(params_dict, date.hijri)
         )
@@ -366,6 +511,7 @@ class Client:
         address: str,
         date: CalendarDateArg,
         params: Optional[Parameters] = None,
+        stream: bool = False,
     ) -> CalendarR:
         """
         Get all prayer times for a specific calendar month/year
@@ -383,12 +529,24 @@ class Client:
             params: Optional[:class:`Parameters`]
                 Default: ``Parameters()``
 
+            stream: :class:`bool`
+                Whether to parse the response while it's being read and
+                yield the days one by one instead, so a year calendar
+                doesn't have to be held in memory all at once.
+                Default: False
+                *New in v1.3.0*
+
         Returns
         -------
             :class:`list` of :class:`Timings` or dict[:class:`str`, \
             :class:`list` of :class:`Timings`]
                 A month calendar if month parameter was given in date
                 argument otherwise a year calendar.
+                A generator (or an asynchronous generator) of
+                :class:`Timings` if `stream` is True.
+                Month calendars are
+                :class:`~aladhan.calendars.LazyCalendar` if the client
+                was made with `lazy_calendars`.
 
         Raises
         ------
@@ -400,6 +558,13 @@ class Client:
         params_dict = params.as_dict
         params_dict.update(dict(address=address))
         params_dict.update(date.as_dict)
+        if stream:
+            return self.converter.iter_calendar(
+                self,
+                self.http.get_calendar_by_address(
+                    params_dict, date.hijri, True
+                ),
+            )
         return self.converter.to_timings(
             self,
             self.http.get_calendar_by_address(params_dict, date.hijri),
@@ -412,6 +577,7 @@ class Client:
         date: CalendarDateArg,
         state: Optional[str] = None,
         params: Optional[Parameters] = None,
+        stream: bool = False,
     ) -> CalendarR:
         """
         Get all prayer times for a specific calendar month/year
@@ -437,12 +603,24 @@ class Client:
             params: Optional[:class:`Parameters`]
                 Default: ``Parameters()``
 
+            stream: :class:`bool`
+                Whether to parse the response while it's being read and
+                yield the days one by one instead, so a year calendar
+                doesn't have to be held in memory all at once.
+                Default: False
+                *New in v1.3.0*
+
         Returns
         -------
             :class:`list` of :class:`Timings` or dict[:class:`str`, \
             :class:`list` of :class:`Timings`]
                 A month calendar if month parameter was given in date
                 argument otherwise a year calendar.
+                A generator (or an asynchronous generator) of
+                :class:`Timings` if `stream` is True.
+                Month calendars are
+                :class:`~aladhan.calendars.LazyCalendar` if the client
+                was made with `lazy_calendars`.
 
         Raises
         ------
@@ -456,10 +634,310 @@ class Client:
         if state is None:
             del params_dict["state"]
         params_dict.update(date.as_dict)
+        if stream:
+            return self.converter.iter_calendar(
+                self,
+                self.http.get_calendar_by_city(params_dict, date.hijri, True),
+            )
         return self.converter.to_timings(
             self, self.http.get_calendar_by_city(params_dict, date.hijri)
         )
 
+    def get_timings_range(
+        self,
+        longitude: Un[int, float],
+        latitude: Un[int, float],
+        start: TimingsDateArg,
+        end: TimingsDateArg,
+        params: Optional[Parameters] = None,
+        stream: bool = False,
+    ) -> RangeR:
+        """
+        Get prayer times of every day between two dates from coordinates
+        (longitude, latitude).
+
+        The range is fetched with the fewest month or year calendar
+        requests, which are sent concurrently for asynchronous usage, as
+        many at once as the rate limit allows.
+
+        Parameters
+        ----------
+            longitude: :class:`int` or :class:`float`
+                Longitude coordinate of the location.
+
+            latitude: :class:`int` or :class:`float`
+                Latitude coordinate of the location.
+
+            start: :class:`TimingsDateArg`
+                First day of the range.
+
+            end: :class:`TimingsDateArg`
+                Last day of the range, included.
+
+            params: Optional[:class:`Parameters`]
+                Default: ``Parameters()``
+
+            stream: :class:`bool`
+                Whether to return an iterator (an async iterator for
+                asynchronous usage) that yields timings as their month
+                arrives instead of a list.
+                Default: ``False``
+
+        Returns
+        -------
+            :class:`list` of :class:`Timings`
+                Timings of every day in the range, in date order.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                `start` is after `end`.
+
+            :exc:`~aladhan.exceptions.BadRequest`
+                Invalid parameter was passed.
+
+        *New in v1.3.0*
+        """
+        if params is None:
+            params = Parameters()
+        params_dict = params.as_dict
+        params_dict.update(longitude=longitude, latitude=latitude)
+        return self._timings_range(
+            self.http.get_calendar, start, end, params_dict, stream
+        )
+
+    def get_timings_range_by_address(
+        self,
+        address: str,
+        start: TimingsDateArg,
+        end: TimingsDateArg,
+        params: Optional[Parameters] = None,
+        stream: bool = False,
+    ) -> RangeR:
+        """
+        Get prayer times of every day between two dates from address.
+
+        Parameters
+        ----------
+            address: :class:`str`
+                An address string.
+                Example: "London, United Kingdom"
+
+            start: :class:`TimingsDateArg`
+                First day of the range.
+
+            end: :class:`TimingsDateArg`
+                Last day of the range, included.
+
+            params: Optional[:class:`Parameters`]
+                Default: ``Parameters()``
+
+            stream: :class:`bool`
+                Whether to return an iterator (an async iterator for
+                asynchronous usage) that yields timings as their month
+                arrives instead of a list.
+                Default: ``False``
+
+        Returns
+        -------
+            :class:`list` of :class:`Timings`
+                Timings of every day in the range, in date order.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                `start` is after `end`.
+
+            :exc:`~aladhan.exceptions.BadRequest`
+                Invalid parameter was passed.
+
+        *New in v1.3.0*
+        """
+        if params is None:
+            params = Parameters()
+        params_dict = params.as_dict
+        params_dict.update(dict(address=address))
+        return self._timings_range(
+            self.http.get_calendar_by_address, start, end, params_dict, stream
+        )
+
+    def get_timings_range_by_city(
+        self,
+        city: str,
+        country: str,
+        start: TimingsDateArg,
+        end: TimingsDateArg,
+        state: Optional[str] = None,
+        params: Optional[Parameters] = None,
+        stream: bool = False,
+    ) -> RangeR:
+        """
+        Get prayer times of every day between two dates from city,
+        country and state.
+
+        Parameters
+        ----------
+            city: :class:`str`
+                The city name.
+                Example: "London"
+
+            country: :class:`str`
+                The country name or 2 character alpha ISO 3166 code.
+                Example: "GB" or "United Kingdom"
+
+            state: Optional[:class:`str`]
+                State or province. The state name or abbreviation..
+                Example: "Bexley"
+
+            start: :class:`TimingsDateArg`
+                First day of the range.
+
+            end: :class:`TimingsDateArg`
+                Last day of the range, included.
+
+            params: Optional[:class:`Parameters`]
+                Default: ``Parameters()``
+
+            stream: :class:`bool`
+                Whether to return an iterator (an async iterator for
+                asynchronous usage) that yields timings as their month
+                arrives instead of a list.
+                Default: ``False``
+
+        Returns
+        -------
+            :class:`list` of :class:`Timings`
+                Timings of every day in the range, in date order.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                `start` is after `end`.
+
+            :exc:`~aladhan.exceptions.BadRequest`
+                Invalid parameter was passed.
+
+        *New in v1.3.0*
+        """
+        if params is None:
+            params = Parameters()
+        params_dict = params.as_dict
+        params_dict.update(dict(city=city, country=country, state=state))
+        if state is None:
+            del params_dict["state"]
+        return self._timings_range(
+            self.http.get_calendar_by_city, start, end, params_dict, stream
+        )
+
+    def _timings_range(
+        self,
+        fetch: Callable,
+        start: TimingsDateArg,
+        end: TimingsDateArg,
+        params_dict: dict,
+        stream: bool,
+    ) -> RangeR:
+        first, last = _to_date(start), _to_date(end)
+        if first > last:
+            raise ValueError(
+                "start ({}) must not be after end ({})".format(
+                    start.date, end.date
+                )
+            )
+        fetches = [
+            partial(fetch, dict(params_dict, **arg.as_dict))
+            for arg in calendar_requests(first, last)
+        ]
+        if stream:
+            return self.converter.iter_timings_range(
+                self, fetches, first, last
+            )
+        return self.converter.to_timings_range(self, fetches, first, last)
+
+    def get_calendar_matrix(
+        self,
+        locations: Sequence[Tuple[Location, Optional[Parameters]]],
+        date: CalendarDateArg,
+    ) -> MatrixR:
+        """
+        Get the same calendar month/year for many locations.
+
+        Identical requests are only sent once, and for asynchronous usage
+        they are sent concurrently, as many at once as the rate limit
+        allows. Every calendar is kept as a
+        :class:`~aladhan.columnar.ColumnarCalendar`, without making any
+        :class:`Timings`.
+
+        Example
+
+        .. code:: py
+
+            matrix = client.get_calendar_matrix(
+                [
+                    ("London", None),
+                    ((-0.1276, 51.5072), Parameters(method=3)),
+                    (("Paris", "FR"), None),
+                ],
+                CalendarDateArg(2021, 5),
+            )
+            print(matrix.shape)  # (3, 31, 11)
+
+        Parameters
+        ----------
+            locations: :class:`list` of :class:`tuple`
+                Pairs of a location and its Optional[:class:`Parameters`].
+                A location is an address, a ``(longitude, latitude)``
+                pair or a ``(city, country[, state])`` tuple.
+
+            date: :class:`CalendarDateArg`
+                Date of the calendars.
+
+        Returns
+        -------
+            :class:`~aladhan.columnar.CalendarMatrix`
+                The location × day × time matrix, locations in the given
+                order.
+
+        Raises
+        ------
+            :exc:`~aladhan.exceptions.InvalidArgument`
+                A location isn't in one of the above forms.
+
+            :exc:`~aladhan.exceptions.BadRequest`
+                Invalid parameter was passed.
+
+        *New in v1.3.0*
+        """
+        getters = {
+            "coordinates": self.http.get_calendar,
+            "address": self.http.get_calendar_by_address,
+            "city": self.http.get_calendar_by_city,
+        }
+        locations = list(locations)
+        keys: Dict[tuple, int] = {}
+        fetches = []
+        index: List[int] = []
+        for location, params in locations:
+            kind, params_dict = location_params(location)
+            params_dict.update((params or Parameters()).as_dict)
+            params_dict.update(date.as_dict)
+            key = self.http.requester.key(kind, params_dict)
+            if key not in keys:
+                keys[key] = len(fetches)
+                fetch = partial(getters[kind], params_dict, date.hijri)
+                fetches.append(
+                    lambda fetch=fetch: self.converter.to_obj_a(
+                        fetch(), ColumnarCalendar.from_raw
+                    )
+                )
+            index.append(keys[key])
+
+        return self.converter.to_gathered(
+            self,
+            fetches,
+            lambda calendars: CalendarMatrix(locations, calendars, index),
+        )
+
     @staticmethod
     def get_all_methods() -> Dict[int, Method]:
         """
@@ -916,22 +1394,69 @@ class Client:
         return self.http.get_islamic_months()
 
 
-def _decide_timings(client, data):
+def _decide_timings(client, data, metas=None):
+    return _from_raw(data, client, client.lazy_calendars, metas)
 
-    if isinstance(data, list):  # it is a month calendar
-        return [Data(**day, client=client).timings for day in data]
-    # it is a dict
-    if "1" in data:  # it is a year calendar
-        return {
-            month: [Data(**day, client=client).timings for day in days]
-            for month, days in data.items()
-        }
 
-    # it is just a day timings
-    return Data(**data, client=client).timings
+def _bounded(client, fetches):
+    """Wraps async `fetches` so no more of them wait for a response at once
+    than the rate limit allows."""
+    semaphore = asyncio.Semaphore(client.http.requester.max_in_flight())
+
+    async def run(fetch):
+        async with semaphore:
+            return await fetch()
+
+    return [run(fetch) for fetch in fetches]
+
+
+def _to_date(date: TimingsDateArg) -> datetime.date:
+    d, m, y = map(int, date.date.split("-"))
+    return datetime.date(y, m, d)
+
+
+def _trim_calendar(client, data, start, end):
+    metas = _MetaTable()
+    if isinstance(data, dict):  # a year calendar
+        days = (day for m in sorted(data, key=int) for day in data[m])
+    else:
+        days = iter(data)
+    for day in days:
+        d, m, y = day["date"]["gregorian"]["date"].split("-")
+        if start <= datetime.date(int(y), int(m), int(d)) <= end:
+            yield _decide_timings(client, day, metas)
 
 
 class _SyncConverter:
+    @staticmethod
+    def to_calendar_day(client, cache, key, fetch, day):
+        days = cache.get(key)
+        if days is None:
+            days = fetch()
+            cache.put(key, days)
+        return _decide_timings(client, days[day - 1])
+
+    @staticmethod
+    def to_timings_range(client, fetches, start, end):
+        return list(
+            _SyncConverter.iter_timings_range(client, fetches, start, end)
+        )
+
+    @staticmethod
+    def iter_timings_range(client, fetches, start, end):
+        for fetch in fetches:
+            yield from _trim_calendar(client, fetch(), start, end)
+
+    @staticmethod
+    def to_gathered(client, fetches, func):
+        return func([fetch() for fetch in fetches])
+
+    @staticmethod
+    def iter_calendar(client, days):
+        metas = _MetaTable()
+        for day in days:
+            yield Data(**day, client=client, metas=metas).timings
+
     @staticmethod
     def to_prayer(client, o):
         return NextPrayerData(client=client, **o).prayer
@@ -954,6 +1479,51 @@ class _SyncConverter:
 
 
 class _AsyncConverter:
+    @staticmethod
+    async def to_calendar_day(client, cache, key, fetch, day):
+        # the future is cached so concurrent lookups share one request
+        days = cache.get(key)
+        if days is None:
+            days = asyncio.ensure_future(fetch())
+            cache.put(key, days)
+        try:
+            days = await asyncio.shield(days)
+        except Exception:
+            cache.pop(key)
+            raise
+        return _decide_timings(client, days[day - 1])
+
+    @staticmethod
+    async def to_timings_range(client, fetches, start, end):
+        calendars = await asyncio.gather(*_bounded(client, fetches))
+        return [
+            timings
+            for data in calendars
+            for timings in _trim_calendar(client, data, start, end)
+        ]
+
+    @staticmethod
+    async def iter_timings_range(client, fetches, start, end):
+        tasks = [asyncio.ensure_future(f) for f in _bounded(client, fetches)]
+        try:
+            for task in tasks:
+                data = await task
+                for timings in _trim_calendar(client, data, start, end):
+                    yield timings
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    async def to_gathered(client, fetches, func):
+        return func(await asyncio.gather(*_bounded(client, fetches)))
+
+    @staticmethod
+    async def iter_calendar(client, days):
+        metas = _MetaTable()
+        async for day in days:
+            yield Data(**day, client=client, metas=metas).timings
+
     @staticmethod
     async def to_prayer(client, o):
         return NextPrayerData(client=client, **(await o)).prayer
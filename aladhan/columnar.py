@@ -0,0 +1,348 @@
+import datetime
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .data_classes import _TIMINGS
+from .timezones import day_offset, get_timezone, utc_offset
+
+__all__ = ("ColumnarCalendar", "CalendarMatrix", "to_datetime", "to_date")
+
+#: Names of the times of a day, in :class:`~aladhan.Timings` order.
+NAMES = _TIMINGS
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_INT32 = "i" if array("i").itemsize == 4 else "l"
+_MISSING = object()
+_numpy = _MISSING
+
+
+def _import_numpy():
+    global _numpy
+    if _numpy is _MISSING:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def _require_numpy(usage: str):
+    np = _import_numpy()
+    if np is None:
+        raise ImportError(
+            "`numpy` is a required library that is missing for %s." % usage
+        )
+    return np
+
+
+def _minutes(offset: datetime.timedelta) -> int:
+    return int(offset.total_seconds()) // 60
+
+
+def _utc_times(
+    date: datetime.datetime, tz, times: Sequence[int], strict: bool
+) -> List[Optional[int]]:
+    # minutes since epoch in UTC of times in minutes since midnight of
+    # date, None for the ones a DST switch skipped if strict
+    base = (date.toordinal() - _EPOCH_ORDINAL) * 1440
+    offset = day_offset(tz, date.date())
+    if offset is not None:
+        day_minutes = _minutes(offset)
+        return [base + minutes - day_minutes for minutes in times]
+    utc = []
+    for minutes in times:  # a day with a DST switch
+        time = date + datetime.timedelta(minutes=minutes)
+        offset = utc_offset(tz, time, strict)
+        utc.append(
+            None if offset is None else base + minutes - _minutes(offset)
+        )
+    return utc
+
+
+def to_datetime(minutes: int) -> datetime.datetime:
+    """Turns minutes since epoch back into a naive
+    :class:`datetime.datetime`."""
+    return _EPOCH + datetime.timedelta(minutes=minutes)
+
+
+def to_date(days: int) -> datetime.date:
+    """Turns days since epoch back into a :class:`datetime.date`."""
+    return datetime.date.fromordinal(_EPOCH_ORDINAL + days)
+
+
+class ColumnarCalendar:
+    """
+    A calendar stored as columns of 32 bits integers.
+
+    Every day is a row of its date, as days since epoch, and the times of
+    the day as minutes since epoch, both in local time and in UTC. It's
+    built straight from the days of calendar responses, without making
+    any :class:`~aladhan.Data`, :class:`~aladhan.Timings` or
+    :class:`~aladhan.Prayer`.
+
+    Example
+
+    .. code:: py
+
+        calendar = ColumnarCalendar.from_raw(raw_days)
+        columns = calendar.columns()  # NumPy arrays if it's installed
+        fajr = columns["Fajr"]
+
+    Attributes
+    ----------
+        dates: :class:`array.array`
+            Days since epoch (1970-01-01).
+
+        local: dict[:class:`str`, :class:`array.array`]
+            Minutes since epoch of every time, in local time.
+
+        utc: dict[:class:`str`, :class:`array.array`]
+            Minutes since epoch of every time, in UTC.
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = ("dates", "local", "utc")
+
+    names = NAMES
+
+    def __init__(self):
+        self.dates = array(_INT32)
+        self.local: Dict[str, array] = {n: array(_INT32) for n in NAMES}
+        self.utc: Dict[str, array] = {n: array(_INT32) for n in NAMES}
+
+    @classmethod
+    def from_raw(cls, data: Union[dict, list]) -> "ColumnarCalendar":
+        """Builds a calendar from raw API data.
+
+        Parameters
+        ----------
+            data: :class:`dict` or :class:`list`
+                A day, a month calendar or a year calendar, as returned
+                from the API.
+
+        Returns
+        -------
+            :class:`ColumnarCalendar`
+        """
+        calendar = cls()
+        if isinstance(data, list):  # a month calendar
+            calendar.extend(data)
+        elif "timings" in data:  # a day
+            calendar.append(data)
+        else:  # a year calendar
+            for month in sorted(data, key=int):
+                calendar.extend(data[month])
+        return calendar
+
+    def append(self, day: dict):
+        """Adds a day of a calendar response."""
+        d, m, y = day["date"]["gregorian"]["date"].split("-")
+        timings = day["timings"]
+        self._add(
+            datetime.datetime(int(y), int(m), int(d)),
+            get_timezone(day["meta"]["timezone"]),
+            [int(t[:2]) * 60 + int(t[3:5]) for t in map(timings.get, NAMES)],
+        )
+
+    def _add(self, date: datetime.datetime, tz, times: Sequence[int]):
+        # times are minutes since midnight, in NAMES order
+        days = date.toordinal() - _EPOCH_ORDINAL
+        base = days * 1440
+
+        self.dates.append(days)
+        local, utc = self.local, self.utc
+        utc_times = _utc_times(date, tz, times, strict=False)
+        for name, minutes, time_utc in zip(NAMES, times, utc_times):
+            local[name].append(base + minutes)
+            utc[name].append(time_utc)
+
+    def extend(self, days: Iterable[dict]):
+        """Adds the days of a calendar response."""
+        for day in days:
+            self.append(day)
+
+    def columns(self, numpy: Optional[bool] = None) -> dict:
+        """Gives the columns, without copying them.
+
+        Parameters
+        ----------
+            numpy: Optional[:class:`bool`]
+                Whether to give NumPy arrays, by default they are given
+                only if NumPy is installed.
+
+        Returns
+        -------
+            :class:`dict`
+                ``"date"``, every time name in local time and every time
+                name suffixed with ``"_utc"``, as :class:`array.array` or
+                :class:`numpy.ndarray` of int32. A NumPy array shares its
+                memory with the calendar, which can't grow while it's
+                alive.
+
+        Raises
+        ------
+            :exc:`ImportError`
+                `numpy` is True but NumPy isn't installed.
+        """
+        columns = {"date": self.dates}
+        columns.update(self.local)
+        columns.update((n + "_utc", a) for n, a in self.utc.items())
+
+        if numpy:
+            np = _require_numpy("NumPy columns")
+        else:
+            np = _import_numpy() if numpy is None else None
+        if np is None:
+            return columns
+        return {
+            name: np.frombuffer(column, dtype=np.int32)
+            for name, column in columns.items()
+        }
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __repr__(self):
+        return "<ColumnarCalendar days={0}>".format(len(self.dates))
+
+
+class CalendarMatrix:
+    """
+    The same calendar for many locations, as a location × day × time
+    matrix of minutes since epoch.
+
+    Every location is backed by a :class:`ColumnarCalendar`, locations
+    that were the same request share theirs.
+
+    Example
+
+    .. code:: py
+
+        matrix = client.get_calendar_matrix(locations, date)
+        matrix[0, 14, "Fajr"]  # Fajr of the 15th day of the 1st location
+        array = matrix.to_numpy()  # shape (locations, days, times)
+
+    Attributes
+    ----------
+        locations: :class:`list`
+            The locations, as they were given.
+
+        names: :class:`tuple` of :class:`str`
+            The times of the last axis.
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = ("locations", "_calendars", "_index")
+
+    names = NAMES
+
+    def __init__(
+        self,
+        locations: list,
+        calendars: List[ColumnarCalendar],
+        index: List[int],
+    ):
+        self.locations = locations
+        self._calendars = calendars
+        self._index = index
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """:class:`tuple`: Number of locations, days and times. Days are
+        the most a calendar has, see :meth:`to_numpy`."""
+        days = max(map(len, self._calendars), default=0)
+        return len(self._index), days, len(NAMES)
+
+    @property
+    def unique(self) -> int:
+        """:class:`int`: Number of distinct calendars."""
+        return len(self._calendars)
+
+    def calendar(self, location: int) -> ColumnarCalendar:
+        """Gives the :class:`ColumnarCalendar` of a location, by index."""
+        return self._calendars[self._index[location]]
+
+    def __getitem__(self, key: Tuple[int, int, str]) -> int:
+        location, day, name = key
+        return self.calendar(location).local[name][day]
+
+    def get(
+        self, location: int, day: int, name: str, utc: bool = False
+    ) -> int:
+        """Gives the minutes since epoch of a time.
+
+        Parameters
+        ----------
+            location: :class:`int`
+                Index of the location.
+
+            day: :class:`int`
+                Index of the day.
+
+            name: :class:`str`
+                Name of the time, e.g. ``"Fajr"``.
+
+            utc: :class:`bool`
+                Whether to give it in UTC instead of local time.
+                Default: False
+        """
+        calendar = self.calendar(location)
+        return (calendar.utc if utc else calendar.local)[name][day]
+
+    def to_numpy(self, utc: bool = False, names: Sequence[str] = NAMES):
+        """Gives the matrix as a NumPy array.
+
+        Parameters
+        ----------
+            utc: :class:`bool`
+                Whether to give times in UTC instead of local time.
+                Default: False
+
+            names: Sequence[:class:`str`]
+                Times to give, in this order.
+                Default: all of them
+
+        Returns
+        -------
+            :class:`numpy.ndarray`
+                An int32 array of shape (locations, days, times). If the
+                calendars don't have the same number of days, e.g. months
+                of 30 and 31 days, it's a :class:`numpy.ma.MaskedArray`
+                where the days a calendar doesn't have are masked.
+
+        Raises
+        ------
+            :exc:`ImportError`
+                NumPy isn't installed.
+        """
+        np = _require_numpy("NumPy matrices")
+        arrays = [
+            np.stack(
+                [
+                    np.frombuffer(columns[name], dtype=np.int32)
+                    for name in names
+                ],
+                axis=1,
+            )
+            for columns in (c.utc if utc else c.local for c in self._calendars)
+        ]
+        shape = (len(arrays), self.shape[1], len(names))
+        if all(len(array) == shape[1] for array in arrays):
+            unique = np.stack(arrays) if arrays else np.empty(shape, np.int32)
+        else:  # padded, the days a calendar doesn't have are masked
+            unique = np.ma.masked_all(shape, dtype=np.int32)
+            for i, array in enumerate(arrays):
+                unique[i, : len(array)] = array
+        return unique[np.asarray(self._index, dtype=np.intp)]
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return "<CalendarMatrix shape={0} unique={1}>".format(
+            self.shape, self.unique
+        )
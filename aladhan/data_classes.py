@@ -1,9 +1,22 @@
-from datetime import datetime
-from functools import partial
-from typing import Dict, Iterable, List, Optional, Union
-
-import pytz
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlencode
+from weakref import ReferenceType
 
+from .cache import LRUCache
 from .enums import LatitudeAdjustmentMethods, MidnightModes, Schools, Shafaq
 from .exceptions import (
     InvalidAdjustment,
@@ -16,6 +29,7 @@ from .exceptions import (
     InvalidTune,
 )
 from .methods import ISNA, Method, all_methods
+from .timezones import get_timezone, is_timezone, utc_offset
 
 __all__ = (
     "Data",
@@ -208,6 +222,86 @@ class Ism:
         return hash(self.name)
 
 
+# the int objects of the minutes of a day, shared by every time instead
+# of each holding its own
+_MINUTES = tuple(range(24 * 60))
+
+
+def _shared(minutes: int) -> int:
+    return _MINUTES[minutes] if 0 <= minutes < 24 * 60 else minutes
+
+
+def _minutes(time: str) -> int:
+    # "05:12 (BST)" -> 312
+    h, _, m = time.split(" ", 1)[0].partition(":")
+    return _shared(int(h) * 60 + int(m))
+
+
+def _check_raw(raw, what: str, keys: Iterable[str]):
+    # the fast validation of raw data, only its shape is checked
+    if not isinstance(raw, dict):
+        raise ValueError(
+            "Expected {} as a dict, got {!r}".format(what, type(raw).__name__)
+        )
+    missing = [key for key in keys if key not in raw]
+    if missing:
+        raise ValueError("Missing {!r} in {}".format(missing, what))
+
+
+def _raw_time(minutes: int) -> str:
+    return "%02d:%02d" % divmod(minutes, 60)
+
+
+def _deref(data):
+    # a back reference is the object itself, or a weak reference to it
+    # when its client has weak_backrefs
+    return data() if type(data) is ReferenceType else data
+
+
+def _backref(obj, client):
+    return ReferenceType(obj) if getattr(client, "weak_backrefs", 0) else obj
+
+
+def _restore_backrefs(obj, data):
+    # an unpickled Meta has no Data, the first one unpickled with it gets
+    # it like when they were made. A Date is only ever of its own Data.
+    if obj.meta.data is None:
+        obj.meta._data = data
+    if obj.date.data is obj:
+        obj.date._data = data
+
+
+_UNSET = object()
+
+# the client given to unpickled objects, see reattach()
+_client: ContextVar = ContextVar("aladhan_client", default=None)
+
+
+@contextmanager
+def reattach(client):
+    """Gives `client` to the :class:`Data` and :class:`NextPrayerData`
+    unpickled within it.
+
+    Pickling leaves the client out, it can't be pickled and another
+    process has its own. Without this, unpickled objects have ``None``
+    as their client.
+
+    Example
+
+    .. code:: py
+
+        with aladhan.data_classes.reattach(client):
+            timings = pickle.loads(payload)
+
+    *New in v1.3.0*
+    """
+    token = _client.set(client)
+    try:
+        yield client
+    finally:
+        _client.reset(token)
+
+
 class Prayer:
     """Represents a Prayer obj.
 
@@ -219,33 +313,76 @@ class Prayer:
             Source data.
         name: :class:`str`
             Prayer name.
+        minutes: :class:`int`
+            Prayer's time as minutes since midnight.
+
+            *New in v1.3.0*
         time: :class:`datetime.datetime`
             Prayer's time.
         time_utc: Optional[:class:`datetime.datetime`]
             Prayer's time in utc, might be None when time doesn't exist
-            because of a daylight savings switch.
+            because of a daylight savings switch. A time that happens
+            twice because of the switch is read as standard time.
         str_time: :class:`str`
             Better looking string format for prayer's time.
 
     *New in v0.1.2: timings, time_utc*
     *Changed in v1.2.0*: timings is removed and replaced with data.
+    *Changed in v1.3.0*: time and time_utc are computed on first access,
+    str_time on every access.
     """
 
-    __slots__ = ("data", "name", "time", "time_utc", "str_time")
+    __slots__ = (
+        "data",
+        "name",
+        "minutes",
+        "_day",
+        "_time",
+        "_time_utc",
+        "__weakref__",
+    )
 
-    def __init__(self, name: str, time: str, data):
-        d = datetime.strptime(data.date.readable, "%d %b %Y")
-        time = time.split()[0]
+    def __init__(
+        self,
+        name: str,
+        time: Union[str, int],
+        data,
+        day: Optional[datetime] = None,
+    ):
         self.data = data
         self.name = name
-        self.time = datetime.strptime(time, "%H:%M").replace(
-            d.year, d.month, d.day
+        self.minutes = time if isinstance(time, int) else _minutes(time)
+        self._day = day
+        self._time: Optional[datetime] = None
+        self._time_utc = _UNSET
+
+    @property
+    def time(self) -> datetime:
+        if self._time is None:
+            day = self._day
+            if day is None:
+                day = datetime.strptime(self.data.date.readable, "%d %b %Y")
+            self._time = day + timedelta(minutes=self.minutes)
+        return self._time
+
+    @property
+    def time_utc(self) -> Optional[datetime]:
+        if self._time_utc is _UNSET:
+            time = self.time
+            offset = utc_offset(self.data.meta.timezone, time)
+            self._time_utc = None if offset is None else time - offset
+        return self._time_utc
+
+    @property
+    def str_time(self) -> str:
+        t = self.time
+        return "%02d:%02d %02d-%02d-%d" % (
+            t.hour,
+            t.minute,
+            t.day,
+            t.month,
+            t.year,
         )
-        try:
-            self.time_utc = self.time - data.meta.timezone.utcoffset(self.time)
-        except pytz.exceptions.NonExistentTimeError:  # pragma: no cover
-            self.time_utc = None
-        self.str_time = self.time.strftime("%H:%M %d-%m-%Y")
 
     @property
     def remaining(self):
@@ -262,12 +399,98 @@ class Prayer:
     def __hash__(self):
         return hash(self.name)
 
+    def __getstate__(self):
+        return self.name, self.minutes, self.data
+
+    def __setstate__(self, state):
+        Prayer.__init__(self, *state)
+
+
+_DATE = re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})\Z")
+
+# Argument objects are interned, equal ones are made once and shared, and
+# arguments they were already made from aren't validated again.
+_interned = LRUCache(1024)
+_validated = LRUCache(1024)
+
+
+class _Argument:
+    # Base of the immutable argument objects. `_values` are what they are
+    # compared and hashed by, their dict and hash are made once when they
+    # are interned and their query string on first use.
+
+    __slots__ = ("_values", "_hash", "_dict", "_query")
+
+    @classmethod
+    def _intern(cls, values: tuple):
+        key = (cls, values)
+        obj = _interned.get(key)
+        if obj is None:
+            obj = object.__new__(cls)
+            obj._set(_values=values, _hash=hash(values), _query=None)
+            obj._init(*values)
+            _interned.put(key, obj)
+        return obj
+
+    @classmethod
+    def _cached(cls, args: tuple, key: Optional[tuple] = None):
+        key = (cls, key or args, tuple(map(type, key or args)))
+        try:
+            obj = _validated.get(key)
+        except TypeError:  # unhashable, it won't be valid anyway
+            return cls._intern(cls._validate(*args))
+        if obj is None:
+            obj = cls._intern(cls._validate(*args))
+            _validated.put(key, obj)
+        return obj
+
+    def _set(self, **attrs):
+        for name, value in attrs.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def as_dict(self) -> dict:
+        return dict(self._dict)  # a copy, it's usually added to
+
+    @property
+    def query(self) -> str:
+        """:class:`str`: The request parameters as a query string.
+
+        *New in v1.3.0*
+        """
+        if self._query is None:
+            self._set(_query=urlencode(self._dict))
+        return self._query
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "{} objects are immutable".format(type(self).__name__)
+        )
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            "{} objects are immutable".format(type(self).__name__)
+        )
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self is other or self._values == other._values
 
-class CalendarDateArg:
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return type(self).from_validated, self._values
+
+
+class CalendarDateArg(_Argument):
     """
     Class to make an obj that will be used as a date param in calendar
         getters
 
+    It's immutable, and equal ones are the same object.
+
     Parameters
     ----------
         year: :class:`int`
@@ -301,43 +524,55 @@ class CalendarDateArg:
     ------
         :exc:`ValueError`
             Month passed is not in 1-12 range.
+
+    *Changed in v1.3.0: immutable, interned and compared by value*
     """
 
     __slots__ = ("year", "month", "hijri", "annual")
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         year: int,
         month: Optional[int] = None,
         hijri: bool = False,
     ):
+        return cls._cached((year, month, hijri))
+
+    @classmethod
+    def from_validated(
+        cls, year: int, month: int, hijri: bool
+    ) -> "CalendarDateArg":
+        """Makes a CalendarDateArg from values known to be valid, as its
+        attributes have them, without validating them again.
+
+        *New in v1.3.0*
+        """
+        return cls._intern((year, month, hijri))
+
+    @staticmethod
+    def _validate(year, month, hijri):
         if month:
             if month not in range(1, 13):
                 raise ValueError(
                     "month argument expected to be in range 1-12"
                     " got {}".format(month)
                 )
-            self.month = month
-            self.annual = "false"
         else:
-            self.month = 0
-            self.annual = "true"
-
-        self.year = year
-        self.hijri = hijri
-
-    @property
-    def as_dict(self):
-        return {"year": self.year, "annual": self.annual, "month": self.month}
+            month = 0
+        return year, month, hijri
 
-    def __hash__(self):
-        return hash((self.year, self.annual, self.month))
+    def _init(self, year, month, hijri):
+        annual = "false" if month else "true"
+        self._set(year=year, month=month, hijri=hijri, annual=annual)
+        self._set(_dict={"year": year, "annual": annual, "month": month})
 
 
-class TimingsDateArg:
+class TimingsDateArg(_Argument):
     """
     Class to make an obj that will be used as a date param in timings getters
 
+    It's immutable, and equal ones are the same object.
+
     Parameters
     ----------
         date: Optional[:class:`int` or :class:`str`
@@ -354,39 +589,59 @@ class TimingsDateArg:
 
     Raises
     ------
-        :exc:`AsserationError`
+        :exc:`ValueError`
             Invalid date string format.
+
+    *Changed in v1.3.0: immutable, interned and compared by value*
     """
 
-    __slots__ = "date"
+    __slots__ = ("date",)
 
-    def __init__(self, date: Optional[Union[str, int, datetime]] = None):
+    def __new__(cls, date: Optional[Union[str, int, datetime]] = None):
         if date is None:
             date = datetime.utcnow()
         elif isinstance(date, int):
             date = datetime.utcfromtimestamp(date)
 
         if isinstance(date, datetime):
-            date = date.strftime("%d-%m-%Y")
+            return cls._intern((date.strftime("%d-%m-%Y"),))
+        return cls._cached((date,))  # it is a str
 
-        else:  # it is a str
+    @classmethod
+    def from_validated(cls, date: str) -> "TimingsDateArg":
+        """Makes a TimingsDateArg from a date string known to be in
+        DD-MM-YYYY format, without validating it again.
+
+        *New in v1.3.0*
+        """
+        return cls._intern((date,))
+
+    @staticmethod
+    def _validate(date):
+        match = _DATE.match(date)
+        if match is not None:
+            day, month, year = map(int, match.groups())
             try:
-                datetime.strptime(date, "%d-%m-%Y")
+                datetime(year, month, day)
             except ValueError:
-                raise ValueError(
-                    "Expected DD-MM-YYYY date format got {!r} ".format(date)
-                )
+                match = None
+        if match is None:
+            raise ValueError(
+                "Expected DD-MM-YYYY date format got {!r} ".format(date)
+            )
+        return (date,)
 
-        self.date: str = date  # noqa
+    def _init(self, date):
+        self._set(date=date, _dict={"date": date})
 
-    def __hash__(self):
-        return hash(self.date)
 
-
-class Parameters:
+class Parameters(_Argument):
     """
     Class to make an obj that will be used as a defaults param in getters.
 
+    It's immutable, and equal ones are the same object, so it can be used
+    as a key of a dict or a cache.
+
     Parameters
     ----------
         method: :class:`methods.Method` or :class:`int`
@@ -491,6 +746,8 @@ class Parameters:
         :exc:`~aladhan.exceptions.InvalidAdjustment`
 
         :exc:`~aladhan.exceptions.InvalidShafaq`
+
+    *Changed in v1.3.0: immutable, interned and compared by value*
     """
 
     __slots__ = (
@@ -505,8 +762,8 @@ class Parameters:
         "shfaq",
     )
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         method: Union[Method, int] = ISNA,
         tune: Optional[Tune] = None,
         school: Union[int, Schools] = Schools.SHAFI,
@@ -519,12 +776,82 @@ class Parameters:
         ] = LatitudeAdjustmentMethods.ANGLE_BASED,
         adjustment: int = 0,
         shafaq: Union[str, Shafaq] = Shafaq.GENERAL,
+    ):
+        args = (
+            method,
+            tune,
+            school,
+            midnightMode,
+            timezonestring,
+            latitudeAdjustmentMethod,
+            adjustment,
+            shafaq,
+        )
+        # methods and tunes can be changed, they are keyed by their value
+        key = (
+            (method.id, method.params_str)
+            if isinstance(method, Method)
+            else method,
+            tune.value if isinstance(tune, Tune) else tune,
+        ) + args[2:]
+        return cls._cached(args, key)
+
+    @classmethod
+    def from_validated(
+        cls,
+        method: int,
+        method_params: Optional[str],
+        tune: str,
+        school: int,
+        midnightMode: int,
+        timezonestring: Optional[str],
+        latitudeAdjustmentMethod: int,
+        adjustment: int,
+        shafaq: str,
+    ) -> "Parameters":
+        """Makes Parameters from values known to be valid, as its
+        attributes have them, without validating them again.
+
+        Example
+
+        .. code:: py
+
+            params = Parameters.from_validated(
+                3, None, "0,0,0,0,0,0,0,0,0", 0, 0, None, 3, 0, "general"
+            )
+
+        *New in v1.3.0*
+        """
+        return cls._intern(
+            (
+                method,
+                method_params,
+                tune,
+                school,
+                midnightMode,
+                timezonestring,
+                latitudeAdjustmentMethod,
+                adjustment,
+                shafaq,
+            )
+        )
+
+    @staticmethod
+    def _validate(
+        method,
+        tune,
+        school,
+        midnightMode,
+        timezonestring,
+        latitudeAdjustmentMethod,
+        adjustment,
+        shafaq,
     ):
         # method
-        self.method_params = None
+        method_params = None
         if isinstance(method, Method):
             if method.id == 99:
-                self.method_params = method.params_str
+                method_params = method.params_str
             method = method.id
         elif method == 99:
             raise InvalidMethod(
@@ -537,7 +864,6 @@ class Parameters:
             raise InvalidMethod(
                 "Expected method in 0-15 range or 99 got {!r}".format(method)
             )
-        self.method: int = method
 
         # tune
         if tune is None:
@@ -555,7 +881,6 @@ class Parameters:
                 "'tune' argument must be `Tune` object."
                 " got `%s` instead." % type(tune).__name__
             )
-        self.tune: str = tune_val
 
         # school
         if isinstance(school, Schools):
@@ -566,7 +891,6 @@ class Parameters:
                     school
                 )
             )
-        self.school = school
 
         # midnight mode
         if isinstance(midnightMode, MidnightModes):
@@ -576,18 +900,15 @@ class Parameters:
                 "midnightMode argument can only be either 0 or 1"
                 " got {!r}".format(midnightMode)
             )
-        self.midnightMode = midnightMode
 
         # timezone string
-        if timezonestring and timezonestring not in pytz.all_timezones_set:
+        if timezonestring and not is_timezone(timezonestring):
             raise InvalidTimezone(
                 "Invalid timezone ({!r}).".format(timezonestring)
                 + " https://www.php.net/manual/en/timezones.php "
                 "for valid timezones."
             )
 
-        self.timezonestring: Optional[str] = timezonestring
-
         # lat adj methods
         if isinstance(latitudeAdjustmentMethod, LatitudeAdjustmentMethods):
             latitudeAdjustmentMethod = latitudeAdjustmentMethod.value
@@ -596,7 +917,6 @@ class Parameters:
                 "latitudeAdjustmentMethod argument can only be either 1, 2"
                 " or 3 got {!r}".format(latitudeAdjustmentMethod)
             )
-        self.latitudeAdjustmentMethod = latitudeAdjustmentMethod
 
         # adj
         if not isinstance(adjustment, int):
@@ -604,7 +924,7 @@ class Parameters:
                 "Expected adjustment argument to be `int` got"
                 " `{}`".format(type(adjustment).__name__)
             )
-        self.adjustment = adjustment
+
         # shafaq
         if isinstance(shafaq, Shafaq):
             shafaq = shafaq.value
@@ -613,28 +933,81 @@ class Parameters:
                 "Expected Shfaq argument to be in `aladhan.Shafaq` enums"
                 "got `{!r}`".format(shafaq)
             )
-        self.shfaq = shafaq
 
-    @property
-    def as_dict(self):
+        return (
+            method,
+            method_params,
+            tune_val,
+            school,
+            midnightMode,
+            timezonestring,
+            latitudeAdjustmentMethod,
+            adjustment,
+            shafaq,
+        )
+
+    def _init(
+        self,
+        method,
+        method_params,
+        tune,
+        school,
+        midnightMode,
+        timezonestring,
+        latitudeAdjustmentMethod,
+        adjustment,
+        shafaq,
+    ):
+        self._set(
+            method=method,
+            method_params=method_params,
+            tune=tune,
+            school=school,
+            midnightMode=midnightMode,
+            timezonestring=timezonestring,
+            latitudeAdjustmentMethod=latitudeAdjustmentMethod,
+            adjustment=adjustment,
+            shfaq=shafaq,
+        )
         dct = {
-            "method": self.method,
-            "tune": self.tune,
-            "school": self.school,
-            "midnightMode": self.midnightMode,
-            "latitudeAdjustmentMethod": self.latitudeAdjustmentMethod,
-            "adjustment": self.adjustment,
+            "method": method,
+            "tune": tune,
+            "school": school,
+            "midnightMode": midnightMode,
+            "latitudeAdjustmentMethod": latitudeAdjustmentMethod,
+            "adjustment": adjustment,
         }
-        if self.method == 99:
-            dct["methodSettings"] = self.method_params
-        if self.timezonestring:
-            dct["timezonestring"] = self.timezonestring
-        if self.method == 15:
-            dct["shafaq"] = self.shfaq
-        return dct
-
-    def __hash__(self):
-        return hash(tuple(self.as_dict.values()))
+        if method == 99:
+            dct["methodSettings"] = method_params
+        if timezonestring:
+            dct["timezonestring"] = timezonestring
+        if method == 15:
+            dct["shafaq"] = shafaq
+        self._set(_dict=dct)
+
+
+_META = (
+    "longitude",
+    "latitude",
+    "timezone",
+    "method",
+    "latitudeAdjustmentMethod",
+    "midnightMode",
+    "school",
+    "offset",
+)
+# Tune order
+_TUNED = (
+    "Imsak",
+    "Fajr",
+    "Sunrise",
+    "Dhuhr",
+    "Asr",
+    "Maghrib",
+    "Sunset",
+    "Isha",
+    "Midnight",
+)
 
 
 class Meta:
@@ -642,10 +1015,15 @@ class Meta:
 
     Do not create this class yourself. Only get it through a getter.
 
+    The days of a calendar share one Meta when their meta is the same.
+
     Attributes
     ----------
-        data: :class:`Data` or :class:`NextPrayerData`
-            Original fetched Data.
+        data: Optional[:class:`Data` or :class:`NextPrayerData`]
+            Original fetched Data, the first day of a calendar for a
+            shared Meta, or the first day unpickled with it. With a client
+            that has ``weak_backrefs``, it's ``None`` once that Data is
+            freed.
 
         longitude: :class:`float`
             Longitude coordinate.
@@ -653,8 +1031,9 @@ class Meta:
         latitude: :class:`float`
             Latitude coordinate.
 
-        timezone:  :class:`pytz.UTC`
-            Used timezone to calculate.
+        timezone:  :class:`datetime.tzinfo`
+            Used timezone to calculate. A :class:`zoneinfo.ZoneInfo` or a
+            pytz timezone, see :func:`aladhan.timezones.get_backend`.
 
         method: Optional[:class:`Method`]
             Calculation Method. ``None`` if it was a custom method.
@@ -670,7 +1049,7 @@ class Meta:
     """
 
     __slots__ = (
-        "data",
+        "_data",
         "longitude",
         "latitude",
         "timezone",
@@ -693,16 +1072,20 @@ class Meta:
         school: str,
         offset: dict,
     ):
-        self.data = data
+        self._data = data
         self.longitude = longitude
         self.latitude = latitude
-        self.timezone = pytz.timezone(timezone)
+        self.timezone = get_timezone(timezone)
         self.method = all_methods.get(method.get("id"))
         self.latitudeAdjustmentMethod = latitudeAdjustmentMethod
         self.midnightMode = midnightMode
         self.school = school
         self.offset = Tune(**offset)
 
+    @property
+    def data(self):
+        return _deref(self._data)
+
     @property
     def parameters(self):
         """:class:`Parameters`: returns a Parameters obj
@@ -716,7 +1099,7 @@ class Meta:
             self.offset,
             getattr(Schools, self.school.upper()),
             getattr(MidnightModes, self.midnightMode.upper()),
-            self.timezone.zone,
+            str(self.timezone),
             getattr(
                 LatitudeAdjustmentMethods,
                 self.latitudeAdjustmentMethod.upper(),
@@ -732,6 +1115,61 @@ class Meta:
             "school={0.school!r}, offset={0.offset!r}>"
         ).format(self)
 
+    def to_raw(self) -> dict:
+        """Gives the meta back as the API returns it.
+
+        Only the id, name and parameters of the method are kept, and
+        nothing of a custom method.
+
+        *New in v1.3.0*
+        """
+        method = self.method
+        if method is not None:
+            method = {
+                "id": method.id,
+                "name": method.name,
+                "params": method.params,
+            }
+        return {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "timezone": str(self.timezone),
+            "method": method or {},
+            "latitudeAdjustmentMethod": self.latitudeAdjustmentMethod,
+            "midnightMode": self.midnightMode,
+            "school": self.school,
+            "offset": dict(zip(_TUNED, self.offset)),
+        }
+
+    def __getstate__(self):
+        # the Data it's from is left out, a shared Meta would bring the
+        # first day of its calendar with any day. The Data sets it back.
+        return (
+            self.longitude,
+            self.latitude,
+            str(self.timezone),
+            self.method and self.method.id,
+            self.latitudeAdjustmentMethod,
+            self.midnightMode,
+            self.school,
+            self.offset,
+        )
+
+    def __setstate__(self, state):
+        self._data = None
+        (
+            self.longitude,
+            self.latitude,
+            timezone,
+            method,
+            self.latitudeAdjustmentMethod,
+            self.midnightMode,
+            self.school,
+            self.offset,
+        ) = state
+        self.timezone = get_timezone(timezone)
+        self.method = all_methods.get(method)
+
     def __hash__(self):
         return hash(
             (
@@ -748,11 +1186,36 @@ class Meta:
         )
 
 
+class _MetaTable:
+    # Interns the Meta of the days of a calendar by their content, so the
+    # days share one instead of each making its own. A calendar has very
+    # few distinct metas, often the same dict object, so a list is enough.
+
+    __slots__ = ("_metas",)
+
+    def __init__(self):
+        self._metas: List[tuple] = []
+
+    def get(self, meta: dict, data) -> Meta:
+        for raw, obj in self._metas:
+            if raw is meta or raw == meta:
+                return obj
+        obj = Meta(**meta, data=data)
+        self._metas.append((meta, obj))
+        return obj
+
+
 class DateType:
     """A class for gregorian/hijri date.
 
     Do not create this class yourself. Only get it through a getter.
 
+    The same date is one DateType shared by every :class:`Date` that has
+    it, for any location, so it's read-only: its dicts are read-only
+    mappings and its lists are tuples, :meth:`to_raw` gives plain copies.
+
+    *Changed in v1.3.0: read-only*
+
     Attributes
     ----------
         name: :class:`str`
@@ -767,21 +1230,21 @@ class DateType:
         day: :class:`int`
             Date's day.
 
-        weekday: dict[:class:`str`, :class:`str`]
+        weekday: Mapping[:class:`str`, :class:`str`]
             A dict with 2 keys, "en" and "ar" for hijri
             and only 1 key "en" for gregorian.
 
-        month: dict[:class:`str`, :class:`int` or :class:`str`]
+        month: Mapping[:class:`str`, :class:`int` or :class:`str`]
             A dict with 3 keys "number", "en", "ar" for hijri
             and 2 keys "number", "en" for gregorian.
 
         year: :class:`int`
             Date's year.
 
-        designation: dict[:class:`str`, :class:`str`]
+        designation: Mapping[:class:`str`, :class:`str`]
             A dict with 2 keys, "abbreviated" and "expanded".
 
-        holidays: Optional[:class:`list` of :class:`str`]
+        holidays: Optional[:class:`tuple` of :class:`str`]
             A list of holidays might be empty for hijri,
             always None for gregorian.
 
@@ -790,8 +1253,8 @@ class DateType:
 
             *New in v1.2.2*
 
-        lunarSighting: Optional[:class:`bool`]
-            A boolean for hijri and None for gregorian.
+        adjustedHolidays: Optional[:class:`tuple`]
+            The adjusted holidays for hijri and None for gregorian.
 
             *New in v1.2.2*
 
@@ -822,27 +1285,37 @@ class DateType:
         date: str,
         format: str,  # noqa
         day: str,
-        weekday: Dict[str, str],
-        month: Dict[str, Union[int, str]],
+        weekday: Mapping[str, str],
+        month: Mapping[str, Union[int, str]],
         year: str,
-        designation: Dict[str, str],
-        holidays: Optional[List[str]] = None,
+        designation: Mapping[str, str],
+        holidays: Optional[Sequence[str]] = None,
         lunarSighting: Optional[bool] = None,
-        adjustedHolidays: Optional[list] = None,
+        adjustedHolidays: Optional[Sequence] = None,
         method: Optional[str] = None,
     ):
-        self.name = name
-        self.date = date
-        self.format = format
-        self.day = int(day)
-        self.weekday = weekday
-        self.month = month
-        self.year = int(year)
-        self.designation = designation
-        self.holidays = holidays
-        self.lunarSighting = lunarSighting
-        self.adjustedHolidays = adjustedHolidays
-        self.method = method
+        values = (
+            name,
+            date,
+            format,
+            int(day),
+            weekday,
+            month,
+            int(year),
+            designation,
+            holidays,
+            lunarSighting,
+            adjustedHolidays,
+            method,
+        )
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, _freeze(value))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DateType objects are read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("DateType objects are read-only")
 
     def __repr__(self):
         return "<DateType name={0.name!r}, date={0.date!r}>".format(self)
@@ -850,6 +1323,107 @@ class DateType:
     def __hash__(self):
         return hash((self.name, self.date))
 
+    def to_raw(self) -> dict:
+        """Gives the date back as the API returns it.
+
+        *New in v1.3.0*
+        """
+        raw = {
+            "date": self.date,
+            "format": self.format,
+            "day": "%02d" % self.day,
+            "weekday": _thaw(self.weekday),
+            "month": _thaw(self.month),
+            "year": str(self.year),
+            "designation": _thaw(self.designation),
+        }
+        for key in _DATE_TYPE_OPTIONAL:
+            value = getattr(self, key)
+            if value is not None:
+                raw[key] = _thaw(value)
+        return raw
+
+    def __reduce__(self):
+        return DateType, tuple(_thaw(getattr(self, s)) for s in self.__slots__)
+
+
+def _freeze(value):
+    # a read-only copy of a JSON value, already read-only ones are kept
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(map(_freeze, value))
+    return value
+
+
+def _thaw(value):
+    # back to a plain JSON value
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return list(map(_thaw, value))
+    return value
+
+
+def _matches(frozen, value) -> bool:
+    # whether a JSON value is the same as a frozen one, without copying it
+    if isinstance(frozen, MappingProxyType):
+        return (
+            isinstance(value, (dict, MappingProxyType))
+            and len(value) == len(frozen)
+            and all(
+                k in value and _matches(v, value[k]) for k, v in frozen.items()
+            )
+        )
+    if isinstance(frozen, tuple):
+        return (
+            isinstance(value, (list, tuple))
+            and len(value) == len(frozen)
+            and all(map(_matches, frozen, value))
+        )
+    return type(frozen) is type(value) and frozen == value
+
+
+_DATE_TYPE = (
+    "date",
+    "format",
+    "day",
+    "weekday",
+    "month",
+    "year",
+    "designation",
+)
+_DATE_TYPE_OPTIONAL = (
+    "holidays",
+    "lunarSighting",
+    "adjustedHolidays",
+    "method",
+)
+
+
+def _check_date(raw):
+    _check_raw(raw, "the date", ("gregorian", "hijri"))
+    _check_raw(raw["gregorian"], "the gregorian date", _DATE_TYPE)
+    _check_raw(raw["hijri"], "the hijri date", _DATE_TYPE)
+
+
+# DateTypes are the same for every location on a day, they are shared
+# across responses. Keyed by what sets a date apart, a frozen copy of the
+# raw dict is kept to check the rest of it is the same too, the caller's
+# own dict could be changed afterwards.
+_date_types = LRUCache(4096)
+
+
+def _date_type(name: str, raw: dict) -> DateType:
+    key = (name, raw.get("date"), raw.get("method"))
+    entry = _date_types.get(key)
+    if entry is not None and _matches(entry[0], raw):
+        return entry[1]
+    frozen = _freeze(raw)
+    obj = DateType(name, **frozen)
+    _date_types.put(key, (frozen, obj))
+    return obj
+
 
 class BaseDate:
     """
@@ -889,7 +1463,9 @@ class Date(BaseDate):
     Attributes
     ----------
         data: Optional[:class:`Data`]
-            Original fetched Data. None if it wasn't from a timings getter.
+            Original fetched Data. None if it wasn't from a timings getter,
+            or once the Data is freed with a client that has
+            ``weak_backrefs``.
 
             *Changed in v1.1.0: changed to Optional*
 
@@ -910,7 +1486,7 @@ class Date(BaseDate):
             Hijri date.
     """
 
-    __slots__ = ("data", "gregorian", "hijri")
+    __slots__ = ("_data", "gregorian", "hijri")
 
     def __init__(
         self,
@@ -920,17 +1496,106 @@ class Date(BaseDate):
         readable: Optional[str] = None,
         timestamp: Optional[str] = None,
     ):
-        self.data = data
-        self.gregorian = DateType("Gregorian", **gregorian)
-        self.hijri = DateType("Hijri", **hijri)
+        self._data = data
+        self.gregorian = _date_type("Gregorian", gregorian)
+        self.hijri = _date_type("Hijri", hijri)
         super().__init__(readable, timestamp)
 
+    @property
+    def data(self) -> Optional["Data"]:
+        return _deref(self._data)
+
+    @classmethod
+    def from_raw(cls, raw: dict, data: Optional["Data"] = None) -> "Date":
+        """Makes a Date from the date of a timings response, as it was
+        returned from the API or given back by :meth:`to_raw`.
+
+        Parameters
+        ----------
+            raw: :class:`dict`
+                The date.
+
+            data: Optional[:class:`Data`]
+                The Data it's the date of.
+                Default: None
+
+        Returns
+        -------
+            :class:`Date`
+
+        Raises
+        ------
+            :exc:`ValueError`
+                The date is missing something.
+
+        *New in v1.3.0*
+        """
+        _check_date(raw)
+        return cls(
+            raw["gregorian"],
+            raw["hijri"],
+            data,
+            raw.get("readable"),
+            raw.get("timestamp"),
+        )
+
+    def to_raw(self) -> dict:
+        """Gives the date back as the API returns it.
+
+        *New in v1.3.0*
+        """
+        raw = {}
+        if self.readable is not None:
+            raw["readable"] = self.readable
+        if self.timestamp is not None:
+            raw["timestamp"] = str(self.timestamp)
+        raw["gregorian"] = self.gregorian.to_raw()
+        raw["hijri"] = self.hijri.to_raw()
+        return raw
+
     def __repr__(self):
         return "<gregorian={0.gregorian!r}, hijri={0.hijri!r}>".format(self)
 
     def __hash__(self):
         return hash(self.timestamp)
 
+    def __getstate__(self):
+        return (
+            self.data,
+            self.gregorian,
+            self.hijri,
+            self.readable,
+            self.timestamp,
+        )
+
+    def __setstate__(self, state):
+        (
+            self._data,
+            self.gregorian,
+            self.hijri,
+            self.readable,
+            self.timestamp,
+        ) = state
+
+
+_TIMINGS = (
+    "Imsak",
+    "Fajr",
+    "Sunrise",
+    "Dhuhr",
+    "Asr",
+    "Sunset",
+    "Maghrib",
+    "Isha",
+    "Midnight",
+    "Firstthird",
+    "Lastthird",
+)
+
+
+def _parse_timings(timings: Dict[str, str]) -> Tuple[int, ...]:
+    return tuple(_minutes(timings[name]) for name in _TIMINGS)
+
 
 class Timings:
     """Represents the timings that is in returned :class:`Data`
@@ -976,23 +1641,17 @@ class Timings:
 
             *New in v1.2.0*
 
+        minutes: :class:`tuple` of :class:`int`
+            All the times above from imsak to last_third as minutes since
+            midnight, without making any :class:`Prayer`.
+
+            *New in v1.3.0*
+
     *New in v0.1.4: __iter__*
+    *Changed in v1.3.0*: prayers are made on first access.
     """
 
-    __slots__ = (
-        "data",
-        "imsak",
-        "fajr",
-        "sunrise",
-        "dhuhr",
-        "asr",
-        "maghrib",
-        "sunset",
-        "isha",
-        "midnight",
-        "first_third",
-        "last_third",
-    )
+    __slots__ = ("data", "minutes", "_prayers", "_day", "__weakref__")
 
     def __init__(
         self,
@@ -1010,18 +1669,80 @@ class Timings:
         Lastthird: str,
     ):
         self.data = data
-        _Prayer = partial(Prayer, data=data)
-        self.imsak: Prayer = _Prayer("Imsak", Imsak)
-        self.fajr: Prayer = _Prayer("Fajr", Fajr)
-        self.sunrise: Prayer = _Prayer("Sunrise", Sunrise)
-        self.dhuhr: Prayer = _Prayer("Dhuhr", Dhuhr)
-        self.asr: Prayer = _Prayer("Asr", Asr)
-        self.sunset: Prayer = _Prayer("Sunset", Sunset)
-        self.maghrib: Prayer = _Prayer("Maghrib", Maghrib)
-        self.isha: Prayer = _Prayer("Isha", Isha)
-        self.midnight: Prayer = _Prayer("Midnight", Midnight)
-        self.first_third: Prayer = _Prayer("Firstthird", Firstthird)
-        self.last_third: Prayer = _Prayer("Lastthird", Lastthird)
+        # in _TIMINGS order
+        self.minutes = tuple(
+            map(
+                _minutes,
+                (
+                    Imsak,
+                    Fajr,
+                    Sunrise,
+                    Dhuhr,
+                    Asr,
+                    Sunset,
+                    Maghrib,
+                    Isha,
+                    Midnight,
+                    Firstthird,
+                    Lastthird,
+                ),
+            )
+        )
+        self._prayers: Optional[List[Optional[Prayer]]] = None
+        self._day: Optional[datetime] = None
+
+    def _prayer(self, i: int) -> Prayer:
+        prayers = self._prayers
+        if prayers is None:  # made with the first prayer
+            prayers = self._prayers = [None] * len(_TIMINGS)
+        prayer = prayers[i]
+        if prayer is None:
+            day = self._day
+            if day is None:  # parsed once for the whole day
+                d, m, y = self.data.date.gregorian.date.split("-")
+                day = self._day = datetime(int(y), int(m), int(d))
+            prayer = Prayer(_TIMINGS[i], self.minutes[i], self.data, day)
+            prayers[i] = prayer
+        return prayer
+
+    imsak = property(lambda self: self._prayer(0))
+    fajr = property(lambda self: self._prayer(1))
+    sunrise = property(lambda self: self._prayer(2))
+    dhuhr = property(lambda self: self._prayer(3))
+    asr = property(lambda self: self._prayer(4))
+    sunset = property(lambda self: self._prayer(5))
+    maghrib = property(lambda self: self._prayer(6))
+    isha = property(lambda self: self._prayer(7))
+    midnight = property(lambda self: self._prayer(8))
+    first_third = property(lambda self: self._prayer(9))
+    last_third = property(lambda self: self._prayer(10))
+
+    def prayer(self, name: str) -> Prayer:
+        """Gives one of the times by its name.
+
+        Parameters
+        ----------
+            name: :class:`str`
+                A name as the API gives it, from ``"Imsak"`` to
+                ``"Lastthird"``.
+
+        Returns
+        -------
+            :class:`Prayer`
+                The same object as the matching attribute.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                Unknown time name.
+
+        *New in v1.3.0*
+        """
+        try:
+            i = _TIMINGS.index(name)
+        except ValueError:
+            raise ValueError("Unknown time name {}".format(name)) from None
+        return self._prayer(i)
 
     @property
     def as_dict(self) -> Dict[str, Prayer]:
@@ -1060,6 +1781,8 @@ class Timings:
         Get the next upcoming prayer.
         Returns ``None`` if the upcoming wasn't in the date,
         so this will return ``None`` if it was from an old date.
+        :class:`aladhan.events.PrayerIndex` goes on to the next days of a
+        calendar.
 
         Returns
         -------
@@ -1092,6 +1815,39 @@ class Timings:
     def __hash__(self):
         return hash(tuple(self.as_dict.values()))
 
+    def to_raw(self) -> Dict[str, str]:
+        """Gives the timings back as the API returns them, in ``HH:MM``
+        format without the timezone abbreviation.
+
+        *New in v1.3.0*
+        """
+        return dict(zip(_TIMINGS, map(_raw_time, self.minutes)))
+
+    @classmethod
+    def _from_minutes(cls, data: "Data", minutes: Tuple[int, ...]):
+        timings = cls.__new__(cls)
+        timings.__setstate__((data, minutes))
+        return timings
+
+    def __getstate__(self):
+        return self.data, self.minutes
+
+    def __setstate__(self, state):
+        self.data, self.minutes = state
+        self._prayers = None
+        self._day = None
+
+
+def _check_day(raw, timings: Iterable[str]):
+    _check_raw(raw, "the data", ("timings", "date", "meta"))
+    _check_raw(raw["timings"], "the timings", timings)
+    _check_date(raw["date"])
+    _check_raw(raw["meta"], "the meta", _META)
+    if not is_timezone(raw["meta"]["timezone"]):
+        raise ValueError(
+            "Unknown timezone {!r}".format(raw["meta"]["timezone"])
+        )
+
 
 class Data:
     """
@@ -1110,17 +1866,166 @@ class Data:
         timings: :class:`Timings`
             Represents the timings part.
 
+            With a client that has ``weak_backrefs``, the Data only keeps
+            a weak reference to it, and makes it again from its times if
+            it was freed.
+
         client: :class:`Client`
             Represents the client that the Data were fetched from.
+            ``None`` once unpickled, unless it's done within
+            :func:`~aladhan.data_classes.reattach`.
+
+    *Changed in v1.3.0: can be pickled, without its client*
     """
 
-    __slots__ = ("meta", "date", "timings", "client")
+    __slots__ = (
+        "meta",
+        "date",
+        "_timings",
+        "_minutes",
+        "client",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        timings: dict,
+        date: dict,
+        meta: dict,
+        client,
+        metas: Optional[_MetaTable] = None,
+    ):
+        self._init(_parse_timings(timings), date, meta, client, metas)
 
-    def __init__(self, timings: dict, date: dict, meta: dict, client):
-        self.meta = Meta(**meta, data=self)
-        self.date = Date(**date, data=self)
-        self.timings = Timings(**timings, data=self)
+    def _init(
+        self,
+        minutes: Tuple[int, ...],
+        date: dict,
+        meta: dict,
+        client,
+        metas: Optional[_MetaTable],
+    ):
+        data = _backref(self, client)
+        if metas is None:
+            self.meta = Meta(**meta, data=data)
+        else:
+            self.meta = metas.get(meta, data)
+        self.date = Date(**date, data=data)
         self.client = client
+        if data is self:
+            self._timings = Timings._from_minutes(self, minutes)
+            self._minutes = None
+        else:  # made on first access
+            self._timings = None
+            self._minutes = minutes
+
+    @property
+    def timings(self) -> "Timings":
+        timings = self._timings
+        if self._minutes is None:  # kept as is
+            return timings
+        timings = timings and timings()
+        if timings is None:  # not made yet or freed
+            timings = Timings._from_minutes(self, self._minutes)
+            self._timings = ReferenceType(timings)
+        return timings
+
+    @classmethod
+    def from_raw(cls, raw: dict, client=None) -> "Data":
+        """Makes a Data from a timings response or a day of a calendar
+        response, as it was returned from the API or given back by
+        :meth:`to_raw`, without any request.
+
+        Only the shape of `raw` and its timezone are checked, which is
+        cheap enough to rebuild many days. See
+        :func:`aladhan.calendars.from_raw` for whole calendars.
+
+        Parameters
+        ----------
+            raw: :class:`dict`
+                The data, with ``timings``, ``date`` and ``meta``.
+
+            client: Optional[:class:`Client`]
+                The client given to the Data.
+                Default: None
+
+        Returns
+        -------
+            :class:`Data`
+
+        Raises
+        ------
+            :exc:`ValueError`
+                The data is missing something, or has an invalid time or
+                an unknown timezone.
+
+        *New in v1.3.0*
+        """
+        _check_day(raw, _TIMINGS)
+        return cls(raw["timings"], raw["date"], raw["meta"], client)
+
+    @classmethod
+    def from_minutes(
+        cls,
+        minutes: Sequence[int],
+        date: dict,
+        meta: dict,
+        client=None,
+    ) -> "Data":
+        """Makes a Data from times that are already minutes since
+        midnight, without parsing or checking anything.
+
+        Parameters
+        ----------
+            minutes: Sequence[:class:`int`]
+                The times, in :attr:`Timings.minutes` order.
+
+            date: :class:`dict`
+                The date as the API returns it.
+
+            meta: :class:`dict`
+                The meta as the API returns it.
+
+            client: Optional[:class:`Client`]
+                The client given to the Data.
+                Default: None
+
+        Returns
+        -------
+            :class:`Data`
+
+        *New in v1.3.0*
+        """
+        return cls._from_minutes(minutes, date, meta, client, None)
+
+    @classmethod
+    def _from_minutes(
+        cls,
+        minutes: Sequence[int],
+        date: dict,
+        meta: dict,
+        client,
+        metas: Optional[_MetaTable],
+    ) -> "Data":
+        # from_minutes, sharing the Meta of days with the same meta
+        data = cls.__new__(cls)
+        data._init(tuple(map(_shared, minutes)), date, meta, client, metas)
+        return data
+
+    def to_raw(self) -> dict:
+        """Gives the data back as the API returns it, a dict that
+        :meth:`from_raw` makes the same Data from.
+
+        See :meth:`Timings.to_raw`, :meth:`Date.to_raw` and
+        :meth:`Meta.to_raw` for what isn't kept.
+
+        *New in v1.3.0*
+        """
+        return {
+            "timings": self.timings.to_raw(),
+            "date": self.date.to_raw(),
+            "meta": self.meta.to_raw(),
+        }
 
     def __repr__(self):
         return "<Data object | {0.gregorian.date}>".format(self.date)
@@ -1128,6 +2033,22 @@ class Data:
     def __hash__(self):
         return hash((self.meta, self.date))
 
+    def __getstate__(self):
+        return self.meta, self.date, self.timings, self._minutes is not None
+
+    def __setstate__(self, state):
+        self.meta, self.date, timings, weak = state
+        self.client = _client.get()
+        if weak:  # made again on access if it's freed, as before pickling
+            data = ReferenceType(self)
+            self._timings = ReferenceType(timings)
+            self._minutes = timings.minutes
+        else:
+            data = self
+            self._timings = timings
+            self._minutes = None
+        _restore_backrefs(self, data)
+
 
 class NextPrayerData:
     """
@@ -1146,21 +2067,110 @@ class NextPrayerData:
         prayer: :class:`Prayer`
             Represents the Prayer part.
 
+            With a client that has ``weak_backrefs``, it's kept like
+            :attr:`Data.timings` is.
+
         client: :class:`Client`
             Represents the client that the Data were fetched from.
+            ``None`` once unpickled, unless it's done within
+            :func:`~aladhan.data_classes.reattach`.
 
     *New in v1.2.0*
+    *Changed in v1.3.0: can be pickled, without its client*
     """
 
+    __slots__ = ("meta", "date", "_prayer", "_next", "client", "__weakref__")
+
     def __init__(self, meta, date, timings, client):
         ((prayer, time),) = timings.items()
-        self.meta = Meta(data=self, **meta)
+        data = _backref(self, client)
+        self.meta = Meta(data=data, **meta)
         self.date = Date(**date)
-        self.prayer = Prayer(prayer, time, data=self)
         self.client = client
+        if data is self:
+            self._prayer = Prayer(prayer, time, data=self)
+            self._next = None
+        else:  # made on first access
+            self._prayer = None
+            self._next = (prayer, _minutes(time))
+
+    @property
+    def prayer(self) -> Prayer:
+        prayer = self._prayer
+        if self._next is None:  # kept as is
+            return prayer
+        prayer = prayer and prayer()
+        if prayer is None:  # not made yet or freed
+            prayer = Prayer(*self._next, data=self)
+            self._prayer = ReferenceType(prayer)
+        return prayer
+
+    @classmethod
+    def from_raw(cls, raw: dict, client=None) -> "NextPrayerData":
+        """Makes a NextPrayerData from a next prayer response, as it was
+        returned from the API or given back by :meth:`to_raw`.
+
+        Parameters
+        ----------
+            raw: :class:`dict`
+                The data, with ``timings`` of a single prayer, ``date``
+                and ``meta``.
+
+            client: Optional[:class:`Client`]
+                The client given to the NextPrayerData.
+                Default: None
+
+        Returns
+        -------
+            :class:`NextPrayerData`
+
+        Raises
+        ------
+            :exc:`ValueError`
+                The data is missing something, or has an invalid time or
+                an unknown timezone.
+
+        *New in v1.3.0*
+        """
+        _check_day(raw, ())
+        if len(raw["timings"]) != 1:
+            raise ValueError(
+                "Expected the timings of a single prayer, got {!r}".format(
+                    raw["timings"]
+                )
+            )
+        return cls(raw["meta"], raw["date"], raw["timings"], client)
+
+    def to_raw(self) -> dict:
+        """Gives the data back as the API returns it.
+
+        *New in v1.3.0*
+        """
+        prayer = self.prayer
+        return {
+            "timings": {prayer.name: _raw_time(prayer.minutes)},
+            "date": self.date.to_raw(),
+            "meta": self.meta.to_raw(),
+        }
 
     def __repr__(self):
         return f"<NextPrayerData | {self.prayer.name} {self.date.readable}>"
 
     def __hash__(self):
         return hash((self.meta, self.date))
+
+    def __getstate__(self):
+        return self.meta, self.date, self.prayer, self._next is not None
+
+    def __setstate__(self, state):
+        self.meta, self.date, prayer, weak = state
+        self.client = _client.get()
+        if weak:  # made again on access if it's freed, as before pickling
+            data = ReferenceType(self)
+            self._prayer = ReferenceType(prayer)
+            self._next = (prayer.name, prayer.minutes)
+        else:
+            data = self
+            self._prayer = prayer
+            self._next = None
+        _restore_backrefs(self, data)
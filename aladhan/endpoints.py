@@ -19,6 +19,17 @@ HIJRI_CALENDAR = BASE + "hijriCalendar"
 HIJRI_CALENDAR_BY_ADDRESS = HIJRI_CALENDAR + "ByAddress"
 HIJRI_CALENDAR_BY_CITY = HIJRI_CALENDAR + "ByCity"
 
+# Endpoints that geocode an address or a city
+GEOCODED = (
+    NEXT_PRAYER_BY_ADDRESS,
+    TIMINGS_BY_ADDRESS,
+    TIMINGS_BY_CITY,
+    CALENDAR_BY_ADDRESS,
+    CALENDAR_BY_CITY,
+    HIJRI_CALENDAR_BY_ADDRESS,
+    HIJRI_CALENDAR_BY_CITY,
+)
+
 # Info
 STATUS = "https://api.aladhan.com/status"
 METHODS = BASE + "methods"  # won't be covered (use aladhan.methods instead)
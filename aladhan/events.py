@@ -0,0 +1,235 @@
+import datetime
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .columnar import _EPOCH, _utc_times
+from .data_classes import _TIMINGS, Prayer, Timings
+
+__all__ = ("PrayerIndex", "PRAYERS")
+
+#: Names of the 5 prayers, the times an index has by default.
+PRAYERS = ("Fajr", "Dhuhr", "Asr", "Maghrib", "Isha")
+
+_ISHA = _TIMINGS.index("Isha")
+# the times of the night, on the next day when they are after 00:00
+_NIGHT = frozenset(
+    map(_TIMINGS.index, ("Midnight", "Firstthird", "Lastthird"))
+)
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+def _days(calendars) -> Iterator[Timings]:
+    for calendar in calendars:
+        if isinstance(calendar, Timings):
+            yield calendar
+        elif isinstance(calendar, dict):  # a year calendar
+            for month in sorted(calendar, key=int):
+                yield from calendar[month]
+        else:  # a month calendar
+            yield from calendar
+
+
+def _utc(now: Optional[datetime.datetime]) -> datetime.datetime:
+    if now is None:
+        return datetime.datetime.utcnow()
+    if now.tzinfo is not None:
+        return now.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return now
+
+
+def _key(now: datetime.datetime) -> float:
+    # minutes since epoch, what the index is searched with
+    return (now - _EPOCH).total_seconds() / 60
+
+
+class PrayerIndex:
+    """
+    The times of many days of a location sorted in one index, to find the
+    next prayer, the current one and the time remaining in O(log n).
+
+    Times are kept as minutes since epoch in UTC, so a lookup is a binary
+    search that goes on to the next day after isha without any request,
+    as long as that day is in the index. :class:`~aladhan.Prayer` objects
+    are only made for the times that are given back.
+
+    Example
+
+    .. code:: py
+
+        calendar = client.get_calendar_by_address(
+            "London", CalendarDateArg(2021)
+        )
+        index = PrayerIndex(calendar)
+        prayer = index.next_prayer()  # tomorrow's fajr after isha
+        current, upcoming = index.window()
+        print(index.remaining())
+
+    Parameters
+    ----------
+        *calendars: :class:`~aladhan.Timings`, :class:`list` of
+            :class:`~aladhan.Timings` or :class:`dict`
+            Days, month calendars (lists or
+            :class:`~aladhan.calendars.LazyCalendar`) or annual
+            calendars, they don't have to be in order.
+
+        names: Sequence[:class:`str`]
+            The times to index, from :attr:`~aladhan.Timings.minutes` names.
+            Default: :data:`PRAYERS`
+
+    Raises
+    ------
+        :exc:`ValueError`
+            Unknown time name.
+
+    A time that doesn't exist because of a DST switch is left out, like
+    its :attr:`~aladhan.Prayer.time_utc` is ``None``. Midnight and the
+    thirds of the night that are after 00:00, earlier than isha, are
+    indexed on the next day, which their :class:`~aladhan.Prayer` still
+    has the date of.
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = ("names", "_days", "_times", "_events")
+
+    def __init__(
+        self,
+        *calendars: Union[Timings, Sequence[Timings], dict],
+        names: Sequence[str] = PRAYERS,
+    ):
+        unknown = set(names).difference(_TIMINGS)
+        if unknown:
+            raise ValueError(
+                "Unknown time names {}".format(", ".join(sorted(unknown)))
+            )
+        self.names = tuple(names)
+        indexes = [_TIMINGS.index(name) for name in self.names]
+        self._days: List[Timings] = []
+        events: List[Tuple[int, int]] = []
+        for timings in _days(calendars):
+            code = len(self._days) * len(_TIMINGS)
+            self._days.append(timings)
+            data = timings.data
+            tz = data.meta.timezone
+            d, m, y = data.date.gregorian.date.split("-")
+            date = datetime.datetime(int(y), int(m), int(d))
+            minutes = timings.minutes
+            today, tomorrow = [], []
+            for i in indexes:
+                if i in _NIGHT and minutes[i] < minutes[_ISHA]:
+                    tomorrow.append(i)
+                else:
+                    today.append(i)
+            for day, times in ((date, today), (date + _ONE_DAY, tomorrow)):
+                utc = _utc_times(
+                    day, tz, [minutes[i] for i in times], strict=True
+                )
+                events.extend(
+                    (t, code + i) for t, i in zip(utc, times) if t is not None
+                )
+        events.sort()
+        self._times = array("q", [t for t, _ in events])
+        self._events = array("l", [e for _, e in events])
+
+    def _prayer(self, i: int) -> Optional[Prayer]:
+        if not 0 <= i < len(self._events):
+            return None
+        day, time = divmod(self._events[i], len(_TIMINGS))
+        return self._days[day].prayer(_TIMINGS[time])
+
+    def _search(self, now: datetime.datetime) -> int:
+        # index of the first time after now, now being naive in UTC
+        return bisect_right(self._times, _key(now))
+
+    def next_prayer(
+        self, now: Optional[datetime.datetime] = None
+    ) -> Optional[Prayer]:
+        """Gives the first time after `now`.
+
+        Parameters
+        ----------
+            now: Optional[:class:`datetime.datetime`]
+                A naive time in UTC or an aware time.
+                Default: the current time
+
+        Returns
+        -------
+            Optional[:class:`~aladhan.Prayer`]
+                ``None`` if `now` is after the last day of the index.
+        """
+        return self._prayer(self._search(_utc(now)))
+
+    def current(
+        self, now: Optional[datetime.datetime] = None
+    ) -> Optional[Prayer]:
+        """Gives the last time at or before `now`, which is isha of the
+        day before until fajr.
+
+        Parameters
+        ----------
+            now: Optional[:class:`datetime.datetime`]
+                A naive time in UTC or an aware time.
+                Default: the current time
+
+        Returns
+        -------
+            Optional[:class:`~aladhan.Prayer`]
+                ``None`` if `now` is before the first time of the index.
+        """
+        return self._prayer(self._search(_utc(now)) - 1)
+
+    def window(
+        self, now: Optional[datetime.datetime] = None
+    ) -> Tuple[Optional[Prayer], Optional[Prayer]]:
+        """Gives the current time and the next one, with a single search.
+
+        Parameters
+        ----------
+            now: Optional[:class:`datetime.datetime`]
+                A naive time in UTC or an aware time.
+                Default: the current time
+
+        Returns
+        -------
+            Tuple[Optional[:class:`~aladhan.Prayer`],
+            Optional[:class:`~aladhan.Prayer`]]
+                See :meth:`current` and :meth:`next_prayer`.
+        """
+        i = self._search(_utc(now))
+        return self._prayer(i - 1), self._prayer(i)
+
+    def remaining(
+        self, now: Optional[datetime.datetime] = None
+    ) -> Optional[datetime.timedelta]:
+        """Gives the time remaining until the next time, without making
+        any :class:`~aladhan.Prayer`.
+
+        Parameters
+        ----------
+            now: Optional[:class:`datetime.datetime`]
+                A naive time in UTC or an aware time.
+                Default: the current time
+
+        Returns
+        -------
+            Optional[:class:`datetime.timedelta`]
+                ``None`` if `now` is after the last day of the index.
+        """
+        now = _utc(now)
+        i = self._search(now)
+        if i == len(self._times):
+            return None
+        return _EPOCH + datetime.timedelta(minutes=self._times[i]) - now
+
+    def __iter__(self) -> Iterable[Prayer]:
+        for i in range(len(self._events)):
+            yield self._prayer(i)
+
+    def __len__(self):
+        return len(self._times)
+
+    def __repr__(self):
+        return "<PrayerIndex days={0} times={1}>".format(
+            len(self._days), len(self._times)
+        )
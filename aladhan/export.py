@@ -0,0 +1,290 @@
+import csv
+import io
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterable, Iterable, List, Sequence, Union
+
+from .calendars import LazyCalendar
+from .columnar import NAMES
+from .data_classes import Timings
+
+__all__ = ("TimingsWriter", "CSVWriter", "NDJSONWriter", "ParquetWriter")
+
+_HEADER = ["date", "latitude", "longitude", "timezone"] + list(NAMES)
+_MISSING = object()
+_pyarrow = _MISSING
+
+
+def _import_pyarrow():
+    global _pyarrow
+    if _pyarrow is _MISSING:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            pyarrow = None
+        _pyarrow = pyarrow
+    return _pyarrow
+
+
+def _raw_row(day: dict) -> list:
+    meta = day["meta"]
+    timings = day["timings"]
+    d, m, y = day["date"]["gregorian"]["date"].split("-")
+    row = [y + "-" + m + "-" + d, meta["latitude"], meta["longitude"]]
+    row.append(meta["timezone"])
+    row.extend([timings[name][:5] for name in NAMES])
+    return row
+
+
+def _timings_row(timings: Timings) -> list:
+    data = timings.data
+    meta = data.meta
+    d, m, y = data.date.gregorian.date.split("-")
+    row = [y + "-" + m + "-" + d, meta.latitude, meta.longitude]
+    row.append(str(meta.timezone))
+    row.extend(["%02d:%02d" % divmod(m, 60) for m in timings.minutes])
+    return row
+
+
+def _rows(data) -> Iterable[list]:
+    if isinstance(data, Timings):
+        yield _timings_row(data)
+    elif isinstance(data, LazyCalendar):  # no need to build its timings
+        for day in data.raw:
+            yield _raw_row(day)
+    elif isinstance(data, dict):
+        if "timings" in data:  # a day
+            yield _raw_row(data)
+        else:  # a year calendar
+            for month in sorted(data, key=int):
+                yield from _rows(data[month])
+    else:  # a month calendar or any iterable of the above
+        for item in data:
+            yield from _rows(item)
+
+
+class TimingsWriter(ABC):
+    """
+    Base class of the writers of timings as a table.
+
+    A writer takes days in any form the library gives them: a
+    :class:`~aladhan.Timings`, a calendar, a day, month or year as
+    returned from the API, or any iterable of these such as a streamed
+    calendar. Rows are written in batches as they come, so the whole input
+    never has to be held in memory.
+
+    Every row has a ``date`` (``YYYY-MM-DD``), ``latitude``,
+    ``longitude``, ``timezone`` and the local ``HH:MM`` time of every
+    prayer, after the extra `columns`.
+
+    Example
+
+    .. code:: py
+
+        with CSVWriter("timetables.csv", columns=["mosque"]) as writer:
+            for mosque, (lon, lat) in mosques.items():
+                calendar = client.get_calendar(lon, lat, date, stream=True)
+                writer.write(calendar, mosque=mosque)
+
+    Parameters
+    ----------
+        file: :class:`str`, :class:`os.PathLike` or a file object
+            Where to write. A path is opened, and closed with the writer.
+
+        columns: Sequence[:class:`str`]
+            Extra columns, given to every :meth:`write` as keyword
+            arguments.
+
+        batch_size: :class:`int`
+            Number of rows written at once.
+            Default: 1000
+
+    *New in v1.3.0*
+    """
+
+    binary = False
+
+    def __init__(
+        self,
+        file: Union[str, os.PathLike, Any],
+        columns: Sequence[str] = (),
+        batch_size: int = 1000,
+    ):
+        self.columns = list(columns) + _HEADER
+        self.extra = tuple(columns)
+        self.batch_size = batch_size
+        self.rows = 0
+        self._batch: List[list] = []
+        self._owned = isinstance(file, (str, os.PathLike))
+        if self._owned:
+            if self.binary:
+                file = open(file, "wb")
+            else:
+                file = open(file, "w", encoding="utf8", newline="")
+        self.file = file
+
+    def _extra(self, extra: dict) -> list:
+        if set(extra) != set(self.extra):
+            raise TypeError(
+                "Expected {!r} columns, got {!r}".format(
+                    self.extra, tuple(extra)
+                )
+            )
+        return [extra[c] for c in self.extra]
+
+    def _add(self, row: list):
+        self._batch.append(row)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def write(self, data, **extra) -> int:
+        """Writes days.
+
+        Parameters
+        ----------
+            data:
+                A :class:`~aladhan.Timings`, a calendar, raw API data or an
+                iterable of these.
+
+            extra:
+                Values of the extra columns for these days.
+
+        Returns
+        -------
+            :class:`int`
+                Number of rows written.
+        """
+        values = self._extra(extra)
+        n = 0
+        for row in _rows(data):
+            self._add(values + row)
+            n += 1
+        return n
+
+    async def awrite(self, data: AsyncIterable, **extra) -> int:
+        """Like :meth:`write` for an asynchronous iterable, such as a
+        calendar streamed by an asynchronous client."""
+        values = self._extra(extra)
+        n = 0
+        async for item in data:
+            for row in _rows(item):
+                self._add(values + row)
+                n += 1
+        return n
+
+    def flush(self):
+        """Writes the pending rows."""
+        if self._batch:
+            self._write_batch(self._batch)
+            self.rows += len(self._batch)
+            self._batch = []
+
+    @abstractmethod
+    def _write_batch(self, batch: List[list]):
+        """Writes rows to the file."""
+
+    def close(self):
+        """Writes the pending rows and closes the file if it was opened
+        by the writer."""
+        self.flush()
+        if self._owned:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __repr__(self):
+        return "<{0} rows={1}>".format(type(self).__name__, self.rows)
+
+
+class CSVWriter(TimingsWriter):
+    """
+    Writes timings as CSV, with a header row.
+
+    See :class:`TimingsWriter` for the parameters.
+
+    *New in v1.3.0*
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._write_batch([self.columns])
+
+    def _write_batch(self, batch: List[list]):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(batch)
+        self.file.write(buffer.getvalue())
+
+
+class NDJSONWriter(TimingsWriter):
+    """
+    Writes timings as newline delimited JSON, an object per row.
+
+    See :class:`TimingsWriter` for the parameters.
+
+    *New in v1.3.0*
+    """
+
+    def _write_batch(self, batch: List[list]):
+        columns = self.columns
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+        self.file.write(
+            "".join(dumps(dict(zip(columns, row))) + "\n" for row in batch)
+        )
+
+
+class ParquetWriter(TimingsWriter):
+    """
+    Writes timings as Parquet, a row group per batch.
+
+    Needs `pyarrow`. Extra columns are written as strings.
+
+    See :class:`TimingsWriter` for the parameters.
+
+    *New in v1.3.0*
+    """
+
+    binary = True
+
+    def __init__(self, *args, **kwargs):
+        pa = _import_pyarrow()
+        if pa is None:
+            raise ImportError(
+                "`pyarrow` is a required library that is missing "
+                "for Parquet usage."
+            )
+        super().__init__(*args, **kwargs)
+        types = {"latitude": pa.float64(), "longitude": pa.float64()}
+        self._schema = pa.schema(
+            [(name, types.get(name, pa.string())) for name in self.columns]
+        )
+        self._writer = pa.parquet.ParquetWriter(self.file, self._schema)
+
+    def _write_batch(self, batch: List[list]):
+        pa = _pyarrow
+        arrays = [
+            pa.array(
+                [
+                    row[i]
+                    if row[i] is None or field.type != pa.string()
+                    else str(row[i])
+                    for row in batch
+                ],
+                type=field.type,
+            )
+            for i, field in enumerate(self._schema)
+        ]
+        self._writer.write_table(
+            pa.Table.from_arrays(arrays, schema=self._schema)
+        )
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+        if self._owned:
+            self.file.close()
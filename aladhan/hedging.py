@@ -0,0 +1,105 @@
+from collections import deque
+from typing import Optional
+
+__all__ = ("HedgePolicy",)
+
+
+class HedgePolicy:
+    """
+    Decides when an asynchronous request should be hedged.
+
+    A request that didn't get a response after the `percentile` of the
+    recently seen latencies gets a second identical request, and whichever
+    answers first is used. Every request earns `budget` of a hedge, so
+    hedges can't grow the load by more than that fraction.
+
+    Parameters
+    ----------
+        percentile: :class:`float`
+            Latency percentile to hedge after, from 0 to 1.
+            Default: 0.95
+
+        budget: :class:`float`
+            Fraction of extra requests that hedges are allowed to add.
+            Default: 0.1
+
+        window: :class:`int`
+            Number of recent latencies to keep.
+            Default: 200
+
+        min_samples: :class:`int`
+            Latencies needed before any hedging happens.
+            Default: 20
+
+        min_delay: :class:`float`
+            Never hedge sooner than this many seconds.
+            Default: 0.05
+
+        max_tokens: :class:`float`
+            Maximum number of unused hedges that can be saved up.
+            Default: 10
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = (
+        "percentile",
+        "budget",
+        "min_samples",
+        "min_delay",
+        "max_tokens",
+        "latencies",
+        "tokens",
+        "hedged",
+    )
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.1,
+        window: int = 200,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        max_tokens: float = 10,
+    ):
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_tokens = max_tokens
+        self.latencies: deque = deque(maxlen=window)
+        self.tokens = 0.0
+        self.hedged = 0
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging a new request, ``None`` if it
+        shouldn't be hedged. Called once for every request."""
+        self.tokens = min(self.max_tokens, self.tokens + self.budget)
+        if len(self.latencies) < self.min_samples:
+            return None
+        latencies = sorted(self.latencies)
+        i = min(len(latencies) - 1, int(len(latencies) * self.percentile))
+        return max(self.min_delay, latencies[i])
+
+    def try_hedge(self) -> bool:
+        """Takes a hedge from the budget if there is one left."""
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        self.hedged += 1
+        return True
+
+    def refund(self):
+        """Gives back a hedge taken by :meth:`try_hedge` that wasn't sent."""
+        self.tokens += 1
+        self.hedged -= 1
+
+    def record(self, latency: float):
+        """Adds the latency of a completed request."""
+        self.latencies.append(latency)
+
+    def __repr__(self):
+        return (
+            "<HedgePolicy percentile={0.percentile} budget={0.budget} "
+            "hedged={0.hedged}>"
+        ).format(self)
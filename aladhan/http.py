@@ -2,9 +2,14 @@ import asyncio
 import datetime
 import logging
 import time
+from urllib.parse import urlsplit
 
+from .cache import NegativeCache, canonical_params, request_key
 from .endpoints import *
-from .exceptions import HTTPException
+from .exceptions import BadRequest, HTTPException
+from .hedging import HedgePolicy
+from .ratelimit import AIMDRateLimiter
+from .stream import CalendarParser
 from .types import (
     IMR,
     SDR,
@@ -20,6 +25,22 @@ from .types import (
 
 log = logging.getLogger(__name__)
 
+#: Bytes read at once from a streamed response.
+CHUNK_SIZE = 16 * 1024
+
+#: Requests sent at once by batched getters before the API's rate limit is
+#: known.
+MAX_IN_FLIGHT = 4
+
+_GEOCODED = frozenset(e[len(BASE):] for e in GEOCODED)
+
+
+def _endpoint_name(endpoint: str) -> str:
+    # "https://api.aladhan.com/v1/timingsByAddress/01-01-2021"
+    #  -> "timingsByAddress"
+    parts = urlsplit(endpoint).path.split("/")
+    return parts[2] if len(parts) > 2 else ""
+
 
 def missing_lib(msg):  # pragma: no cover
     def _(*args, **kwargs):
@@ -66,13 +87,31 @@ __all__ = ("HTTPClient",)
 
 
 class HTTPClient:
-    __slots__ = "requester", "request"
-
-    def __init__(self, is_async: bool = False, auto_manage_rate: bool = True):
-        self.requester = (_AsyncRequester if is_async else _SyncRequester)(
-            auto_manage_rate
+    __slots__ = "requester", "request", "stream"
+
+    def __init__(
+        self,
+        is_async: bool = False,
+        auto_manage_rate: bool = True,
+        coordinate_precision: Optional[float] = None,
+        adaptive_rate: bool = False,
+        negative_cache_ttl: Optional[float] = None,
+        hedge: bool = False,
+    ):
+        args = (
+            auto_manage_rate,
+            coordinate_precision,
+            AIMDRateLimiter() if adaptive_rate else None,
+            negative_cache_ttl and NegativeCache(negative_cache_ttl) or None,
         )
+        if is_async:
+            self.requester = _AsyncRequester(
+                *args, hedge_policy=HedgePolicy() if hedge else None
+            )
+        else:
+            self.requester = _SyncRequester(*args)
         self.request = self.requester.request
+        self.stream = self.requester.stream
 
     @property
     def is_async(self):
@@ -99,20 +138,24 @@ class HTTPClient:
         return self.request(TIMINGS_BY_CITY + (date and "/" + date), params)
 
     # Calendar
-    def get_calendar(self, params: dict, hijri: bool = False) -> CalendarR:
-        return self.request(hijri and HIJRI_CALENDAR or CALENDAR, params)
+    def get_calendar(
+        self, params: dict, hijri: bool = False, stream: bool = False
+    ) -> CalendarR:
+        return (stream and self.stream or self.request)(
+            hijri and HIJRI_CALENDAR or CALENDAR, params
+        )
 
     def get_calendar_by_address(
-        self, params: dict, hijri: bool = False
+        self, params: dict, hijri: bool = False, stream: bool = False
     ) -> CalendarR:
-        return self.request(
+        return (stream and self.stream or self.request)(
             hijri and HIJRI_CALENDAR_BY_ADDRESS or CALENDAR_BY_ADDRESS, params
         )
 
     def get_calendar_by_city(
-        self, params: dict, hijri: bool = False
+        self, params: dict, hijri: bool = False, stream: bool = False
     ) -> CalendarR:
-        return self.request(
+        return (stream and self.stream or self.request)(
             hijri and HIJRI_CALENDAR_BY_CITY or CALENDAR_BY_CITY, params
         )
 
@@ -177,10 +220,23 @@ class HTTPClient:
 
 
 class _BaseRequester(ABC):
-    __slots__ = ("session", "auto_manage_rate")
+    __slots__ = (
+        "session",
+        "auto_manage_rate",
+        "coordinate_precision",
+        "rate_limiter",
+        "negative_cache",
+        "hedge_policy",
+        "in_flight",
+    )
 
     session: U[ClientSession, Session]
     auto_manage_rate: bool
+    coordinate_precision: Optional[float]
+    rate_limiter: Optional[AIMDRateLimiter]
+    negative_cache: Optional[NegativeCache]
+    hedge_policy: Optional[HedgePolicy]
+    in_flight: int
 
     _HEADERS = {
         "User-Agent": "Aladhan API wrapper in Python "
@@ -188,112 +244,328 @@ class _BaseRequester(ABC):
     }
     last_headers_res: dict = {}
 
+    def __init__(
+        self,
+        auto_manage_rate: bool = True,
+        coordinate_precision: Optional[float] = None,
+        rate_limiter: Optional[AIMDRateLimiter] = None,
+        negative_cache: Optional[NegativeCache] = None,
+    ):
+        self.auto_manage_rate = auto_manage_rate
+        self.coordinate_precision = coordinate_precision
+        self.rate_limiter = rate_limiter
+        self.negative_cache = negative_cache
+        self.in_flight = 0
+
+    @abstractmethod
+    def _send(self, endpoint: str, params: Optional[dict], read, retries: int):
+        """Sends a GET request and yields what `read` gets out of the
+        response's body.
+
+        Shared by :meth:`request` and :meth:`stream`: it checks the
+        negative cache, waits on the rate limit, retries when rate limited
+        and raises the error of any other failed response."""
+
     @abstractmethod
     def request(
         self, endpoint: str, params: Optional[dict] = None, __retries: int = 5
     ):
         ...
 
+    def stream(
+        self, endpoint: str, params: Optional[dict] = None, __retries: int = 5
+    ):
+        """Like :meth:`request` for a calendar endpoint, but yields its
+        days one by one while the response is being read."""
+        return self._send(endpoint, params, self._read_days, __retries)
+
     @property
     def is_async(self) -> bool:
         return isinstance(self.session, ClientSession)
 
-    def check_rate(self) -> int:
+    def prepare_params(self, params: Optional[dict]) -> dict:
+        return canonical_params(params, self.coordinate_precision)
+
+    def key(self, endpoint: str, params: Optional[dict] = None) -> tuple:
+        return request_key(endpoint, params, self.coordinate_precision)
+
+    def _negative_key(self, endpoint: str, params: dict) -> Optional[tuple]:
+        if self.negative_cache is None:
+            return None
+        if _endpoint_name(endpoint) not in _GEOCODED:
+            return None
+        return endpoint, tuple(params.items())
+
+    def cached_error(
+        self, endpoint: str, params: dict
+    ) -> Optional[HTTPException]:
+        key = self._negative_key(endpoint, params)
+        exc = key and self.negative_cache.get(key)
+        if exc is not None:
+            log.debug("(GET) negative cache hit for %s with %s", *key)
+        return exc
+
+    def error_from_res(
+        self, endpoint: str, params: dict, raw: dict
+    ) -> HTTPException:
+        exc = HTTPException.from_res(raw)
+        key = isinstance(exc, BadRequest) and self._negative_key(
+            endpoint, params
+        )
+        if key:
+            self.negative_cache.put(key, exc)
+        return exc
+
+    @staticmethod
+    def _reset_at(headers) -> datetime.datetime:
+        date = datetime.datetime.strptime(
+            headers["Date"], "%a, %d %b %Y %H:%M:%S GMT"
+        )
+        return date + datetime.timedelta(
+            seconds=int(headers["RateLimit-Reset"])
+        )
+
+    def keep_headers(self, headers):
+        """Keeps a successful response's headers for :meth:`check_rate`,
+        unless a response that was answered later is already kept."""
+        last = self.last_headers_res
+        remaining = headers.get("RateLimit-Remaining")
         if (
-            self.auto_manage_rate
-            and self.last_headers_res.get("RateLimit-Remaining") == "0"
+            last.get("RateLimit-Remaining") is not None
+            and remaining is not None
+            and int(remaining) > int(last["RateLimit-Remaining"])
+            and self._reset_at(headers) <= self._reset_at(last)
         ):
-            date = datetime.datetime.strptime(
-                self.last_headers_res["Date"], "%a, %d %b %Y %H:%M:%S GMT"
-            )
-            date += datetime.timedelta(
-                seconds=int(self.last_headers_res["RateLimit-Reset"])
-            )
-            return (date - datetime.datetime.utcnow()).seconds + 1
-        return -1
+            return
+        self.last_headers_res = headers
+
+    def check_rate(self) -> float:
+        if not self.auto_manage_rate:
+            return -1
+        remaining = self.last_headers_res.get("RateLimit-Remaining")
+        # requests still waiting for their response may already be counted
+        if remaining is None or int(remaining) > self.in_flight:
+            return -1
+        # a second more since the Date header is truncated to seconds
+        wait = (
+            self._reset_at(self.last_headers_res) - datetime.datetime.utcnow()
+        ).total_seconds() + 1
+        return wait if wait > 0 else -1
+
+    def wait_time(self) -> float:
+        if self.rate_limiter is not None:
+            return self.rate_limiter.acquire()
+        return self.check_rate()
+
+    def can_send_now(self) -> bool:
+        if self.rate_limiter is not None:
+            return self.rate_limiter.try_acquire()
+        return self.check_rate() <= 0
+
+    def max_in_flight(self) -> int:
+        """How many requests can wait for a response at once without going
+        over the rate limit."""
+        if self.rate_limiter is not None:
+            return max(1, int(self.rate_limiter.rate))
+        limit = self.last_headers_res.get("RateLimit-Limit")
+        return max(1, int(limit)) if limit else MAX_IN_FLIGHT
+
+    def update_rate(self, status: int, headers) -> bool:
+        """Feeds a response to the rate limiter, returns whether the
+        limiter will handle waiting before the next request."""
+        if self.rate_limiter is None:
+            return False
+        self.rate_limiter.update(status, headers)
+        return True
 
 
 class _AsyncRequester(_BaseRequester):
-    def __init__(self, auto_manage_rate: bool = True):
+    def __init__(
+        self, *args, hedge_policy: Optional[HedgePolicy] = None, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
         self.session: ClientSession = ClientSession(headers=self._HEADERS)
-        self.auto_manage_rate = auto_manage_rate
-
-    async def request(
-        self, endpoint: str, params: Optional[dict] = None, __retries: int = 5
+        self.hedge_policy = hedge_policy
+
+    @staticmethod
+    async def _read_data(res):
+        yield (await res.json())["data"]
+
+    @staticmethod
+    async def _read_days(res):
+        parser = CalendarParser()
+        async for chunk in res.content.iter_chunked(CHUNK_SIZE):
+            for day in parser.feed(chunk):
+                yield day
+        for day in parser.close():
+            yield day
+
+    async def _timed_get(self, endpoint: str, params: dict):
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        res = await self.session.get(endpoint, params=params)
+        self.hedge_policy.record(loop.time() - start)
+        return res
+
+    async def _hedged_get(self, endpoint: str, params: dict):
+        delay = self.hedge_policy.delay()
+        tasks = {asyncio.ensure_future(self._timed_get(endpoint, params))}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self.hedge_policy.try_hedge():
+                    if self.can_send_now():
+                        log.debug("(GET) hedging request to %s", endpoint)
+                        tasks.add(
+                            asyncio.ensure_future(
+                                self._timed_get(endpoint, params)
+                            )
+                        )
+                    else:  # the rate limit doesn't allow it
+                        self.hedge_policy.refund()
+            while True:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                # prefer a successful one if both finished together
+                for task in sorted(done, key=lambda t: bool(t.exception())):
+                    if not task.exception() or not tasks:
+                        for loser in done - {task}:
+                            if not loser.exception():
+                                loser.result().release()
+                        return task.result()
+        finally:
+            for task in tasks:  # the loser
+                task.cancel()
+
+    async def _get(self, endpoint: str, params: dict):
+        if self.hedge_policy is None:
+            return await self.session.get(endpoint, params=params)
+        return await self._hedged_get(endpoint, params)
+
+    async def _send(
+        self, endpoint: str, params: Optional[dict], read, retries: int
     ):
-        check = self.check_rate()
-        if check > 0:
-            await asyncio.sleep(check)
-
-        async with self.session.get(endpoint, params=params) as res:
-            log.debug(
-                "(GET)[%s status code] request to %s with %s",
-                res.status,
-                endpoint,
-                params,
-            )
-            raw = await res.json()
-
-        raw["code"] = res.status
-
-        if res.status != 200:  # Something wrong
-            if res.status == 429 and __retries > 0:  # Rate limited, Retrying.
-                t = int(res.headers.get("Retry-after", 2))
+        params = self.prepare_params(params)
+        exc = self.cached_error(endpoint, params)
+        if exc is not None:
+            raise exc
+
+        while True:
+            check = self.wait_time()
+            if check > 0:
+                await asyncio.sleep(check)
+
+            self.in_flight += 1
+            try:
+                res = await self._get(endpoint, params)
+            finally:
+                self.in_flight -= 1
+
+            async with res:
                 log.debug(
-                    "(GET)[%s status code] retrying after %ss",
+                    "(GET)[%s status code] request to %s with %s",
                     res.status,
                     endpoint,
-                    t,
+                    params,
                 )
+                paced = self.update_rate(res.status, res.headers)
+                if res.status == 200:
+                    self.keep_headers(res.headers)
+                    async for item in read(res):
+                        yield item
+                    return
+                raw = await res.json()
+
+            raw["code"] = res.status
+            if res.status != 429 or retries <= 0:  # Something wrong
+                raise self.error_from_res(endpoint, params, raw)
+
+            # Rate limited, Retrying.
+            retries -= 1
+            t = int(res.headers.get("Retry-after", 2))
+            log.debug(
+                "(GET)[%s status code] retrying %s after %ss",
+                res.status,
+                endpoint,
+                t,
+            )
+            if not paced:
                 await asyncio.sleep(t)
-                return await self.request(endpoint, params, __retries - 1)
-            raise HTTPException.from_res(raw)
-
-        self.last_headers_res = res.headers
-
-        return raw["data"]
-
-
-class _SyncRequester(_BaseRequester):
-    def __init__(self, auto_manage_rate: bool = True):
-        self.session: Session = Session()
-        self.auto_manage_rate = auto_manage_rate
 
-    def request(
+    async def request(
         self, endpoint: str, params: Optional[dict] = None, __retries: int = 5
     ):
-        check = self.check_rate()
-        if check > 0:
-            time.sleep(check)
-
-        with self.session.get(
-            endpoint, params=params, headers=self._HEADERS
-        ) as res:
-            log.debug(
-                "(GET)[%s status code] request to %s with %s",
-                res.status_code,
-                endpoint,
-                params,
+        (data,) = [
+            data
+            async for data in self._send(
+                endpoint, params, self._read_data, __retries
             )
-            raw = res.json()
+        ]
+        return data
+
 
-        raw["code"] = res.status_code
+class _SyncRequester(_BaseRequester):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session: Session = Session()
 
-        if res.status_code != 200:  # Something wrong
-            if (
-                res.status_code == 429 and __retries > 0
-            ):  # Rate limited, Retrying.
-                t = int(res.headers.get("Retry-after", 2))
+    @staticmethod
+    def _read_data(res):
+        yield res.json()["data"]
+
+    @staticmethod
+    def _read_days(res):
+        parser = CalendarParser()
+        for chunk in res.iter_content(CHUNK_SIZE):
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
+    def _send(self, endpoint: str, params: Optional[dict], read, retries: int):
+        params = self.prepare_params(params)
+        exc = self.cached_error(endpoint, params)
+        if exc is not None:
+            raise exc
+
+        while True:
+            check = self.wait_time()
+            if check > 0:
+                time.sleep(check)
+
+            with self.session.get(
+                endpoint, params=params, headers=self._HEADERS, stream=True
+            ) as res:
                 log.debug(
-                    "(GET)[%s status code] retrying after %ss",
+                    "(GET)[%s status code] request to %s with %s",
                     res.status_code,
                     endpoint,
-                    t,
+                    params,
                 )
+                paced = self.update_rate(res.status_code, res.headers)
+                if res.status_code == 200:
+                    self.keep_headers(res.headers)
+                    yield from read(res)
+                    return
+                raw = res.json()
+
+            raw["code"] = res.status_code
+            if res.status_code != 429 or retries <= 0:  # Something wrong
+                raise self.error_from_res(endpoint, params, raw)
+
+            # Rate limited, Retrying.
+            retries -= 1
+            t = int(res.headers.get("Retry-after", 2))
+            log.debug(
+                "(GET)[%s status code] retrying %s after %ss",
+                res.status_code,
+                endpoint,
+                t,
+            )
+            if not paced:
                 time.sleep(t)
-                return self.request(endpoint, params, __retries - 1)
-            raise HTTPException.from_res(raw)
 
-        self.last_headers_res = res.headers
-
-        return raw["data"]
+    def request(
+        self, endpoint: str, params: Optional[dict] = None, __retries: int = 5
+    ):
+        (data,) = self._send(endpoint, params, self._read_data, __retries)
+        return data
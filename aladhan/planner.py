@@ -0,0 +1,417 @@
+import datetime
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from .cache import canonical_params
+from .data_classes import (
+    _TUNED,
+    CalendarDateArg,
+    Data,
+    Ism,
+    Parameters,
+    TimingsDateArg,
+    Tune,
+)
+from .exceptions import InvalidArgument
+
+__all__ = (
+    "calendar_requests",
+    "TimingsQuery",
+    "AsmaQuery",
+    "Plan",
+    "plan",
+    "location_params",
+)
+
+#: A year that needs at least this many months is fetched as one annual
+#: calendar instead of month by month. An annual calendar is twelve months
+#: of data, so a lower value trades bytes for fewer requests.
+ANNUAL_FROM = 6
+
+Location = Union[str, Tuple[float, float], Tuple[str, str, Optional[str]]]
+
+_GETTERS = {
+    "coordinates": ("get_timings", "get_calendar"),
+    "address": ("get_timings_by_address", "get_calendar_by_address"),
+    "city": ("get_timings_by_city", "get_calendar_by_city"),
+}
+_ZERO_TUNE = Tune().value
+
+
+def calendar_requests(
+    start: datetime.date, end: datetime.date, annual_from: int = ANNUAL_FROM
+) -> List[CalendarDateArg]:
+    """Splits a date range into the calendar requests covering it.
+
+    Parameters
+    ----------
+        start: :class:`datetime.date`
+            First day of the range.
+
+        end: :class:`datetime.date`
+            Last day of the range, included.
+
+        annual_from: :class:`int`
+            Number of months of a year from which an annual calendar is
+            requested instead. An annual calendar saves requests but is
+            twelve months of data, so with two months it's about six
+            times the bytes of two month requests.
+            Default: 6
+
+    Returns
+    -------
+        :class:`list` of :class:`~aladhan.CalendarDateArg`
+            The requests, in date order.
+
+    *New in v1.3.0*
+    """
+    months: Dict[int, List[int]] = {}
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.setdefault(year, []).append(month)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    requests = []
+    for year, ms in months.items():
+        if len(ms) >= annual_from:
+            requests.append(CalendarDateArg(year))
+        else:
+            requests.extend(CalendarDateArg(year, m) for m in ms)
+    return requests
+
+
+def location_params(location: Location) -> Tuple[str, dict]:
+    """Turns a location into its kind and request parameters.
+
+    A location is either an address string, a ``(longitude, latitude)``
+    pair or a ``(city, country)`` / ``(city, country, state)`` tuple.
+
+    Returns
+    -------
+        :class:`tuple` of :class:`str` and :class:`dict`
+            One of ``"address"``, ``"coordinates"`` or ``"city"`` and the
+            parameters for it.
+
+    Raises
+    ------
+        :exc:`~aladhan.exceptions.InvalidArgument`
+            `location` isn't in one of the above forms.
+
+    *New in v1.3.0*
+    """
+    if isinstance(location, str):
+        return "address", dict(address=location)
+    if isinstance(location, (tuple, list)):
+        if len(location) == 2 and not any(
+            isinstance(x, str) for x in location
+        ):
+            longitude, latitude = location
+            return "coordinates", dict(
+                longitude=longitude, latitude=latitude
+            )
+        if 2 <= len(location) <= 3 and all(
+            isinstance(x, str) for x in location[:2]
+        ):
+            city, country, state = (tuple(location) + (None,))[:3]
+            dct = dict(city=city, country=country)
+            if state is not None:
+                dct["state"] = state
+            return "city", dct
+    raise InvalidArgument(
+        "Expected an address, a (longitude, latitude) pair or a "
+        "(city, country[, state]) tuple, got {!r}".format(location)
+    )
+
+
+class TimingsQuery:
+    """
+    A query for the timings of a location on a day, to be run with
+    :func:`plan`.
+
+    Parameters
+    ----------
+        location: :class:`str` or :class:`tuple`
+            An address, a ``(longitude, latitude)`` pair or a
+            ``(city, country[, state])`` tuple.
+
+        date: Optional[:class:`~aladhan.TimingsDateArg`]
+            Default: Current date.
+
+        params: Optional[:class:`~aladhan.Parameters`]
+            Default: ``Parameters()``
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = ("location", "date", "params")
+
+    def __init__(
+        self,
+        location: Location,
+        date: Optional[TimingsDateArg] = None,
+        params: Optional[Parameters] = None,
+    ):
+        self.location = location
+        self.date = TimingsDateArg() if date is None else date
+        self.params = Parameters() if params is None else params
+
+    def __repr__(self):
+        return "<TimingsQuery location={0.location!r} date={1!r}>".format(
+            self, self.date.date
+        )
+
+
+class AsmaQuery:
+    """
+    A query for asma from their numbers, to be run with :func:`plan`.
+
+    Parameters
+    ----------
+        n: :class:`int`
+            Numbers from range 1-99.
+
+    Raises
+    ------
+        :exc:`~aladhan.exceptions.InvalidArgument`
+            No numbers were passed.
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = ("numbers",)
+
+    def __init__(self, *n: int):
+        if not n:
+            raise InvalidArgument("No arguments were passed.")
+        self.numbers = n
+
+    def __repr__(self):
+        return "<AsmaQuery numbers={0.numbers!r}>".format(self)
+
+
+Query = Union[TimingsQuery, AsmaQuery]
+
+
+class _Call:
+    __slots__ = ("getter", "args", "tune")
+
+    def __init__(self, getter: str, args: tuple, tune: str = _ZERO_TUNE):
+        self.getter = getter
+        self.args = args
+        self.tune = tune
+
+    def fetch(self, http):
+        return getattr(http, self.getter)(*self.args)
+
+
+class Plan:
+    """
+    The HTTP calls that answer a list of queries, made by :func:`plan`.
+
+    Attributes
+    ----------
+        queries: :class:`list` of :class:`TimingsQuery` or \
+        :class:`AsmaQuery`
+            The planned queries.
+
+        naive_requests: :class:`int`
+            Requests needed to run every query on its own.
+
+        planned_requests: :class:`int`
+            Requests this plan sends.
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = ("queries", "_calls", "_targets")
+
+    def __init__(self, queries: List[Query]):
+        self.queries = queries
+        self._calls: Dict[Hashable, _Call] = {}
+        self._targets: List[Tuple[Hashable, tuple]] = []
+
+    @property
+    def naive_requests(self) -> int:
+        return len(self.queries)
+
+    @property
+    def planned_requests(self) -> int:
+        return len(self._calls)
+
+    def execute(self, client):
+        """Sends the planned calls and scatters their responses back.
+
+        Parameters
+        ----------
+            client: :class:`~aladhan.Client`
+                The client to send the calls with, they are sent
+                concurrently for asynchronous usage.
+
+        Returns
+        -------
+            :class:`list`
+                One result per query, in the same order: a
+                :class:`~aladhan.Timings` for a :class:`TimingsQuery` and a
+                :class:`list` of :class:`~aladhan.Ism` for an
+                :class:`AsmaQuery`.
+        """
+        keys = list(self._calls)
+        fetches = [
+            lambda call=self._calls[k]: call.fetch(client.http) for k in keys
+        ]
+
+        def scatter(responses):
+            by_key = dict(zip(keys, responses))
+            return [
+                self._extract(client, self._calls[key], by_key[key], target)
+                for key, target in self._targets
+            ]
+
+        return client.converter.to_gathered(client, fetches, scatter)
+
+    @staticmethod
+    def _extract(client, call: _Call, data, target: tuple):
+        if target[0] == "asma":
+            isms = {d["number"]: d for d in data}
+            return [Ism(**isms[n]) for n in target[1]]
+
+        _, year, month, day, tune = target
+        if isinstance(data, dict) and "timings" not in data:  # annual
+            data = data[str(month)]
+        if isinstance(data, list):
+            data = data[day - 1]
+        if tune != call.tune:
+            data = _retune(data, call.tune, tune)
+        return Data(**data, client=client).timings
+
+    def __repr__(self):
+        return "<Plan naive_requests={0} planned_requests={1}>".format(
+            self.naive_requests, self.planned_requests
+        )
+
+
+def _shift(time: str, minutes: int) -> str:
+    hm, _, rest = time.partition(" ")
+    h, m = map(int, hm.split(":"))
+    h, m = divmod((h * 60 + m + minutes) % (24 * 60), 60)
+    return "%02d:%02d" % (h, m) + (rest and " " + rest)
+
+
+def _retune(day: dict, base: str, tune: str) -> dict:
+    # tunes are plain minute offsets, so a day fetched with one tune can
+    # be turned into another one without asking the API again.
+    base_values = map(int, base.split(","))
+    values = list(map(int, tune.split(",")))
+    timings = dict(day["timings"])
+    for name, a, b in zip(_TUNED, base_values, values):
+        if a != b and name in timings:
+            timings[name] = _shift(timings[name], b - a)
+    meta = dict(day["meta"], offset=dict(zip(_TUNED, values)))
+    return dict(day, timings=timings, meta=meta)
+
+
+def plan(
+    queries: Sequence[Query],
+    annual_from: int = ANNUAL_FROM,
+    precision: Optional[float] = None,
+) -> Plan:
+    """
+    Compiles queries into the fewest HTTP calls.
+
+    Identical calls are sent once, days of the same location and
+    parameters are merged into month or annual calendars, queries that
+    only differ by their :class:`~aladhan.Tune` share one call and get their
+    offsets applied locally, and asma numbers are batched into one call.
+
+    Example
+
+    .. code:: py
+
+        queries = [
+            TimingsQuery("London", TimingsDateArg(f"{d:02}-05-2021"))
+            for d in range(1, 32)
+        ] + [AsmaQuery(1, 2), AsmaQuery(99)]
+        p = plan(queries)
+        print(p)  # <Plan naive_requests=33 planned_requests=2>
+        results = p.execute(client)  # or await p.execute(client)
+
+    Parameters
+    ----------
+        queries: :class:`list` of :class:`TimingsQuery` or \
+        :class:`AsmaQuery`
+            The queries.
+
+        annual_from: :class:`int`
+            Number of months of a year from which an annual calendar is
+            requested instead, see :func:`calendar_requests`.
+            Default: 6
+
+        precision: Optional[:class:`float`]
+            Should match the client's ``coordinate_precision`` so that
+            coordinates it will merge are planned together.
+
+    Returns
+    -------
+        :class:`Plan`
+            The plan.
+
+    *New in v1.3.0*
+    """
+    queries = list(queries)
+    p = Plan(queries)
+    groups: Dict[Hashable, list] = {}
+    asma: List[int] = []
+
+    for i, q in enumerate(queries):
+        if isinstance(q, AsmaQuery):
+            asma.extend(q.numbers)
+            continue
+        kind, loc = location_params(q.location)
+        params = q.params.as_dict
+        tune = params.pop("tune")
+        params.update(loc)
+        key = kind, tuple(canonical_params(params, precision).items())
+        group = groups.setdefault(key, [kind, params, set(), []])
+        group[2].add(tune)
+        d, m, y = map(int, q.date.date.split("-"))
+        group[3].append((i, y, m, d, tune))
+
+    targets: list = [None] * len(queries)
+    for key, (kind, params, tunes, days) in groups.items():
+        base_tune = tunes.pop() if len(tunes) == 1 else _ZERO_TUNE
+        params = dict(params, tune=base_tune)
+        by_month: Dict[Tuple[int, int], set] = {}
+        for _, y, m, d, _ in days:
+            by_month.setdefault((y, m), set()).add(d)
+        years: Dict[int, int] = {}
+        for y, _ in by_month:
+            years[y] = years.get(y, 0) + 1
+
+        timings_getter, calendar_getter = _GETTERS[kind]
+        for i, y, m, d, tune in days:
+            if years[y] >= annual_from:
+                arg = CalendarDateArg(y)
+            elif len(by_month[y, m]) > 1:
+                arg = CalendarDateArg(y, m)
+            else:
+                arg = None
+
+            if arg is None:
+                date = "%02d-%02d-%d" % (d, m, y)
+                call = _Call(timings_getter, (date, params), base_tune)
+                call_key = (key, date)
+            else:
+                args = (dict(params, **arg.as_dict),)
+                call = _Call(calendar_getter, args, base_tune)
+                call_key = (key, arg.year, arg.month)
+            targets[i] = call_key, ("timings", y, m, d, tune)
+            p._calls.setdefault(call_key, call)
+
+    if asma:
+        numbers = ",".join(map(str, sorted(set(asma))))
+        p._calls["asma"] = _Call("get_asma", (numbers,))
+        for i, q in enumerate(queries):
+            if isinstance(q, AsmaQuery):
+                targets[i] = "asma", ("asma", q.numbers)
+
+    p._targets = targets
+    return p
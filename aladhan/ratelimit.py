@@ -0,0 +1,158 @@
+import logging
+import time
+from typing import Callable, Mapping, Optional
+
+__all__ = ("AIMDRateLimiter",)
+
+log = logging.getLogger(__name__)
+
+
+def _header(headers: Mapping, name: str) -> Optional[float]:
+    value = headers.get(name)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class AIMDRateLimiter:
+    """
+    Adaptive request pacing driven by the API's rate limit headers.
+
+    The rate grows additively while the ``RateLimit-Remaining`` header shows
+    enough headroom, and it's cut multiplicatively on a 429 response or when
+    the remaining count drops low, so it settles just under the real limit.
+
+    Parameters
+    ----------
+        rate: :class:`float`
+            Starting rate in requests per second.
+            Default: 10
+
+        min_rate: :class:`float`
+            Lowest rate it can go down to.
+            Default: 0.5
+
+        max_rate: :class:`float`
+            Highest rate it can go up to.
+            Default: 100
+
+        increase: :class:`float`
+            How much the rate grows per second of successful requests.
+            Default: 4
+
+        decrease: :class:`float`
+            Factor the rate is multiplied by when backing off.
+            Default: 0.5
+
+        headroom: :class:`float`
+            Back off when remaining requests fall under this fraction of
+            ``RateLimit-Limit``.
+            Default: 0.1
+
+    Attributes
+    ----------
+        rate: :class:`float`
+            Current rate in requests per second.
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = (
+        "rate",
+        "min_rate",
+        "max_rate",
+        "increase",
+        "decrease",
+        "headroom",
+        "clock",
+        "_next",
+        "_cooldown_until",
+    )
+
+    def __init__(
+        self,
+        rate: float = 10,
+        min_rate: float = 0.5,
+        max_rate: float = 100,
+        increase: float = 4,
+        decrease: float = 0.5,
+        headroom: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.headroom = headroom
+        self.clock = clock
+        self._next = 0.0
+        self._cooldown_until = 0.0
+
+    def acquire(self) -> float:
+        """Reserves a slot for the next request.
+
+        Returns
+        -------
+            :class:`float`
+                Seconds to wait before sending the request.
+        """
+        now = self.clock()
+        slot = max(now, self._next)
+        self._next = slot + 1 / self.rate
+        return slot - now
+
+    def try_acquire(self) -> bool:
+        """Reserves a slot only if a request can be sent right away.
+
+        Returns
+        -------
+            :class:`bool`
+                Whether a slot was reserved.
+        """
+        if self._next > self.clock():
+            return False
+        self.acquire()
+        return True
+
+    def update(self, status: int, headers: Mapping):
+        """Adjusts the rate from a response.
+
+        Parameters
+        ----------
+            status: :class:`int`
+                Response's status code.
+
+            headers: Mapping[:class:`str`, :class:`str`]
+                Response's headers.
+        """
+        now = self.clock()
+        remaining = _header(headers, "RateLimit-Remaining")
+        limit = _header(headers, "RateLimit-Limit")
+        reset = _header(headers, "RateLimit-Reset")
+
+        if status == 429:
+            retry = _header(headers, "Retry-After")
+            self._back_off(now, reset if retry is None else retry)
+            return
+
+        if remaining is None:
+            return
+        if remaining <= (limit * self.headroom if limit else 0):
+            self._back_off(now, reset if not remaining else None)
+        elif now >= self._cooldown_until:
+            rate = self.rate + self.increase / self.rate
+            self.rate = min(self.max_rate, rate)
+
+    def _back_off(self, now: float, wait: Optional[float]):
+        if wait:
+            self._next = max(self._next, now + wait)
+        if now < self._cooldown_until:  # already backed off for this window
+            return
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self._cooldown_until = max(self._next, now + 1 / self.rate)
+        log.debug("backing off, new rate %.2f req/s", self.rate)
+
+    def __repr__(self):
+        return "<AIMDRateLimiter rate={0.rate:.2f}>".format(self)
@@ -0,0 +1,175 @@
+import codecs
+import json
+from typing import List
+
+__all__ = ("CalendarParser",)
+
+_WHITESPACE = " \t\n\r"
+
+# parser states
+_START = 0  # before the response object
+_KEY = 1  # a key of the response object, or its end
+_COLON = 2
+_VALUE = 3  # a value that isn't the data
+_DATA = 4  # the calendar, a month list or a year object
+_MONTH_KEY = 5  # a month of a year calendar, or its end
+_MONTH_COLON = 6
+_MONTH_OPEN = 7
+_DAYS = 8  # a day of a month list, or its end
+_DONE = 9
+
+
+class _Incomplete(Exception):
+    pass
+
+
+class CalendarParser:
+    """
+    An incremental parser of calendar responses.
+
+    The response body is fed in chunks as it's received, and every day
+    of the calendar is given back as soon as it's complete, so only the
+    day being read has to be held in memory instead of the whole
+    response.
+
+    Example
+
+    .. code:: py
+
+        parser = CalendarParser()
+        for chunk in chunks:
+            for day in parser.feed(chunk):
+                ...
+        for day in parser.close():
+            ...
+
+    *New in v1.3.0*
+    """
+
+    __slots__ = ("_decoder", "_json", "_buf", "_pos", "_state", "_key")
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._state = _START
+        self._key = None
+
+    def feed(self, chunk: bytes) -> List[dict]:
+        """Parses a chunk of the response body.
+
+        Returns
+        -------
+            :class:`list` of :class:`dict`
+                The days completed by this chunk, in order.
+        """
+        self._buf = self._buf[self._pos :] + self._decoder.decode(chunk)
+        self._pos = 0
+        days: List[dict] = []
+        self._parse(days, False)
+        return days
+
+    def close(self) -> List[dict]:
+        """Parses what's left once the whole body was fed.
+
+        Returns
+        -------
+            :class:`list` of :class:`dict`
+                The last days.
+
+        Raises
+        ------
+            :exc:`json.JSONDecodeError`
+                The body isn't a complete calendar response.
+        """
+        self._buf = self._buf[self._pos :] + self._decoder.decode(b"", True)
+        self._pos = 0
+        days: List[dict] = []
+        self._parse(days, True)
+        if self._state != _DONE:
+            raise json.JSONDecodeError(
+                "Unexpected end of calendar response", self._buf, self._pos
+            )
+        return days
+
+    def _decode(self, pos: int, final: bool):
+        try:
+            value, end = self._json.raw_decode(self._buf, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            raise _Incomplete
+        if end == len(self._buf) and not final:
+            raise _Incomplete  # a number could go on in the next chunk
+        return value, end
+
+    def _error(self, pos: int, expected: str):
+        return json.JSONDecodeError(
+            "Expected %s in calendar response" % expected, self._buf, pos
+        )
+
+    def _parse(self, days: List[dict], final: bool):
+        buf = self._buf
+        pos = self._pos
+        try:
+            while True:
+                while pos < len(buf) and buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos == len(buf):
+                    return
+                c = buf[pos]
+                state = self._state
+
+                if state == _DAYS:
+                    if c == "]":
+                        self._state = _MONTH_KEY if self._key else _KEY
+                        pos += 1
+                    elif c == ",":
+                        pos += 1
+                    else:
+                        day, pos = self._decode(pos, final)
+                        days.append(day)
+                elif state == _START:
+                    if c != "{":
+                        raise self._error(pos, "'{'")
+                    self._state = _KEY
+                    pos += 1
+                elif state in (_KEY, _MONTH_KEY):
+                    if c == "}":
+                        self._state = _DONE if state == _KEY else _KEY
+                        self._key = None
+                        pos += 1
+                    elif c == ",":
+                        pos += 1
+                    else:
+                        self._key, pos = self._decode(pos, final)
+                        self._state = state + 1  # the colon
+                elif state in (_COLON, _MONTH_COLON):
+                    if c != ":":
+                        raise self._error(pos, "':'")
+                    if state == _MONTH_COLON:
+                        self._state = _MONTH_OPEN
+                    elif self._key == "data":
+                        self._state = _DATA
+                        self._key = None
+                    else:
+                        self._state = _VALUE
+                    pos += 1
+                elif state == _VALUE:
+                    _, pos = self._decode(pos, final)
+                    self._state = _KEY
+                elif state in (_DATA, _MONTH_OPEN):
+                    if c == "[":
+                        self._state = _DAYS
+                    elif c == "{" and state == _DATA:
+                        self._state = _MONTH_KEY
+                    else:
+                        raise self._error(pos, "a calendar")
+                    pos += 1
+                else:  # _DONE
+                    return
+        except _Incomplete:
+            return
+        finally:
+            self._pos = pos
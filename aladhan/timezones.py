@@ -0,0 +1,231 @@
+import re
+import sys
+from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
+from typing import Dict, Optional
+
+__all__ = (
+    "get_backend",
+    "set_backend",
+    "get_timezone",
+    "is_timezone",
+    "day_offset",
+    "utc_offset",
+)
+
+BACKENDS = ("pytz", "zoneinfo")
+
+_MISSING = object()
+_zoneinfo = _MISSING
+_backend: Optional[str] = None  # chosen on first use
+_timezones: Dict[str, tzinfo] = {}
+# what a zone name looks like, it also leaves out the files next to the
+# zones in a timezone database, such as posix/, right/ or localtime
+_NAME = re.compile(r"[A-Z][\w+\-]*(?:/[\w+\-]+)*\Z")
+
+
+def _import_zoneinfo():
+    global _zoneinfo
+    if _zoneinfo is _MISSING:
+        try:
+            import zoneinfo
+        except ImportError:
+            zoneinfo = None
+        else:
+            try:
+                zoneinfo.ZoneInfo("UTC")
+            except zoneinfo.ZoneInfoNotFoundError:  # no timezone database
+                zoneinfo = None
+        _zoneinfo = zoneinfo
+    return _zoneinfo
+
+
+def get_backend() -> str:
+    """Gives the name of the library timezones are made with, ``"pytz"``
+    or ``"zoneinfo"``.
+
+    Unless it was set with :func:`set_backend`, it's ``"zoneinfo"`` on
+    Python 3.9+ if a timezone database is found, ``"pytz"`` otherwise.
+
+    *New in v1.3.0*
+    """
+    global _backend
+    if _backend is None:
+        if sys.version_info >= (3, 9) and _import_zoneinfo() is not None:
+            _backend = "zoneinfo"
+        else:
+            _backend = "pytz"
+    return _backend
+
+
+def set_backend(name: Optional[str]):
+    """Sets the library timezones are made with.
+
+    Only timezones made after the call use it, the results are the same
+    with both.
+
+    Parameters
+    ----------
+        name: Optional[:class:`str`]
+            ``"pytz"``, ``"zoneinfo"`` or ``None`` to choose it the default
+            way, see :func:`get_backend`.
+
+    Raises
+    ------
+        :exc:`ValueError`
+            Unknown backend.
+
+        :exc:`ImportError`
+            `zoneinfo` or its timezone database isn't available.
+
+    *New in v1.3.0*
+    """
+    global _backend
+    if name is not None and name not in BACKENDS:
+        raise ValueError(
+            "Unknown timezone backend {!r}, expected one of {!r}.".format(
+                name, BACKENDS
+            )
+        )
+    if name == "zoneinfo" and _import_zoneinfo() is None:
+        raise ImportError(
+            "`zoneinfo` and a timezone database are required for the "
+            "zoneinfo backend, install `tzdata` if it's missing."
+        )
+    _backend = name
+    _timezones.clear()
+    is_timezone.cache_clear()
+    day_offset.cache_clear()
+
+
+def _is_pytz(tz: tzinfo) -> bool:
+    return hasattr(tz, "localize")
+
+
+def get_timezone(name: str) -> tzinfo:
+    """Gives the timezone of a name, made once per process.
+
+    It's a :class:`zoneinfo.ZoneInfo` or a pytz timezone, depending on
+    :func:`get_backend`.
+
+    Raises
+    ------
+        :exc:`KeyError`
+            Unknown timezone name, a :exc:`pytz.UnknownTimeZoneError` or a
+            :exc:`zoneinfo.ZoneInfoNotFoundError`.
+    """
+    tz = _timezones.get(name)
+    if tz is None:
+        if get_backend() == "pytz":
+            import pytz
+
+            tz = pytz.timezone(name)
+        else:
+            zoneinfo = _zoneinfo
+            try:
+                tz = zoneinfo.ZoneInfo(name)
+            except ValueError:  # not even a valid key, e.g. "../UTC"
+                raise zoneinfo.ZoneInfoNotFoundError(name) from None
+        _timezones[name] = tz
+    return tz
+
+
+@lru_cache(maxsize=1024)
+def is_timezone(name: str) -> bool:
+    """Whether a timezone name is known to the backend.
+
+    A name that can't be one is rejected right away. Otherwise pytz
+    looks it up in its list of names, built on first use, and zoneinfo
+    loads only that timezone, which :func:`get_timezone` gives back
+    afterwards. Results are kept, so checking a name again is cheap.
+
+    *New in v1.3.0*
+    """
+    if not isinstance(name, str) or _NAME.match(name) is None:
+        return False
+    if get_backend() == "pytz":
+        import pytz
+
+        return name in pytz.all_timezones_set
+    if name == "Factory":  # not a real zone, pytz doesn't have it
+        return False
+    try:
+        get_timezone(name)
+    except KeyError:
+        return False
+    return True
+
+
+def _offset(tz: tzinfo, time: datetime, strict: bool) -> Optional[timedelta]:
+    if _is_pytz(tz):
+        import pytz
+
+        try:
+            return tz.utcoffset(time, is_dst=None)
+        except pytz.exceptions.AmbiguousTimeError:
+            return tz.utcoffset(time, is_dst=False)
+        except pytz.exceptions.NonExistentTimeError:
+            return None if strict else tz.utcoffset(time, is_dst=False)
+
+    # zoneinfo gives the offsets on both sides of a switch through `fold`
+    later = time.replace(fold=1)
+    before = tz.utcoffset(time)
+    after = tz.utcoffset(later)
+    if before == after:
+        return before
+    if strict and before < after:  # skipped when the clocks went forward
+        return None
+    # like pytz's is_dst=False, a gap takes the offset from before it and
+    # an overlap the side that isn't DST. Checking `dst()` alone can't tell
+    # the gap from the overlap, some zones (Europe/Dublin) have a negative
+    # DST in winter.
+    if before < after:
+        return before
+    if not tz.dst(later):
+        return after
+    if not tz.dst(time):
+        return before
+    return after
+
+
+@lru_cache(maxsize=4096)
+def day_offset(tz: tzinfo, day: date) -> Optional[timedelta]:
+    """Gives the UTC offset of a whole day, ``None`` if it changes during
+    that day because of a DST switch."""
+    midnight = datetime(day.year, day.month, day.day)
+    offset = _offset(tz, midnight, False)
+    last = _offset(tz, midnight.replace(hour=23, minute=59), False)
+    return offset if offset == last else None
+
+
+def utc_offset(
+    tz: tzinfo, time: datetime, strict: bool = True
+) -> Optional[timedelta]:
+    """Gives the UTC offset of a local time.
+
+    The offset of the day is used, only a day with a DST switch needs one
+    for the time itself. A time that happens twice because of the switch
+    is read as standard time. Both backends give the same offsets.
+
+    Parameters
+    ----------
+        tz: :class:`datetime.tzinfo`
+            The timezone, from :func:`get_timezone`.
+
+        time: :class:`datetime.datetime`
+            A naive local time.
+
+        strict: :class:`bool`
+            Whether to give ``None`` for a time that doesn't exist
+            because of a DST switch, instead of the offset it would have
+            had before the switch.
+            Default: True
+
+    Returns
+    -------
+        Optional[:class:`datetime.timedelta`]
+    """
+    offset = day_offset(tz, time.date())
+    if offset is not None:
+        return offset
+    return _offset(tz, time, strict)
@@ -0,0 +1,5 @@
+"""Benchmarks of aladhan.py, run offline on payloads built by
+``tests.payloads``.
+
+Run one with ``python -m benchmarks.<name>`` from the repository root.
+"""
@@ -0,0 +1,51 @@
+import gc
+import time
+import tracemalloc
+
+
+def timeit(func, number=5):
+    """Best wall time of `number` calls of `func`, in seconds."""
+    best = float("inf")
+    for _ in range(number):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func):
+    """Peak memory allocated while calling `func`, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def retained_memory(func):
+    """Memory still allocated by what `func` returns, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()  # noqa: F841, kept alive until measured
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def report(title, rows, memory="peak"):
+    """Prints `rows` of ``(name, seconds, bytes)`` as a table, `bytes`
+    can be left out."""
+    print(title)
+    if all(len(row) == 2 for row in rows):
+        print("  %-28s %12s" % ("", "time (ms)"))
+        for name, seconds in rows:
+            print("  %-28s %12.2f" % (name, seconds * 1e3))
+        return
+    print("  %-28s %12s %12s" % ("", "time (ms)", memory + " (KiB)"))
+    for name, seconds, size in rows:
+        print("  %-28s %12.2f %12.1f" % (name, seconds * 1e3, size / 1024))
@@ -0,0 +1,85 @@
+"""Argument objects on a hot path, 10000 times each.
+
+Cold clears the interning caches every time, so it's the validation
+the constructors always did before. Warm is a lookup of arguments that
+were seen already. ``strptime`` is how date strings were validated.
+"""
+
+from datetime import datetime
+
+import aladhan
+from aladhan import data_classes
+
+from ._utils import report, timeit
+
+N = 10000
+
+
+def clear():
+    data_classes._interned.clear()
+    data_classes._validated.clear()
+
+
+def main():
+    tune = aladhan.Tune(Fajr=2)
+
+    def parameters_cold():
+        for _ in range(N):
+            clear()
+            aladhan.Parameters(aladhan.methods.MWL, tune, school=1)
+
+    def parameters_warm():
+        for _ in range(N):
+            aladhan.Parameters(aladhan.methods.MWL, tune, school=1)
+
+    params = aladhan.Parameters(aladhan.methods.MWL, tune, school=1)
+
+    def as_dict_rebuilt():
+        for _ in range(N):
+            dct = {
+                "method": params.method,
+                "tune": params.tune,
+                "school": params.school,
+                "midnightMode": params.midnightMode,
+                "latitudeAdjustmentMethod": params.latitudeAdjustmentMethod,
+                "adjustment": params.adjustment,
+            }
+            hash(tuple(dct.values()))
+
+    def as_dict_cached():
+        for _ in range(N):
+            params.as_dict
+            hash(params)
+
+    def date_strptime():
+        for _ in range(N):
+            datetime.strptime("01-05-2021", "%d-%m-%Y")
+
+    def date_cold():
+        for _ in range(N):
+            clear()
+            aladhan.TimingsDateArg("01-05-2021")
+
+    def date_warm():
+        for _ in range(N):
+            aladhan.TimingsDateArg("01-05-2021")
+
+    def calendar_date_warm():
+        for _ in range(N):
+            aladhan.CalendarDateArg(2021, 5).as_dict
+
+    rows = [
+        ("Parameters, cold", parameters_cold),
+        ("Parameters, warm", parameters_warm),
+        ("as_dict + hash, rebuilt", as_dict_rebuilt),
+        ("as_dict + hash, cached", as_dict_cached),
+        ("date check, strptime", date_strptime),
+        ("TimingsDateArg, cold", date_cold),
+        ("TimingsDateArg, warm", date_warm),
+        ("CalendarDateArg + as_dict", calendar_date_warm),
+    ]
+    report("%d times" % N, [(name, timeit(f)) for name, f in rows])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""The compact binary encoding against the raw JSON of an annual
+calendar.
+
+Decoding is timed up to Timings, the JSON way is decoding the payload
+then parsing every day. Size is the payload, also once compressed with zlib.
+"""
+
+import json
+import zlib
+
+import aladhan
+from aladhan import binary
+from aladhan.client import _decide_timings
+from tests.payloads import year_payload
+
+from ._utils import report, timeit
+
+
+def main():
+    data = json.loads(json.dumps(year_payload(2021, timezone="Europe/London")))
+    client = aladhan.Client()
+    raw = json.dumps(data).encode()
+    payload = binary.encode(data)
+
+    rows = [
+        ("JSON dumps", timeit(lambda: json.dumps(data)), len(raw)),
+        (
+            "JSON loads + parse",
+            timeit(lambda: _decide_timings(client, json.loads(raw))),
+            len(raw),
+        ),
+        (
+            "JSON zlib compress",
+            timeit(lambda: zlib.compress(raw)),
+            len(zlib.compress(raw)),
+        ),
+        ("binary encode", timeit(lambda: binary.encode(data)), len(payload)),
+        (
+            "binary decode",
+            timeit(lambda: binary.decode(payload)),
+            len(payload),
+        ),
+        (
+            "binary decode_columnar",
+            timeit(lambda: binary.decode_columnar(payload)),
+            len(payload),
+        ),
+        (
+            "binary zlib compress",
+            timeit(lambda: zlib.compress(payload)),
+            len(zlib.compress(payload)),
+        ),
+    ]
+    report("annual calendar, 365 days", rows, memory="size")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
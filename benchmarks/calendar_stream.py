@@ -0,0 +1,64 @@
+"""Eager vs streamed parsing of an annual calendar response.
+
+The eager path loads the whole body and builds every day's Timings
+before returning, the streamed one parses the body chunk by chunk and
+builds each day's Timings when it's reached, so only one day is alive
+at a time.
+"""
+
+import json
+
+import aladhan
+from aladhan.client import _decide_timings
+from aladhan.http import CHUNK_SIZE
+from aladhan.stream import CalendarParser
+from tests.payloads import month_payload, year_payload
+
+from ._utils import peak_memory, report, timeit
+
+TIMEZONE = "Asia/Riyadh"
+
+
+def recorded(data):
+    res = {"code": 200, "status": "OK", "data": data}
+    return json.dumps(res, ensure_ascii=False).encode()
+
+
+def chunks(body):
+    for i in range(0, len(body), CHUNK_SIZE):
+        yield body[i : i + CHUNK_SIZE]
+
+
+def main():
+    year = recorded(year_payload(2021, timezone=TIMEZONE))
+    month = recorded(month_payload(2021, 1, timezone=TIMEZONE))
+    client = aladhan.Client()
+
+    def eager(body=year):
+        _decide_timings(client, json.loads(body)["data"])
+
+    def streamed(body=year):
+        parser = CalendarParser()
+        for chunk in chunks(body):
+            for day in parser.feed(chunk):
+                aladhan.Data(**day, client=client).timings
+        parser.close()
+
+    print("annual payload: %.1f KiB" % (len(year) / 1024))
+    report(
+        "annual calendar, 365 days",
+        [
+            ("eager", timeit(eager), peak_memory(eager)),
+            ("streamed", timeit(streamed), peak_memory(streamed)),
+            (
+                "eager, one month (reference)",
+                timeit(lambda: eager(month)),
+                peak_memory(lambda: eager(month)),
+            ),
+        ],
+    )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Flattening an annual calendar into a table.
+
+The object path builds every day's Timings and walks its prayers for
+the local and UTC datetimes, the columnar one reads the raw days into
+int32 columns.
+"""
+
+import aladhan
+from aladhan.client import _decide_timings
+from aladhan.columnar import ColumnarCalendar
+from tests.payloads import year_payload
+
+from ._utils import report, retained_memory, timeit
+
+
+def main():
+    data = year_payload(
+        2021, timezone="America/New_York", latitude=40.71, longitude=-74
+    )
+    client = aladhan.Client()
+
+    def objects():
+        calendar = _decide_timings(client, data)
+        return [
+            (prayer.name, prayer.time, prayer.time_utc)
+            for month in calendar.values()
+            for timings in month
+            for prayer in timings
+        ]
+
+    def columns():
+        return ColumnarCalendar.from_raw(data).columns()
+
+    rows = [("Timings -> Prayer.time", objects), ("ColumnarCalendar", columns)]
+    report(
+        "annual calendar to a table (memory kept by the table)",
+        [(name, timeit(f), retained_memory(f)) for name, f in rows],
+        memory="kept",
+    )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Building the Timings of an annual calendar with ``_decide_timings``.
+
+Before, every Timings made its 11 Prayers right away, and each Prayer
+parsed the day's date and its time with ``strptime``, asked pytz for the
+offset and formatted ``str_time``. That's emulated on top of building,
+and kept alive as the Prayers were. Building only is what a caller that
+reads a few days pays now, reading every time is the worst case where
+every Prayer gets used.
+"""
+
+from datetime import datetime
+
+import pytz
+
+import aladhan
+from aladhan.client import _decide_timings
+from tests.payloads import year_payload
+
+from ._utils import peak_memory, report, timeit
+
+
+def _previous_prayer(readable, name, time, tz):
+    # what making a Prayer did before
+    d = datetime.strptime(readable, "%d %b %Y")
+    time = datetime.strptime(time[:5], "%H:%M").replace(d.year, d.month, d.day)
+    time_utc = time - tz.utcoffset(time)
+    return name, time, time_utc, time.strftime("%H:%M %d-%m-%Y")
+
+
+def main():
+    data = year_payload(2021, timezone="Asia/Riyadh")
+    client = aladhan.Client()
+
+    def build():
+        return _decide_timings(client, data)
+
+    def previous():
+        tz = pytz.timezone("Asia/Riyadh")
+        prayers = [
+            _previous_prayer(day["date"]["readable"], name, time, tz)
+            for month in data.values()
+            for day in month
+            for name, time in day["timings"].items()
+        ]
+        return build(), prayers
+
+    def read_all():
+        for month in build().values():
+            for timings in month:
+                for prayer in timings:
+                    prayer.time_utc, prayer.str_time
+
+    rows = [
+        ("eager Prayers, previous", previous),
+        ("build", build),
+        ("build, read every time", read_all),
+    ]
+    report(
+        "annual calendar, 365 days",
+        [(name, timeit(f), peak_memory(f)) for name, f in rows],
+    )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Writing timetables of many locations to CSV.
+
+Every location's annual calendar comes from a generator, the naive path
+builds its Timings and writes ``Timings.as_dict`` rows with a
+``csv.DictWriter``, the writers take the raw days and write them in
+batches.
+"""
+
+import csv
+import os
+
+import aladhan
+from aladhan.client import _decide_timings
+from aladhan.export import CSVWriter, NDJSONWriter
+from tests.payloads import year_payload
+
+from ._utils import peak_memory, report, timeit
+
+LOCATIONS = 10
+
+
+def calendars():
+    for i in range(LOCATIONS):
+        yield i, year_payload(2021, timezone="Asia/Riyadh", latitude=20 + i)
+
+
+def main():
+    client = aladhan.Client()
+
+    def naive():
+        with open(os.devnull, "w", newline="") as file:
+            writer = None
+            for i, data in calendars():
+                for month in _decide_timings(client, data).values():
+                    for timings in month:
+                        row = {"location": i}
+                        row.update(
+                            (name, prayer.str_time)
+                            for name, prayer in timings.as_dict.items()
+                        )
+                        if writer is None:
+                            writer = csv.DictWriter(file, list(row))
+                            writer.writeheader()
+                        writer.writerow(row)
+
+    def written(cls):
+        def write():
+            with cls(os.devnull, columns=["location"]) as writer:
+                for i, data in calendars():
+                    writer.write(data, location=i)
+
+        return write
+
+    def payloads_only():
+        for _ in calendars():
+            pass
+
+    rows = [
+        ("building payloads only", payloads_only),
+        ("Timings.as_dict + DictWriter", naive),
+        ("CSVWriter", written(CSVWriter)),
+        ("NDJSONWriter", written(NDJSONWriter)),
+    ]
+    report(
+        "%d annual calendars (%d rows)" % (LOCATIONS, LOCATIONS * 365),
+        [(name, timeit(f, 3), peak_memory(f)) for name, f in rows],
+    )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
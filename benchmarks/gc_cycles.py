@@ -0,0 +1,81 @@
+"""Garbage collector work while annual calendars are built and dropped,
+with the Data of a day in reference cycles as before and with
+weak_backrefs.
+
+Every round builds the Timings of an annual calendar, reads the UTC time
+of every prayer, then drops it. Collections and pauses are counted
+through gc.callbacks, collected is what only the collector could free.
+"""
+
+import gc
+import json
+import time
+
+import aladhan
+from aladhan.client import _decide_timings
+from tests.payloads import year_payload
+
+ROUNDS = 20
+
+
+class GCStats:
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.collected = 0
+        self.pause = 0.0
+        self._start = None
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.pause += time.perf_counter() - self._start
+            self.collections[info["generation"]] += 1
+            self.collected += info["collected"]
+
+
+def run(data, weak_backrefs):
+    client = aladhan.Client(weak_backrefs=weak_backrefs)
+    stats = GCStats()
+    gc.collect()
+    gc.callbacks.append(stats)
+    start = time.perf_counter()
+    try:
+        for _ in range(ROUNDS):
+            calendar = _decide_timings(client, data)
+            for month in calendar.values():
+                for timings in month:
+                    for prayer in timings:
+                        prayer.time_utc
+            del calendar
+        gc.collect()
+    finally:
+        gc.callbacks.remove(stats)
+    client.close()
+    return time.perf_counter() - start, stats
+
+
+def main():
+    data = json.loads(json.dumps(year_payload(2021, timezone="Europe/London")))
+    print("%d annual calendars, built and dropped" % ROUNDS)
+    print(
+        "  %-14s %10s %10s %12s %10s %10s"
+        % ("", "time (ms)", "gc (ms)", "collections", "gen 2", "collected")
+    )
+    for name, weak in (("cycles", False), ("weak_backrefs", True)):
+        elapsed, stats = run(data, weak)
+        print(
+            "  %-14s %10.2f %10.2f %12d %10d %10d"
+            % (
+                name,
+                elapsed * 1e3,
+                stats.pause * 1e3,
+                sum(stats.collections),
+                stats.collections[2],
+                stats.collected,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
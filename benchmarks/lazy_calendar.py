@@ -0,0 +1,56 @@
+"""Eager vs lazy building of an annual calendar.
+
+Both start from the decoded response, the eager path builds the Timings
+of all 365 days while the lazy one only wraps the days, then builds the
+ones that are read.
+"""
+
+import aladhan
+from aladhan.client import _decide_timings
+from tests.payloads import year_payload
+
+from ._utils import report, retained_memory, timeit
+
+TIMEZONE = "Asia/Riyadh"
+
+
+def main():
+    data = year_payload(2021, timezone=TIMEZONE)
+    eager_client = aladhan.Client()
+    lazy_client = aladhan.Client(lazy_calendars=True)
+
+    def eager():
+        return _decide_timings(eager_client, data)
+
+    def lazy():
+        return _decide_timings(lazy_client, data)
+
+    def lazy_one_day():
+        calendar = lazy()
+        calendar["5"][17].fajr
+        return calendar
+
+    def lazy_all_days():
+        calendar = lazy()
+        for month in calendar.values():
+            for timings in month:
+                timings.fajr
+        return calendar
+
+    rows = [
+        ("eager", eager),
+        ("lazy, built only", lazy),
+        ("lazy, one day read", lazy_one_day),
+        ("lazy, every day read", lazy_all_days),
+    ]
+    report(
+        "annual calendar, 365 days (memory kept by the result)",
+        [(name, timeit(f), retained_memory(f)) for name, f in rows],
+        memory="kept",
+    )
+    eager_client.close()
+    lazy_client.close()
+
+
+if __name__ == "__main__":
+    main()
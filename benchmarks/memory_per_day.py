@@ -0,0 +1,63 @@
+"""Bytes held per day by the results of an annual calendar, and by a
+next prayer result.
+
+The calendar is built once beforehand so the shared caches (timezones,
+DateTypes) are warm and only what the results hold is counted.
+"""
+
+import datetime
+import json
+
+import aladhan
+from aladhan.client import _decide_timings
+from tests.payloads import day_payload, year_payload
+
+from ._utils import retained_memory
+
+
+def main():
+    data = json.loads(json.dumps(year_payload(2021, timezone="Europe/London")))
+    client = aladhan.Client()
+    _decide_timings(client, data)
+
+    def timings():
+        return _decide_timings(client, data)
+
+    def prayers():
+        calendar = _decide_timings(client, data)
+        for month in calendar.values():
+            for day in month:
+                list(day)
+        return calendar
+
+    def prayers_utc():
+        calendar = _decide_timings(client, data)
+        for month in calendar.values():
+            for day in month:
+                for prayer in day:
+                    prayer.time_utc
+                    prayer.str_time
+        return calendar
+
+    day = day_payload(datetime.date(2021, 1, 9))
+    day["timings"] = {"Isha": day["timings"]["Isha"]}
+    aladhan.NextPrayerData(**day, client=client)
+
+    def next_prayers():
+        return [
+            aladhan.NextPrayerData(**day, client=client) for _ in range(365)
+        ]
+
+    print("bytes per day, annual calendar")
+    for name, func in (
+        ("Timings", timings),
+        ("+ Prayers", prayers),
+        ("+ time_utc, str_time", prayers_utc),
+        ("NextPrayerData", next_prayers),
+    ):
+        print("  %-28s %12.0f" % (name, retained_memory(func) / 365))
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Finding the next prayer of an annual calendar at many times, by
+scanning the prayers of the days and with a PrayerIndex.
+
+The full scan goes through the days in order like Timings.next_prayer
+goes through the prayers of one day. The day scan already knows the day
+of the time and only looks at it and the next one, after isha. The
+index is built once beforehand, building it is timed on its own.
+"""
+
+import datetime
+import json
+import random
+
+from aladhan import calendars
+from aladhan.events import PrayerIndex
+from tests.payloads import year_payload
+
+from ._utils import report, timeit
+
+LOOKUPS = 1000
+
+
+def main():
+    data = json.loads(json.dumps(year_payload(2021, timezone="Europe/London")))
+    calendar = calendars.from_raw(data)
+    days = [t for m in sorted(calendar, key=int) for t in calendar[m]]
+    prayers = [p for t in days for p in t.prayers_only.values()]
+    for prayer in prayers:  # UTC times cached for the scans too
+        prayer.time_utc
+    index = PrayerIndex(calendar)
+
+    rng = random.Random(0)
+    start = datetime.datetime(2021, 1, 1)
+    nows = [
+        start + datetime.timedelta(minutes=rng.randrange(364 * 1440))
+        for _ in range(LOOKUPS)
+    ]
+    first = start.toordinal()
+
+    def full_scan():
+        for now in nows:
+            next(p for p in prayers if now < p.time_utc)
+
+    def day_scan():
+        for now in nows:
+            i = (now.toordinal() - first) * 5
+            next(p for p in prayers[i : i + 10] if now < p.time_utc)
+
+    def lookups(method):
+        return lambda: [method(now) for now in nows]
+
+    rows = [
+        ("build index", timeit(lambda: PrayerIndex(calendar))),
+        ("full scan", timeit(full_scan)),
+        ("day scan", timeit(day_scan)),
+        ("index next_prayer", timeit(lookups(index.next_prayer))),
+        ("index window", timeit(lookups(index.window))),
+        ("index remaining", timeit(lookups(index.remaining))),
+    ]
+    report("%d lookups, annual calendar" % LOOKUPS, rows)
+
+
+if __name__ == "__main__":
+    main()
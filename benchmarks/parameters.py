@@ -0,0 +1,80 @@
+"""Cold and warm Parameters construction.
+
+Cold is the first one made by a fresh interpreter once aladhan is
+imported, the best of a few runs. It's where a timezone name used to be
+looked up in ``pytz.all_timezones_set``, which is built on first use
+by opening every zone file. Warm makes 10000 of them, clearing the
+interning caches every time so they are validated again.
+"""
+
+import subprocess
+import sys
+
+import pytz
+
+import aladhan
+from aladhan import data_classes, timezones
+
+from ._utils import report, timeit
+
+COLD = """
+import time
+import aladhan
+start = time.perf_counter()
+%s
+print(time.perf_counter() - start)
+"""
+N = 10000
+
+
+def cold(code, number=5):
+    return min(
+        float(
+            subprocess.check_output(
+                [sys.executable, "-c", COLD % code]
+            ).decode()
+        )
+        for _ in range(number)
+    )
+
+
+def main():
+    def warm(**kwargs):
+        def func():
+            for _ in range(N):
+                data_classes._interned.clear()
+                data_classes._validated.clear()
+                aladhan.Parameters(**kwargs)
+
+        return func
+
+    def pytz_lookup():
+        for _ in range(N):
+            "Europe/London" in pytz.all_timezones_set
+
+    rows = [
+        ("cold, no timezone", cold("aladhan.Parameters()")),
+        (
+            "cold, pytz set",
+            cold("import pytz; 'Europe/London' in pytz.all_timezones_set"),
+        ),
+    ]
+    for backend in timezones.BACKENDS:
+        code = (
+            "aladhan.timezones.set_backend(%r); "
+            "aladhan.Parameters(timezonestring='Europe/London')" % backend
+        )
+        rows.append(("cold, timezone, %s" % backend, cold(code)))
+    rows += [
+        ("warm x%d, no timezone" % N, timeit(warm())),
+        ("warm x%d, pytz set lookup" % N, timeit(pytz_lookup)),
+        (
+            "warm x%d, timezone" % N,
+            timeit(warm(timezonestring="Europe/London")),
+        ),
+    ]
+    report("Parameters()", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Sending the Timings of an annual calendar to another process.
+
+As JSON, the raw days are decoded and every day is parsed again. As a
+pickle, the Timings are rebuilt from what they hold, without the client.
+Size is the payload sent, in both cases.
+"""
+
+import json
+import pickle
+
+import aladhan
+from aladhan.client import _decide_timings
+from tests.payloads import year_payload
+
+from ._utils import report, timeit
+
+
+def main():
+    data = json.loads(json.dumps(year_payload(2021, timezone="Europe/London")))
+    client = aladhan.Client()
+    calendar = _decide_timings(client, data)
+    raw = json.dumps(data).encode()
+    payload = pickle.dumps(calendar, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def from_json():
+        _decide_timings(client, json.loads(raw))
+
+    def dumps():
+        pickle.dumps(calendar, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads():
+        pickle.loads(payload)
+
+    report(
+        "annual calendar, 365 days",
+        [
+            ("JSON loads + parse", timeit(from_json), len(raw)),
+            ("pickle dumps", timeit(dumps), len(payload)),
+            ("pickle loads", timeit(loads), len(payload)),
+        ],
+        memory="size",
+    )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Rebuilding an annual calendar from stored payloads.
+
+The client path builds the days without checking them, from_raw checks
+the shape of every day first. to_raw is the way back.
+"""
+
+import json
+
+from aladhan import calendars
+from aladhan.calendars import _from_raw
+from tests.payloads import year_payload
+
+from ._utils import report, timeit
+
+
+def main():
+    data = json.loads(json.dumps(year_payload(2021, timezone="Europe/London")))
+    calendar = calendars.from_raw(data)
+
+    rows = [
+        ("unchecked", timeit(lambda: _from_raw(data, None, False))),
+        ("from_raw", timeit(lambda: calendars.from_raw(data))),
+        ("from_raw lazy", timeit(lambda: calendars.from_raw(data, lazy=True))),
+        ("to_raw", timeit(lambda: calendars.to_raw(calendar))),
+    ]
+    report("annual calendar, 365 days", rows)
+
+
+if __name__ == "__main__":
+    main()
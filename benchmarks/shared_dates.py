@@ -0,0 +1,44 @@
+"""Dates of the same day for many locations, with DateTypes made for
+every response as before and shared across them.
+
+Every location has its own JSON-decoded day, as when it comes from the
+API, and only the :class:`Date` objects are kept.
+"""
+
+import datetime
+import json
+
+from aladhan import data_classes
+from aladhan.data_classes import Date, DateType
+from tests.payloads import day_payload
+
+from ._utils import report, retained_memory, timeit
+
+LOCATIONS = 10000
+
+
+def main():
+    day = day_payload(datetime.date(2021, 6, 9), timezone="Asia/Riyadh")
+    dates = [json.loads(json.dumps(day["date"])) for _ in range(LOCATIONS)]
+
+    def shared():
+        return [Date(**date) for date in dates]
+
+    def per_response():
+        data_classes._date_type = lambda name, raw: DateType(name, **raw)
+        try:
+            return [Date(**date) for date in dates]
+        finally:
+            data_classes._date_type = date_type
+
+    date_type = data_classes._date_type
+    rows = [("DateTypes per response", per_response), ("shared", shared)]
+    report(
+        "a day at %d locations" % LOCATIONS,
+        [(name, timeit(f), retained_memory(f)) for name, f in rows],
+        memory="retained",
+    )
+
+
+if __name__ == "__main__":
+    main()
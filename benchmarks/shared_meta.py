@@ -0,0 +1,40 @@
+"""Memory held by the Timings of an annual calendar, with a Meta per day
+as before and with the days sharing one.
+
+The calendar is JSON decoded again so every day has its own meta dict,
+as it does when it comes from the API.
+"""
+
+import json
+
+import aladhan
+from aladhan.client import _decide_timings
+from tests.payloads import year_payload
+
+from ._utils import report, retained_memory, timeit
+
+
+def main():
+    data = json.loads(json.dumps(year_payload(2021, timezone="Asia/Riyadh")))
+    client = aladhan.Client()
+
+    def meta_per_day():
+        return {
+            month: [aladhan.Data(**day, client=client).timings for day in days]
+            for month, days in data.items()
+        }
+
+    def shared_meta():
+        return _decide_timings(client, data)
+
+    rows = [("Meta per day", meta_per_day), ("shared Meta", shared_meta)]
+    report(
+        "annual calendar, 365 days",
+        [(name, timeit(f), retained_memory(f)) for name, f in rows],
+        memory="retained",
+    )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
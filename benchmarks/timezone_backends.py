@@ -0,0 +1,66 @@
+"""The pytz and zoneinfo timezone backends.
+
+Import is the cost of a fresh interpreter making its first timezone
+once aladhan itself is imported, the best of a few runs. Construction
+makes the :class:`Data` of an annual calendar that crosses both DST
+switches (Europe/London), then reads the UTC time of every prayer.
+"""
+
+import subprocess
+import sys
+
+from aladhan import Data, timezones
+from tests.payloads import year_payload
+
+from ._utils import report, timeit
+
+IMPORT = """
+import time
+import aladhan.timezones as timezones
+start = time.perf_counter()
+timezones.set_backend(%r)
+timezones.get_timezone("Europe/London")
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(backend, number=5):
+    return min(
+        float(
+            subprocess.check_output(
+                [sys.executable, "-c", IMPORT % backend]
+            ).decode()
+        )
+        for _ in range(number)
+    )
+
+
+def main():
+    data = year_payload(2021, timezone="Europe/London")
+    days = [day for month in data.values() for day in month]
+
+    def construct():
+        for day in days:
+            Data(**day, client=None)
+
+    def construct_utc():
+        timezones.day_offset.cache_clear()
+        for day in days:
+            for prayer in Data(**day, client=None).timings:
+                prayer.time_utc
+
+    rows = []
+    for backend in timezones.BACKENDS:
+        try:
+            timezones.set_backend(backend)
+        except ImportError:
+            continue
+        rows.append(("%s import" % backend, import_time(backend)))
+        rows.append(("%s Data" % backend, timeit(construct)))
+        rows.append(("%s Data + time_utc" % backend, timeit(construct_utc)))
+    timezones.set_backend(None)
+    report("Europe/London 2021, 365 days", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Timezones and UTC offsets over an annual calendar that crosses both
+DST switches (Europe/London).
+
+The previous way made a pytz timezone for every day and asked it for
+the offset of every time, now timezones are made once per process and
+the offset once per day, only the two switch days need one per time.
+"""
+
+import pytz
+
+import aladhan
+from aladhan.client import _decide_timings
+from aladhan.timezones import day_offset, get_timezone
+from tests.payloads import year_payload
+
+from ._utils import report, timeit
+
+
+def main():
+    data = year_payload(2021, timezone="Europe/London")
+    days = [day for month in data.values() for day in month]
+    client = aladhan.Client()
+    calendar = _decide_timings(client, data)
+    times = [p.time for month in calendar.values() for t in month for p in t]
+
+    def timezones_previous():
+        for day in days:
+            pytz.timezone(day["meta"]["timezone"])
+
+    def timezones_cached():
+        for day in days:
+            get_timezone(day["meta"]["timezone"])
+
+    def offsets_previous():
+        tz = pytz.timezone("Europe/London")
+        for time in times:
+            try:
+                time - tz.utcoffset(time)
+            except (pytz.AmbiguousTimeError, pytz.NonExistentTimeError):
+                pass
+
+    def offsets_per_day():
+        day_offset.cache_clear()
+        for month in _decide_timings(client, data).values():
+            for timings in month:
+                for prayer in timings:
+                    prayer.time_utc
+
+    def build_only():
+        _decide_timings(client, data)
+
+    rows = [
+        ("timezone per day, pytz", timezones_previous),
+        ("timezone per day, cached", timezones_cached),
+        ("offset per time, pytz", offsets_previous),
+        ("building Timings only", build_only),
+        ("Timings + time_utc per day", offsets_per_day),
+    ]
+    report(
+        "Europe/London 2021, 365 days, %d times" % len(times),
+        [(name, timeit(f)) for name, f in rows],
+    )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""Builds API shaped payloads so tests and benchmarks can run offline.
+
+The times are a smooth approximation, not real prayer times, but they
+move through the year and follow the timezone's DST switches like the
+real API responses do.
+"""
+
+import asyncio
+import calendar
+import datetime
+import math
+
+import pytz
+
+from aladhan.methods import all_methods
+
+NAMES = (
+    "Fajr",
+    "Sunrise",
+    "Dhuhr",
+    "Asr",
+    "Sunset",
+    "Maghrib",
+    "Isha",
+    "Imsak",
+    "Midnight",
+    "Firstthird",
+    "Lastthird",
+)
+TUNED = (
+    "Imsak",
+    "Fajr",
+    "Sunrise",
+    "Dhuhr",
+    "Asr",
+    "Maghrib",
+    "Sunset",
+    "Isha",
+    "Midnight",
+)
+_HIJRI_MONTHS = (
+    ("Muḥarram", "مُحَرَّم"),
+    ("Ṣafar", "صَفَر"),
+    ("Rabīʿ al-awwal", "رَبيع الأوّل"),
+    ("Rabīʿ al-thānī", "رَبيع الثاني"),
+    ("Jumādá al-ūlá", "جُمادى الأولى"),
+    ("Jumādá al-ākhirah", "جُمادى الآخرة"),
+    ("Rajab", "رَجَب"),
+    ("Shaʿbān", "شَعْبان"),
+    ("Ramaḍān", "رَمَضان"),
+    ("Shawwāl", "شَوّال"),
+    ("Dhū al-Qaʿdah", "ذوالقعدة"),
+    ("Dhū al-Ḥijjah", "ذوالحجة"),
+)
+_HIJRI_WEEKDAYS = (
+    ("Al Athnayn", "الاثنين"),
+    ("Al Thalaata", "الثلاثاء"),
+    ("Al Arba'a", "الاربعاء"),
+    ("Al Khamees", "الخميس"),
+    ("Al Juma'a", "الجمعة"),
+    ("Al Sabt", "السبت"),
+    ("Al Ahad", "الاحد"),
+)
+
+
+def _hijri(date):
+    # tabular islamic calendar
+    jd = date.toordinal() + 1721425 - 1948440 + 10632
+    n = (jd - 1) // 10631
+    jd = jd - 10631 * n + 354
+    j = ((10985 - jd) // 5316) * ((50 * jd) // 17719) + (jd // 5670) * (
+        (43 * jd) // 15238
+    )
+    jd = (
+        jd
+        - ((30 - j) // 15) * ((17719 * j) // 50)
+        - (j // 16) * ((15238 * j) // 43)
+        + 29
+    )
+    month = (24 * jd) // 709
+    day = jd - (709 * month) // 24
+    year = 30 * n + j - 30
+    return day, month, year
+
+
+def _minutes(date, latitude, longitude):
+    doy = date.timetuple().tm_yday
+    season = math.cos(2 * math.pi * (doy + 10) / 365.25)
+    noon = 12 * 60 - longitude * 4 + 5 * math.sin(4 * math.pi * doy / 365)
+    day = 6 * 60 - season * abs(latitude) * 2.6  # half day length
+    fajr = noon - day - 90
+    sunrise = noon - day
+    sunset = noon + day
+    isha = sunset + 90
+    night = (24 * 60 - (sunset - sunrise)) / 3
+    return dict(
+        Fajr=fajr,
+        Sunrise=sunrise,
+        Dhuhr=noon + 5,
+        Asr=noon + day * 0.55,
+        Sunset=sunset,
+        Maghrib=sunset + 2,
+        Isha=isha,
+        Imsak=fajr - 10,
+        Midnight=sunset + night * 1.5,
+        Firstthird=sunset + night,
+        Lastthird=sunset + night * 2,
+    )
+
+
+def _fmt(minutes):
+    minutes = int(round(minutes)) % (24 * 60)
+    return "%02d:%02d" % divmod(minutes, 60)
+
+
+def day_payload(
+    date,
+    latitude=51.5072,
+    longitude=-0.1276,
+    timezone="Europe/London",
+    method=2,
+    offset=None,
+):
+    """Builds a timings response for `date` (a datetime.date)."""
+    tz = pytz.timezone(timezone)
+    noon = tz.localize(datetime.datetime(date.year, date.month, date.day, 12))
+    shift = noon.utcoffset().total_seconds() / 60
+    abbr = noon.tzname()
+    offset = dict.fromkeys(TUNED, 0) if offset is None else offset
+
+    timings = {
+        name: "%s (%s)" % (_fmt(m + shift + offset.get(name, 0)), abbr)
+        for name, m in _minutes(date, latitude, longitude).items()
+    }
+    h_day, h_month, h_year = _hijri(date)
+    greg = date.strftime("%d-%m-%Y")
+    m = all_methods.get(method)
+    return {
+        "timings": timings,
+        "date": {
+            "readable": date.strftime("%d %b %Y"),
+            "timestamp": str(calendar.timegm(date.timetuple()) + 60),
+            "gregorian": {
+                "date": greg,
+                "format": "DD-MM-YYYY",
+                "day": "%02d" % date.day,
+                "weekday": {"en": date.strftime("%A")},
+                "month": {"number": date.month, "en": date.strftime("%B")},
+                "year": str(date.year),
+                "designation": {
+                    "abbreviated": "AD",
+                    "expanded": "Anno Domini",
+                },
+                "lunarSighting": False,
+            },
+            "hijri": {
+                "date": "%02d-%02d-%d" % (h_day, h_month, h_year),
+                "format": "DD-MM-YYYY",
+                "day": "%02d" % h_day,
+                "weekday": dict(
+                    zip(("en", "ar"), _HIJRI_WEEKDAYS[date.weekday()])
+                ),
+                "month": dict(
+                    zip(("en", "ar"), _HIJRI_MONTHS[h_month - 1]),
+                    number=h_month,
+                ),
+                "year": str(h_year),
+                "designation": {
+                    "abbreviated": "AH",
+                    "expanded": "Anno Hegirae",
+                },
+                "holidays": [],
+                "adjustedHolidays": [],
+                "method": "HJCoSA",
+            },
+        },
+        "meta": {
+            "latitude": latitude,
+            "longitude": longitude,
+            "timezone": timezone,
+            "method": {
+                "id": method,
+                "name": m and m.name or "Custom",
+                "params": m and m.params or {},
+                "location": {"latitude": latitude, "longitude": longitude},
+            },
+            "latitudeAdjustmentMethod": "ANGLE_BASED",
+            "midnightMode": "STANDARD",
+            "school": "STANDARD",
+            "offset": offset,
+        },
+    }
+
+
+def asma_payload(n):
+    """Builds one of the asma of an asma response."""
+    return {
+        "name": "اسم %d" % n,
+        "transliteration": "Ism %d" % n,
+        "number": n,
+        "en": {"meaning": "Name %d" % n},
+    }
+
+
+def month_payload(year, month, **kwargs):
+    """Builds a month calendar response."""
+    days = calendar.monthrange(year, month)[1]
+    return [
+        day_payload(datetime.date(year, month, d), **kwargs)
+        for d in range(1, days + 1)
+    ]
+
+
+def year_payload(year, **kwargs):
+    """Builds an annual calendar response."""
+    return {
+        str(month): month_payload(year, month, **kwargs)
+        for month in range(1, 13)
+    }
+
+
+class FakeAPI:
+    """Stands in for ``HTTPClient.request``, answering timings and calendar
+    requests with built payloads and recording every call."""
+
+    def __init__(self, is_async=False, delay=0.01, **kwargs):
+        self.calls = []
+        self.in_flight = self.max_in_flight = 0
+        self.is_async = is_async
+        self.delay = delay
+        self.kwargs = kwargs
+
+    def respond(self, endpoint, params=None):
+        self.calls.append((endpoint, params))
+        if "/asmaAlHusna/" in endpoint:
+            numbers = endpoint.rsplit("/", 1)[1].split(",")
+            return [asma_payload(int(n)) for n in numbers]
+
+        kwargs = dict(self.kwargs)
+        if "tune" in params:
+            tune = map(int, str(params["tune"]).split(","))
+            kwargs["offset"] = dict(zip(TUNED, tune))
+        if "/timings" in endpoint:
+            date = endpoint.rsplit("/", 1)[1]
+            d, m, y = map(int, date.split("-"))
+            return day_payload(datetime.date(y, m, d), **kwargs)
+        year = int(params["year"])
+        if str(params["annual"]) == "true":
+            return year_payload(year, **kwargs)
+        return month_payload(year, int(params["month"]), **kwargs)
+
+    def __call__(self, endpoint, params=None):
+        if not self.is_async:
+            return self.respond(endpoint, params)
+
+        async def request():
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(self.delay)
+            finally:
+                self.in_flight -= 1
+            return self.respond(endpoint, params)
+
+        return request()
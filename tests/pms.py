@@ -13,11 +13,17 @@ TIMINGS_DATE = (
         [datetime.datetime(2021, 5, 1), "01-05-2021"],
         [1619827200, "01-05-2021"],
         ["01-05-2021", "01-05-2021"],
+        ["1-5-2021", "1-5-2021"],
     ],
 )
 ERROR_TIMINGS_DATE = (
     ["arg", "expected"],
-    [["ERROR", ValueError]],
+    [
+        ["ERROR", ValueError],
+        ["31-02-2021", ValueError],
+        ["2021-05-01", ValueError],
+        ["01-05-2021 ", ValueError],
+    ],
 )
 CALENDAR_DATE = (
     ["kwargs", "expected"],
@@ -221,3 +227,121 @@ GET_TIMINGS_BY_CITY = (
         [("London", "GB", None, None, None), dict()],
     ],
 )
+
+# -------------- cache
+
+CANONICAL_PARAMS = (
+    ["a", "b"],
+    [
+        [dict(longitude=34, latitude=4), dict(latitude="4.0", longitude=34.0)],
+        [dict(school=aladhan.Schools.HANAFI), dict(school=1)],
+        [dict(method=aladhan.methods.MWL), dict(method=3)],
+        [dict(method=3, state=None), dict(method="3")],
+        [
+            aladhan.Parameters(method=aladhan.methods.MWL).as_dict,
+            aladhan.Parameters(method=3).as_dict,
+        ],
+        [dict(tune=aladhan.Tune(1)), dict(tune="1,0,0,0,0,0,0,0,0")],
+        [dict(annual=True), dict(annual="true")],
+    ],
+)
+QUANTIZE = (
+    ["value", "precision", "expected"],
+    [
+        [34.0000001, 0.01, "34"],
+        [34.004, 0.01, "34"],
+        [34.006, 0.01, "34.01"],
+        ["3.5869", 0.01, "3.59"],
+        [-0.001, 0.01, "0"],
+        [51.2, 0.5, "51"],
+        [51.3, 0.5, "51.5"],
+    ],
+)
+
+# -------------- planner
+
+CALENDAR_REQUESTS = (
+    ["start", "end", "expected"],
+    [
+        [(2026, 3, 15), (2026, 3, 20), [(2026, 3)]],
+        [(2026, 3, 15), (2026, 7, 2), [(2026, m) for m in range(3, 8)]],
+        [(2026, 3, 15), (2026, 8, 2), [(2026, 0)]],
+        [(2025, 12, 20), (2026, 1, 10), [(2025, 12), (2026, 1)]],
+        [
+            (2025, 11, 1),
+            (2027, 1, 1),
+            [(2025, 11), (2025, 12), (2026, 0), (2027, 1)],
+        ],
+    ],
+)
+LOCATIONS = (
+    ["location", "kind"],
+    [
+        ["London", "address"],
+        [(34, 4), "coordinates"],
+        [[34.5, 4.25], "coordinates"],
+        [("London", "GB"), "city"],
+        [("London", "GB", "Bexley"), "city"],
+    ],
+)
+
+# -------------- stream
+
+CHUNK_SIZES = ("size", [1, 7, 1000, 16 * 1024, 10**7])
+# byte by byte feeding of a whole year is too slow for the test suite
+YEAR_CHUNK_SIZES = ("size", [997, 16 * 1024, 10**7])
+BAD_BODIES = (
+    "body",
+    [
+        b'{"code": 200, "data": [{"a": 1}',
+        b'{"code": 200, "data": [{"a": 1}, {"b": }]}',
+        b'{"code": 200, "data": "Nope"}',
+        b'[{"a": 1}]',
+    ],
+)
+
+# -------------- timezones
+
+DAY_OFFSETS = (
+    ["timezone", "day", "expected"],
+    [
+        ["Europe/London", (2021, 1, 5), 0],
+        ["Europe/London", (2021, 3, 27), 0],
+        ["Europe/London", (2021, 3, 28), None],
+        ["Europe/London", (2021, 3, 29), 1],
+        ["Europe/London", (2021, 10, 31), None],
+        ["Asia/Riyadh", (2021, 3, 28), 3],
+        ["America/Santiago", (2021, 9, 5), None],  # switches at midnight
+    ],
+)
+UTC_OFFSETS = (
+    ["time", "strict", "expected"],
+    [
+        [(2021, 3, 28, 0, 30), True, 0],
+        [(2021, 3, 28, 1, 30), True, None],
+        [(2021, 3, 28, 1, 30), False, 0],
+        [(2021, 3, 28, 2, 30), True, 1],
+        [(2021, 10, 31, 0, 30), True, 1],
+        [(2021, 10, 31, 1, 30), True, 0],
+        [(2021, 10, 31, 2, 30), True, 0],
+        [(2021, 7, 1, 12, 0), True, 1],
+    ],
+)
+# zones whose DST switches give the same offsets with both backends
+TIMEZONE_NAMES = (
+    ["name", "expected"],
+    [
+        ["Europe/London", True],
+        ["America/Argentina/Buenos_Aires", True],
+        ["Etc/GMT+3", True],
+        ["UTC", True],
+        ["Europe/Nowhere", False],
+        ["ta7ya ms3d", False],
+        ["../Europe/London", False],
+        ["/etc/localtime", False],
+        ["localtime", False],
+        ["posix/Europe/London", False],
+        ["Factory", False],
+        [5, False],
+    ],
+)
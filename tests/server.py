@@ -0,0 +1,95 @@
+"""A local stand-in for the API, used by tests that need a real HTTP
+round trip without hitting api.aladhan.com."""
+
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+
+class StandInServer:
+    """Serves ``routes`` under ``/v1/`` with a fixed window rate limit.
+
+    A route is a callable taking the path and query dict and returning
+    a ``(status, data)`` tuple. Unknown routes answer 200 with ``{}``.
+    """
+
+    def __init__(self, limit=14, window=1.0):
+        self.limit = limit
+        self.window = window
+        self.delay = 0.0  # or a callable returning seconds per request
+        self.routes = {}
+        self.hits = []
+        self.throttled = 0
+        self._window_start = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self.url = "http://127.0.0.1:%d/v1/" % self._httpd.server_port
+
+    def _take(self):
+        with self._lock:
+            now = time.monotonic()
+            start = now - now % self.window
+            if start != self._window_start:
+                self._window_start, self._count = start, 0
+            self._count += 1
+            remaining = self.limit - self._count
+            reset = math.ceil(start + self.window - now)
+            return remaining, reset
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *_):
+                pass
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                path = url.path[len("/v1/"):]
+                query = dict(parse_qsl(url.query))
+                server.hits.append((path, query))
+                delay = server.delay
+                delay = delay() if callable(delay) else delay
+                if delay:
+                    time.sleep(delay)
+
+                remaining, reset = server._take()
+                # send_response() adds the Date header
+                headers = {
+                    "RateLimit-Limit": str(server.limit),
+                    "RateLimit-Remaining": str(max(remaining, 0)),
+                    "RateLimit-Reset": str(reset),
+                }
+                if remaining < 0:
+                    server.throttled += 1
+                    headers["Retry-After"] = str(reset)
+                    status, data = 429, "Too Many Requests"
+                else:
+                    route = server.routes.get(path.split("/")[0])
+                    status, data = route(path, query) if route else (200, {})
+
+                body = json.dumps(
+                    {"code": status, "status": "", "data": data}
+                ).encode()
+                self.send_response(status)
+                headers["Content-Type"] = "application/json"
+                headers["Content-Length"] = str(len(body))
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def __enter__(self):
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *_):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -1,5 +1,7 @@
 import pytest
 
+from aladhan.planner import TimingsQuery, plan
+
 from ..pms import *  # includes aladhan module
 
 
@@ -25,3 +27,20 @@ def test_timings_by_address(client, args, kwargs):
 def test_timings_by_city(client, args, kwargs):
     ts = client.get_timings_by_city(*args, **kwargs)
     assert isinstance(ts, aladhan.Timings)
+
+
+def test_planned_tune(client):
+    # the planner applies a tune to an untuned response itself, it has to
+    # give what the API gives for the tuned request
+    date = aladhan.TimingsDateArg("03-05-2021")
+    tuned = aladhan.Parameters(
+        tune=aladhan.Tune(Imsak=2, Fajr=5, Dhuhr=3, Isha=12, Midnight=7)
+    )
+    p = plan(
+        [TimingsQuery("London", date), TimingsQuery("London", date, tuned)]
+    )
+    assert p.planned_requests == 1
+    _, planned = p.execute(client)
+    ts = client.get_timings_by_address("London", date=date, params=tuned)
+    assert [p.str_time for p in planned] == [p.str_time for p in ts]
+    assert repr(planned.data.meta.offset) == repr(ts.data.meta.offset)
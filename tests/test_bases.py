@@ -1,3 +1,7 @@
+import copy
+import pickle
+from urllib.parse import urlencode
+
 import pytest
 
 from .pms import *  # aladhan is imported from here
@@ -74,3 +78,44 @@ def test_timings(data):
 
     np = data.timings.next_prayer()
     assert np is None or isinstance(np, aladhan.Prayer)
+
+
+def test_interned_arguments():
+    assert aladhan.Parameters() is aladhan.Parameters(method=2)
+    params = aladhan.Parameters(
+        method=aladhan.methods.MWL, school=aladhan.Schools.HANAFI
+    )
+    assert params is aladhan.Parameters(3, school=1)
+    assert params == aladhan.Parameters.from_validated(
+        3, None, "0,0,0,0,0,0,0,0,0", 1, 0, None, 3, 0, "general"
+    )
+    assert params != aladhan.Parameters() and {params: 1}[params] == 1
+    assert aladhan.CalendarDateArg(2021) is aladhan.CalendarDateArg(2021, 0)
+    assert aladhan.CalendarDateArg(2021, 5) != aladhan.CalendarDateArg(
+        2021, 5, hijri=True
+    )
+    assert aladhan.TimingsDateArg("01-05-2021") is aladhan.TimingsDateArg(
+        datetime.datetime(2021, 5, 1)
+    )
+
+    # a changed tune is a different key
+    tune = aladhan.Tune(Fajr=5)
+    first = aladhan.Parameters(tune=tune)
+    tune.fajr = 6
+    assert aladhan.Parameters(tune=tune).tune == "0,6,0,0,0,0,0,0,0"
+    assert first.tune == "0,5,0,0,0,0,0,0,0"
+
+
+def test_immutable_arguments():
+    params = aladhan.Parameters(timezonestring="Europe/London")
+    with pytest.raises(AttributeError):
+        params.method = 3
+    dct = params.as_dict
+    dct["date"] = "01-05-2021"
+    assert "date" not in params.as_dict
+    assert params.query == urlencode(params.as_dict)
+    date = aladhan.CalendarDateArg(2021, 5)
+    assert date.query == "year=2021&annual=false&month=5"
+    for arg in (params, date, aladhan.TimingsDateArg("01-05-2021")):
+        assert pickle.loads(pickle.dumps(arg)) is arg
+        assert copy.deepcopy(arg) is arg
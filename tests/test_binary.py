@@ -0,0 +1,137 @@
+import datetime
+import gc
+import json
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+from aladhan import binary
+from aladhan.calendars import LazyCalendar
+from aladhan.columnar import ColumnarCalendar
+
+from .payloads import day_payload, month_payload, year_payload
+from .pms import *  # aladhan is imported from here
+
+LONDON = dict(timezone="Europe/London")
+
+
+@pytest.fixture(scope="module")
+def year():
+    return json.loads(json.dumps(year_payload(2021, **LONDON)))
+
+
+def days_of(calendar):
+    return [t for m in sorted(calendar, key=int) for t in calendar[m]]
+
+
+def test_round_trip(year):
+    payload = binary.encode(year)
+    assert len(payload) * 10 < len(json.dumps(year))
+
+    decoded = binary.decode(payload, client="client")
+    assert list(decoded) == list(map(str, range(1, 13)))
+    expected = [
+        aladhan.Data(**day, client=None)
+        for m in sorted(year, key=int)
+        for day in year[m]
+    ]
+    for data, timings in zip(expected, days_of(decoded)):
+        assert timings.data.client == "client"
+        assert timings.minutes == data.timings.minutes
+        # the same int objects as parsed times
+        assert all(
+            a is b for a, b in zip(timings.minutes, data.timings.minutes)
+        )
+        assert [p.time_utc for p in timings] == [
+            p.time_utc for p in data.timings
+        ]
+        date = timings.data.date
+        assert (date.readable, date.timestamp) == (
+            data.date.readable,
+            data.date.timestamp,
+        )
+        assert date.gregorian is data.date.gregorian
+        assert date.hijri is data.date.hijri
+        meta = timings.data.meta
+        assert str(meta.timezone) == "Europe/London"
+        assert meta.method is data.meta.method
+        assert meta.offset.value == data.meta.offset.value
+    assert len({id(t.data.meta) for t in days_of(decoded)}) == 1
+
+
+def test_decode_weak_backrefs(year):
+    client = SimpleNamespace(weak_backrefs=True)
+    gc.disable()
+    try:
+        calendar = binary.decode(binary.encode(year["5"]), client)
+        data = calendar[3].data
+        assert data.timings is calendar[3] and data.date.data is data
+        assert data.meta.data is calendar[0].data
+
+        # freed without the garbage collector
+        ref = weakref.ref(data)
+        del calendar, data
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_encode_decoded(year):
+    payload = binary.encode(year)
+    assert binary.encode(binary.decode(payload)) == payload
+
+    # what the getters give, parsed days
+    month = [aladhan.Data(**day, client=None).timings for day in year["2"]]
+    assert binary.encode(month) == binary.encode(year["2"])
+    assert binary.encode(month[0]) == binary.encode(year["2"][0])
+
+
+def test_table_size(year, monkeypatch):
+    monkeypatch.setattr(binary, "MAX_TABLE_SIZE", 5)
+    binary.encode(year["2"][0])  # a meta, dates and weekdays
+    with pytest.raises(ValueError):
+        binary.encode(year["2"])
+
+
+def test_shapes():
+    day = day_payload(datetime.date(2021, 5, 1), **LONDON)
+    timings = binary.decode(binary.encode(day))
+    assert isinstance(timings, aladhan.Timings)
+    assert timings.data.date.readable == day["date"]["readable"]
+
+    month = month_payload(2021, 2, **LONDON)
+    for data in (month, LazyCalendar(month, None)):
+        decoded = binary.decode(binary.encode(data))
+        assert isinstance(decoded, list) and len(decoded) == 28
+        assert decoded[27].data.date.gregorian.date == "28-02-2021"
+
+
+def test_unusual_dates():
+    day = day_payload(datetime.date(2021, 5, 1), **LONDON)
+    day["date"]["hijri"]["day"] = "7"  # kept whole, not DD
+    day["date"]["hijri"]["holidays"] = ["Something"]
+    date = binary.decode(binary.encode(day)).data.date
+    assert date.hijri.day == 7 and date.hijri.holidays == ("Something",)
+    assert date.hijri.date == day["date"]["hijri"]["date"]
+
+
+def test_columnar(year):
+    decoded = binary.decode_columnar(binary.encode(year))
+    expected = ColumnarCalendar.from_raw(year)
+    assert decoded.columns(numpy=False) == expected.columns(numpy=False)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda p: b"",
+        lambda p: b"NOPE" + p[4:],
+        lambda p: p[:4] + b"\x09" + p[5:],
+        lambda p: p[:-1],
+    ],
+)
+def test_invalid(change):
+    payload = binary.encode(day_payload(datetime.date(2021, 5, 1)))
+    with pytest.raises(ValueError):
+        binary.decode(change(payload))
@@ -0,0 +1,131 @@
+import random
+
+import pytest
+
+from aladhan.cache import (
+    NegativeCache,
+    canonical_params,
+    quantize,
+    request_key,
+)
+from aladhan.endpoints import TIMINGS
+from aladhan.http import _AsyncRequester, _SyncRequester
+
+from .pms import *  # aladhan is imported from here
+from .server import StandInServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def bad_address(path, query):
+    if query.get("address") == "nowhere":
+        return 400, "Unable to geocode address."
+    return 200, {}
+
+
+@pytest.fixture
+def server():
+    with StandInServer(limit=1000) as server:
+        server.routes["timingsByAddress"] = bad_address
+        server.routes["timings"] = bad_address
+        yield server
+
+
+@pytest.mark.parametrize(*CANONICAL_PARAMS)
+def test_canonical_params(a, b):
+    assert canonical_params(a) == canonical_params(b)
+    assert list(canonical_params(a)) == sorted(canonical_params(a))
+
+
+def test_canonical_params_keeps_distinct_coordinates():
+    a = dict(longitude=34, latitude=4)
+    b = dict(longitude=34.0000001, latitude=4)
+    assert canonical_params(a) != canonical_params(b)
+    assert canonical_params(a, 0.01) == canonical_params(b, 0.01)
+
+
+@pytest.mark.parametrize(*QUANTIZE)
+def test_quantize(value, precision, expected):
+    assert quantize(value, precision) == expected
+
+
+def test_quantized_hit_rate():
+    # A fleet of devices around a few mosques, each reporting its own
+    # slightly jittered GPS fix (~10m noise).
+    rng = random.Random(7)
+    sites = [
+        (rng.uniform(-10, 50), rng.uniform(20, 55)) for _ in range(25)
+    ]
+    params = aladhan.Parameters().as_dict
+    workload = []
+    for _ in range(2000):
+        lon, lat = rng.choice(sites)
+        workload.append(
+            dict(
+                params,
+                longitude=lon + rng.gauss(0, 0.0001),
+                latitude=lat + rng.gauss(0, 0.0001),
+            )
+        )
+
+    def hit_rate(precision):
+        seen = set()
+        hits = 0
+        for p in workload:
+            key = request_key(TIMINGS, p, precision)
+            hits += key in seen
+            seen.add(key)
+        return hits / len(workload)
+
+    exact, quantized = hit_rate(None), hit_rate(0.01)
+    assert exact < 0.01
+    assert quantized > 0.9
+
+
+def test_negative_cache(server):
+    clock = FakeClock()
+    requester = _SyncRequester(negative_cache=NegativeCache(30, clock=clock))
+    url = server.url + "timingsByAddress/01-05-2021"
+    for _ in range(3):
+        with pytest.raises(BadRequest) as e:
+            requester.request(url, dict(address="nowhere"))
+        assert e.value.response["data"] == "Unable to geocode address."
+    assert len(server.hits) == 1
+
+    requester.request(url, dict(address="London"))
+    clock.now += 31  # expired
+    with pytest.raises(BadRequest):
+        requester.request(url, dict(address="nowhere"))
+    assert len(server.hits) == 3
+
+    # only geocoding endpoints are cached
+    for _ in range(2):
+        with pytest.raises(BadRequest):
+            requester.request(server.url + "timings", dict(address="nowhere"))
+    assert len(server.hits) == 5
+    requester.session.close()
+
+
+@pytest.mark.asyncio
+async def test_async_negative_cache(server):
+    requester = _AsyncRequester(negative_cache=NegativeCache(30))
+    url = server.url + "timingsByAddress"
+    for _ in range(2):
+        with pytest.raises(BadRequest):
+            await requester.request(url, dict(address="nowhere"))
+    assert len(server.hits) == 1
+    await requester.session.close()
+
+
+def test_negative_cache_maxsize():
+    cache = NegativeCache(maxsize=2)
+    for key in "abc":
+        cache.put(key, BadRequest({"code": 400}))
+    assert len(cache) == 2 and cache.get("a") is None
+    assert isinstance(cache.get("c"), BadRequest)
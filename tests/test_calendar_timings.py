@@ -0,0 +1,75 @@
+import asyncio
+import datetime
+
+import pytest
+
+from aladhan.endpoints import (
+    CALENDAR,
+    CALENDAR_BY_ADDRESS,
+    CALENDAR_BY_CITY,
+)
+
+from .payloads import FakeAPI, month_payload
+from .pms import *  # aladhan is imported from here
+
+
+def days(start, n):
+    start = datetime.date(*start)
+    for i in range(n):
+        d = start + datetime.timedelta(days=i)
+        yield d, aladhan.TimingsDateArg(d.strftime("%d-%m-%Y"))
+
+
+@pytest.fixture
+def client():
+    with aladhan.Client(calendar_timings=True) as client:
+        client.http.request = FakeAPI()
+        yield client
+
+
+@pytest.mark.parametrize(
+    ["getter", "args", "endpoint"],
+    [
+        ["get_timings", (34, 4), CALENDAR],
+        ["get_timings_by_address", ("London",), CALENDAR_BY_ADDRESS],
+        ["get_timings_by_city", ("London", "GB"), CALENDAR_BY_CITY],
+    ],
+)
+def test_daily_rollover(client, getter, args, endpoint):
+    for d, date in days((2021, 5, 1), 60):  # May and June
+        ts = getattr(client, getter)(*args, date=date)
+        assert isinstance(ts, aladhan.Timings)
+        assert ts.fajr.time.date() == d
+
+    calls = client.http.request.calls
+    assert len(calls) == 2
+    assert all(e == endpoint for e, _ in calls)
+
+
+def test_keyed_by_location_and_params(client):
+    date = aladhan.TimingsDateArg("01-05-2021")
+    client.get_timings(34, 4, date)
+    client.get_timings(34.0, 4.0, date)
+    client.get_timings(34, 4, date, aladhan.Parameters(method=3))
+    client.get_timings(35, 4, date)
+    assert len(client.http.request.calls) == 3
+
+
+def test_without_date_uses_timings(client, mocker):
+    client.http.request = mocker.Mock(return_value=month_payload(2021, 5)[0])
+    client.get_timings(34, 4)
+    assert client.http.request.call_args[0][0].endswith("/timings")
+
+
+@pytest.mark.asyncio
+async def test_async_coalesces_misses():
+    async with aladhan.Client(True, calendar_timings=True) as client:
+        client.http.request = FakeAPI(is_async=True)
+        res = await asyncio.gather(
+            *(
+                client.get_timings_by_address("London", date)
+                for _, date in days((2021, 5, 1), 31)
+            )
+        )
+        assert [t.data.date.gregorian.day for t in res] == list(range(1, 32))
+        assert len(client.http.request.calls) == 1
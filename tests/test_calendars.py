@@ -0,0 +1,239 @@
+import gc
+import json
+import pickle
+import weakref
+
+import pytest
+
+from aladhan import calendars
+from aladhan.calendars import LazyCalendar
+from aladhan.client import _decide_timings
+from aladhan.data_classes import reattach
+
+from .payloads import FakeAPI, month_payload, year_payload
+from .pms import *  # aladhan is imported from here
+
+TIMEZONE = "Asia/Riyadh"
+
+
+@pytest.fixture
+def client():
+    with aladhan.Client(lazy_calendars=True) as client:
+        client.http.request = FakeAPI(timezone=TIMEZONE)
+        yield client
+
+
+@pytest.fixture
+def days():
+    return month_payload(2021, 5, timezone=TIMEZONE)
+
+
+def built(calendar):
+    return int(repr(calendar).rsplit("=", 1)[1][:-1])
+
+
+def test_builds_on_access(client, days):
+    calendar = LazyCalendar(days, client)
+    assert len(calendar) == 31 and built(calendar) == 0
+    assert calendar[0].data.date.gregorian.day == 1
+    assert calendar[-1].data.date.gregorian.day == 31
+    assert built(calendar) == 2
+    assert calendar.raw is days
+
+
+def test_memoize(client, days):
+    calendar = LazyCalendar(days, client)
+    assert calendar[3] is calendar[3]
+    assert calendar[3] in calendar and calendar.index(calendar[3]) == 3
+    assert list(calendar)[3] is calendar[3]
+
+    calendar = LazyCalendar(days, client, memoize=False)
+    assert calendar[3] is not calendar[3]
+    assert built(calendar) == 0
+
+
+def test_slice_and_reverse(client, days):
+    calendar = LazyCalendar(days, client)
+    first = calendar[0]
+    week = calendar[:7]
+    assert isinstance(week, LazyCalendar) and len(week) == 7
+    assert week[0] is first and built(week) == 1
+    assert [t.data.date.gregorian.day for t in reversed(week)] == list(
+        range(7, 0, -1)
+    )
+    with pytest.raises(IndexError):
+        calendar[31]
+
+
+def test_compare(client, days):
+    calendar = LazyCalendar(days, client)
+    assert calendar == list(calendar) and list(calendar) == calendar
+    assert calendar == calendar[:] and calendar.copy() == calendar
+    assert calendar != calendar[:7] and calendar != days
+    assert calendar + [] == list(calendar) == [] + calendar
+    with pytest.raises(TypeError):
+        hash(calendar)
+
+
+def test_change(client, days):
+    raw = list(days)
+    calendar = LazyCalendar(days, client, memoize=False)
+    first, last = calendar[0], calendar[-1]
+    calendar.append(first)
+    del calendar[0]
+    calendar.insert(0, last)
+    calendar[1:3] = calendar[2:4]
+    assert days == raw  # the caller's days aren't changed
+    assert calendar.memoize and len(calendar) == len(calendar.raw) == 32
+    assert calendar[0] is last and calendar[-1] is first
+    assert calendar.pop() is first and len(calendar) == 31
+
+    calendar.sort(key=lambda t: t.data.date.gregorian.day)
+    calendar += [first]
+    calendar.reverse()
+    assert calendar[0] is first
+    assert [day["date"]["gregorian"]["day"] for day in calendar.raw] == [
+        "%02d" % t.data.date.gregorian.day for t in calendar
+    ]
+    assert calendars.from_raw(calendar.raw)[-1].minutes == (
+        calendar[-1].minutes
+    )
+    with pytest.raises(TypeError):
+        calendar.append(days[0])
+    calendar.clear()
+    assert len(calendar) == 0 and calendar.raw == []
+
+
+def test_client_lazy_calendars(client):
+    month = client.get_calendar(0, 21, aladhan.CalendarDateArg(2021, 5))
+    assert isinstance(month, LazyCalendar) and built(month) == 0
+
+    year = client.get_calendar(0, 21, aladhan.CalendarDateArg(2021))
+    assert isinstance(year, dict) and list(year) == list(map(str, range(1, 13)))
+    assert all(isinstance(m, LazyCalendar) for m in year.values())
+
+    client.lazy_calendars = False
+    eager = client.get_calendar(0, 21, aladhan.CalendarDateArg(2021, 5))
+    assert isinstance(eager, list)
+    assert [t.fajr.str_time for t in eager] == [t.fajr.str_time for t in month]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_shared_meta(client, lazy):
+    client.lazy_calendars = lazy
+    year = json.loads(json.dumps(year_payload(2021, timezone=TIMEZONE)))
+    calendar = _decide_timings(client, year)
+    metas = {id(t.data.meta) for m in calendar.values() for t in m}
+    assert len(metas) == 1
+    assert calendar["1"][0].data.meta.data is calendar["1"][0].data
+
+    year["2"][0]["meta"]["timezone"] = "Europe/London"
+    calendar = _decide_timings(client, year)
+    assert calendar["2"][0].data.meta is not calendar["2"][1].data.meta
+    assert calendar["2"][1].data.meta is calendar["12"][30].data.meta
+    assert str(calendar["2"][0].data.meta.timezone) == "Europe/London"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_pickle(client, lazy):
+    client.lazy_calendars = lazy
+    year = json.loads(json.dumps(year_payload(2021, timezone=TIMEZONE)))
+    calendar = _decide_timings(client, year)
+    calendar["5"][3]  # a lazy calendar keeps what's built
+
+    loaded = pickle.loads(pickle.dumps(calendar))
+    if lazy:
+        assert built(loaded["5"]) == 1 and loaded["5"].client is None
+    days = [t for m in loaded.values() for t in m]
+    assert len({id(t.data.meta) for t in days}) == 1
+    if not lazy:  # the first unpickled day, like the first made one
+        assert days[0].data.meta.data is days[0].data
+    assert all(t.data.client is None for t in days)
+    assert [t.fajr.time_utc for t in days] == [
+        t.fajr.time_utc for m in calendar.values() for t in m
+    ]
+
+    with reattach(client):
+        loaded = pickle.loads(pickle.dumps(calendar["5"]))
+    assert loaded[0].data.client is client
+
+    # a day doesn't bring the first day of its calendar, which its shared
+    # Meta is from
+    first, day = calendar["1"][0], calendar["5"][3]
+    assert day.data.meta is first.data.meta
+    assert len(pickle.dumps(day)) < len(pickle.dumps(first)) * 1.1
+    loaded = pickle.loads(pickle.dumps(day))
+    assert loaded.data.meta.data is loaded.data
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_raw_round_trip(lazy):
+    year = json.loads(json.dumps(year_payload(2021, timezone=TIMEZONE)))
+    calendar = calendars.from_raw(year, lazy=lazy)
+    assert list(calendar) == list(year)
+    assert all(isinstance(m, LazyCalendar) == lazy for m in calendar.values())
+    assert len({id(t.data.meta) for m in calendar.values() for t in m}) == 1
+
+    raw = calendars.to_raw(calendar)
+    again = calendars.from_raw(raw)
+    assert [t.minutes for t in again["7"]] == [
+        t.minutes for t in calendar["7"]
+    ]
+    if lazy:  # as it was returned
+        assert raw == year
+    else:
+        assert calendars.to_raw(again) == raw
+
+    month = calendars.from_raw(year["2"], client="client")
+    assert isinstance(month, list) and month[0].data.client == "client"
+    assert calendars.to_raw(month[0]) == calendars.to_raw(month)[0]
+    assert calendars.from_raw(raw["2"][0]).minutes == month[0].minutes
+
+
+def test_invalid_raw():
+    days = month_payload(2021, 5, timezone=TIMEZONE)
+    with pytest.raises(ValueError):
+        calendars.from_raw({"1": days, "2": None})
+    del days[3]["date"]
+    with pytest.raises(ValueError):
+        calendars.from_raw(days)
+    with pytest.raises(ValueError):
+        calendars.from_raw("days")
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_weak_backrefs(client, lazy):
+    client.lazy_calendars = lazy
+    client.weak_backrefs = True
+    year = json.loads(json.dumps(year_payload(2021, timezone=TIMEZONE)))
+    gc.collect()
+    gc.disable()
+    try:
+        calendar = _decide_timings(client, year)
+        timings = calendar["5"][3]
+        data = timings.data
+        assert data.timings is timings and timings.fajr.data is data
+        assert data.meta.data is not None and data.date.data is data
+
+        # freed without the garbage collector
+        ref = weakref.ref(data)
+        del calendar, timings, data
+        assert ref() is None
+        assert gc.collect() == 0
+
+        # a Data alone makes its timings again
+        data = aladhan.Data.from_raw(year["1"][0], client)
+        minutes = data.timings.minutes
+        ref = weakref.ref(data.timings)
+        assert ref() is None and data.timings.minutes == minutes
+        assert data.timings.data is data
+        loaded = pickle.loads(pickle.dumps(data))
+        assert loaded.timings.minutes == minutes
+        assert loaded.timings.data is loaded
+        assert loaded.meta.data is loaded and loaded.date.data is loaded
+        ref = weakref.ref(loaded)
+        del loaded
+        assert ref() is None
+        assert gc.collect() == 0
+    finally:
+        gc.enable()
@@ -0,0 +1,73 @@
+import datetime
+
+import pytest
+
+from aladhan import columnar
+from aladhan.columnar import ColumnarCalendar, to_date, to_datetime
+
+from .payloads import day_payload, month_payload, year_payload
+from .pms import *  # aladhan is imported from here
+
+NEW_YORK = dict(timezone="America/New_York", latitude=40.71, longitude=-74)
+
+
+@pytest.fixture(scope="module")
+def year():
+    return year_payload(2021, **NEW_YORK)
+
+
+def test_matches_prayers(year):
+    calendar = ColumnarCalendar.from_raw(year)
+    days = [day for m in sorted(year, key=int) for day in year[m]]
+    assert len(calendar) == len(days) == 365
+    for i, day in enumerate(days):
+        timings = aladhan.Data(**day, client=None).timings
+        assert to_date(calendar.dates[i]) == timings.fajr.time.date()
+        for prayer in timings:
+            assert to_datetime(calendar.local[prayer.name][i]) == prayer.time
+            utc = to_datetime(calendar.utc[prayer.name][i])
+            assert utc == prayer.time_utc
+
+
+def test_dst_day():
+    day = day_payload(datetime.date(2021, 3, 14), **NEW_YORK)  # 2am -> 3am
+    day["timings"].update(Imsak="01:30 (EST)", Fajr="03:30 (EDT)")
+    calendar = ColumnarCalendar.from_raw(day)
+    local, utc = calendar.local, calendar.utc
+    assert utc["Imsak"][0] - local["Imsak"][0] == 5 * 60
+    assert utc["Fajr"][0] - local["Fajr"][0] == 4 * 60
+
+
+def test_from_raw_shapes():
+    month = month_payload(2021, 2, **NEW_YORK)
+    assert len(ColumnarCalendar.from_raw(month)) == 28
+    assert len(ColumnarCalendar.from_raw(month[0])) == 1
+
+    calendar = ColumnarCalendar()
+    calendar.extend(month[:3])
+    calendar.append(month[3])
+    assert list(map(to_date, calendar.dates)) == [
+        datetime.date(2021, 2, d) for d in range(1, 5)
+    ]
+
+
+def test_columns_without_numpy(monkeypatch, year):
+    monkeypatch.setattr(columnar, "_numpy", None)
+    calendar = ColumnarCalendar.from_raw(year)
+    columns = calendar.columns()
+    assert len(columns) == 1 + 2 * len(calendar.names)
+    assert columns["Fajr"] is calendar.local["Fajr"]
+    assert columns["Fajr_utc"] is calendar.utc["Fajr"]
+    assert columns["date"].itemsize == 4
+    with pytest.raises(ImportError):
+        calendar.columns(numpy=True)
+
+
+def test_columns_numpy(year):
+    np = pytest.importorskip("numpy")
+    calendar = ColumnarCalendar.from_raw(year)
+    columns = calendar.columns()
+    assert columns["Isha"].dtype == np.int32
+    calendar.local["Isha"][0] = 42
+    assert columns["Isha"][0] == 42  # shared, not copied
+    assert not isinstance(calendar.columns(numpy=False)["Isha"], np.ndarray)
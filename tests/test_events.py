@@ -0,0 +1,108 @@
+import datetime
+import random
+
+import pytest
+
+from aladhan import calendars
+from aladhan.events import PRAYERS, PrayerIndex
+
+from .payloads import day_payload, month_payload, year_payload
+from .pms import *  # aladhan is imported from here
+
+NEW_YORK = dict(timezone="America/New_York", latitude=40.71, longitude=-74)
+
+
+@pytest.fixture(scope="module")
+def year():
+    return calendars.from_raw(year_payload(2021, **NEW_YORK))
+
+
+def scan(days, now):
+    # what the index should find, by looking at every prayer
+    prayers = sorted(
+        (p for t in days for p in t if p.name in PRAYERS),
+        key=lambda p: p.time_utc,
+    )
+    before = [p for p in prayers if p.time_utc <= now]
+    after = [p for p in prayers if p.time_utc > now]
+    return before[-1] if before else None, after[0] if after else None
+
+
+def test_matches_scan(year):
+    index = PrayerIndex(year)
+    assert len(index) == 365 * 5
+    days = [t for m in sorted(year, key=int) for t in year[m]]
+    start = datetime.datetime(2021, 1, 1)
+    rng = random.Random(0)
+    for _ in range(200):
+        now = start + datetime.timedelta(minutes=rng.randrange(365 * 1440))
+        current, upcoming = scan(days, now)
+        assert index.window(now) == (current, upcoming)
+        assert index.current(now) is current
+        assert index.next_prayer(now) is upcoming
+        assert index.remaining(now) == upcoming.time_utc - now
+
+
+def test_rolls_over_days():
+    may = calendars.from_raw(month_payload(2021, 5, **NEW_YORK))
+    june = calendars.from_raw(month_payload(2021, 6, **NEW_YORK))
+    index = PrayerIndex(june, may)  # order doesn't matter
+    isha = may[30].isha.time_utc
+
+    current, upcoming = index.window(isha)
+    assert current is may[30].isha
+    assert upcoming is june[0].fajr
+    assert index.next_prayer(isha - datetime.timedelta(seconds=1)) is (
+        may[30].isha
+    )
+
+    aware = isha.replace(tzinfo=datetime.timezone.utc).astimezone(
+        datetime.timezone(datetime.timedelta(hours=3))
+    )
+    assert index.next_prayer(aware) is june[0].fajr
+
+
+def test_edges():
+    timings = aladhan.Data(
+        **day_payload(datetime.date(2021, 5, 1), **NEW_YORK), client=None
+    ).timings
+    index = PrayerIndex(timings, names=("Imsak", "Isha"))
+    assert list(index) == [timings.imsak, timings.isha]
+
+    before = timings.imsak.time_utc - datetime.timedelta(hours=1)
+    assert index.window(before) == (None, timings.imsak)
+    assert index.remaining(before) == datetime.timedelta(hours=1)
+
+    after = timings.isha.time_utc + datetime.timedelta(hours=1)
+    assert index.window(after) == (timings.isha, None)
+    assert index.remaining(after) is None
+
+    with pytest.raises(ValueError):
+        PrayerIndex(timings, names=("Fajr", "Lunch"))
+
+
+def test_dst_day():
+    day = day_payload(datetime.date(2021, 3, 14), **NEW_YORK)  # 2am -> 3am
+    day["timings"].update(Imsak="02:30 (EST)", Fajr="03:30 (EDT)")
+    timings = aladhan.Data(**day, client=None).timings
+    index = PrayerIndex(timings, names=("Imsak", "Fajr"))
+    assert list(index) == [timings.fajr]  # imsak doesn't exist
+    assert index.next_prayer(datetime.datetime(2021, 3, 14)) is timings.fajr
+
+
+def test_night_times_on_next_day():
+    may = calendars.from_raw(month_payload(2021, 5, **NEW_YORK))
+    first, second = may[0], may[1]
+    assert first.midnight.minutes < first.isha.minutes  # after 00:00
+    index = PrayerIndex(may, names=("Fajr", "Isha", "Midnight", "Lastthird"))
+    assert list(index)[:5] == [
+        first.fajr,
+        first.isha,
+        first.midnight,
+        first.last_third,
+        second.fajr,
+    ]
+    isha = first.isha.time_utc
+    day = datetime.timedelta(days=1)
+    assert index.next_prayer(isha) is first.midnight
+    assert index.remaining(isha) == first.midnight.time_utc + day - isha
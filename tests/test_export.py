@@ -0,0 +1,113 @@
+import csv
+import io
+import json
+
+import pytest
+
+from aladhan import export
+from aladhan.export import CSVWriter, NDJSONWriter, ParquetWriter
+
+from .payloads import FakeAPI, month_payload, year_payload
+from .pms import *  # aladhan is imported from here
+
+TIMEZONE = "Asia/Riyadh"
+
+
+class CountingFile(io.StringIO):
+    writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+@pytest.fixture
+def client():
+    with aladhan.Client(lazy_calendars=True) as client:
+        client.http.request = FakeAPI(timezone=TIMEZONE)
+        yield client
+
+
+def read_csv(file):
+    return list(csv.DictReader(io.StringIO(file.getvalue())))
+
+
+def test_csv_inputs(client):
+    month = month_payload(2021, 5, timezone=TIMEZONE)
+    date = aladhan.CalendarDateArg(2021, 5)
+    lazy = client.get_calendar(0, 21, date)
+    timings = list(lazy)
+    client.lazy_calendars = False
+
+    outputs = []
+    for data in (month, lazy, timings, client.get_calendar(0, 21, date)):
+        file = io.StringIO()
+        with CSVWriter(file) as writer:
+            assert writer.write(data) == 31
+        outputs.append(read_csv(file))
+
+    assert all(rows == outputs[0] for rows in outputs)
+    first = outputs[0][0]
+    assert first["date"] == "2021-05-01" and first["timezone"] == TIMEZONE
+    assert first["Fajr"] == month[0]["timings"]["Fajr"][:5]
+
+
+def test_csv_batches_and_extra_columns():
+    file = CountingFile()
+    with CSVWriter(file, columns=["mosque"], batch_size=100) as writer:
+        for mosque in ("a", "b"):
+            writer.write(year_payload(2021, timezone=TIMEZONE), mosque=mosque)
+        with pytest.raises(TypeError):
+            writer.write([], masjid="c")
+    assert writer.rows == 730
+    assert file.writes == 1 + 8  # header and ceil(730 / 100) batches
+    rows = read_csv(file)
+    assert [r["mosque"] for r in rows[364:366]] == ["a", "b"]
+    assert rows[-1]["date"] == "2021-12-31"
+
+
+def test_ndjson(tmp_path):
+    path = tmp_path / "timings.ndjson"
+    with NDJSONWriter(path, columns=["mosque"]) as writer:
+        writer.write(month_payload(2021, 2, timezone=TIMEZONE), mosque=7)
+    lines = path.read_text(encoding="utf8").splitlines()
+    assert len(lines) == 28
+    row = json.loads(lines[0])
+    assert list(row)[:3] == ["mosque", "date", "latitude"]
+    assert row["mosque"] == 7 and row["date"] == "2021-02-01"
+
+
+@pytest.mark.asyncio
+async def test_awrite():
+    async def days():
+        for day in month_payload(2021, 2, timezone=TIMEZONE):
+            yield day
+
+    file = io.StringIO()
+    with CSVWriter(file) as writer:
+        assert await writer.awrite(days()) == 28
+    assert len(read_csv(file)) == 28
+
+
+def test_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "timings.parquet"
+    with ParquetWriter(path, columns=["mosque"], batch_size=100) as writer:
+        writer.write(year_payload(2021, timezone=TIMEZONE), mosque=1)
+        writer.write(month_payload(2022, 1, timezone=TIMEZONE), mosque=None)
+    table = pq.read_table(path)
+    assert table.num_rows == 365 + 31
+    assert table.column("mosque")[0].as_py() == "1"
+    assert table.column("mosque")[365].as_py() is None
+
+
+def test_parquet_missing(monkeypatch, tmp_path):
+    monkeypatch.setattr(export, "_pyarrow", None)
+    with pytest.raises(ImportError):
+        ParquetWriter(tmp_path / "timings.parquet")
+    assert not (tmp_path / "timings.parquet").exists()
+
+
+def test_base_writer_is_abstract():
+    with pytest.raises(TypeError):
+        export.TimingsWriter(io.StringIO())
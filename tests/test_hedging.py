@@ -0,0 +1,89 @@
+import asyncio
+import itertools
+
+import pytest
+
+from aladhan.hedging import HedgePolicy
+from aladhan.http import _AsyncRequester
+
+from .server import StandInServer
+
+
+def test_no_hedging_before_min_samples():
+    policy = HedgePolicy(min_samples=5)
+    for _ in range(4):
+        assert policy.delay() is None
+        policy.record(0.01)
+    policy.record(0.01)
+    assert policy.delay() == 0.05  # min_delay
+
+
+def test_percentile_delay():
+    policy = HedgePolicy(percentile=0.9, min_samples=1, min_delay=0)
+    for i in range(1, 101):
+        policy.record(i / 100)
+    assert policy.delay() == pytest.approx(0.91)
+
+
+def test_budget():
+    policy = HedgePolicy(budget=0.25, max_tokens=2)
+    hedges = 0
+    for _ in range(100):
+        policy.delay()
+        hedges += policy.try_hedge()
+    assert hedges == 25
+    for _ in range(50):
+        policy.delay()
+    assert policy.tokens == 2
+
+
+@pytest.mark.asyncio
+async def test_hedged_requests_cut_tail_latency():
+    loop = asyncio.get_event_loop()
+    # every 10th response is stuck for a second
+    delays = itertools.cycle([0.005] * 9 + [1.0])
+    with StandInServer(limit=1000) as server:
+        server.delay = lambda: next(delays)
+        policy = HedgePolicy(percentile=0.8, min_samples=10, budget=0.2)
+        requester = _AsyncRequester(hedge_policy=policy)
+
+        latencies = []
+        for _ in range(60):
+            start = loop.time()
+            await requester.request(server.url + "timingsByAddress")
+            latencies.append(loop.time() - start)
+        await requester.session.close()
+
+    warm = latencies[20:]
+    assert max(warm) < 0.5
+    assert policy.hedged <= 60 * 0.2
+    assert len(server.hits) == 60 + policy.hedged
+
+
+class BlockingLimiter:
+    def acquire(self):
+        return 0
+
+    def try_acquire(self):
+        return False
+
+    def update(self, status, headers):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_hedge_keeps_budget():
+    delays = iter([0.001, 0.2, 0.2])
+    with StandInServer(limit=1000) as server:
+        server.delay = lambda: next(delays)
+        policy = HedgePolicy(min_samples=1, budget=1)
+        requester = _AsyncRequester(
+            rate_limiter=BlockingLimiter(), hedge_policy=policy
+        )
+        for _ in range(3):
+            await requester.request(server.url + "status")
+        await requester.session.close()
+
+    assert len(server.hits) == 3
+    assert policy.hedged == 0
+    assert policy.tokens == 3
@@ -0,0 +1,109 @@
+import pytest
+
+from aladhan.columnar import CalendarMatrix, ColumnarCalendar
+
+from .payloads import FakeAPI, month_payload
+from .pms import *  # aladhan is imported from here
+from .server import StandInServer
+
+TIMEZONE = "Asia/Riyadh"
+DATE = aladhan.CalendarDateArg(2021, 5)
+LONDON = ("London", aladhan.Parameters(method=3))
+LOCATIONS = [
+    LONDON,
+    ((0, 21), None),
+    ((0.0, 21), aladhan.Parameters()),  # same as above
+    (("London", "GB"), None),
+    LONDON,
+]
+
+
+def test_calendar_matrix():
+    with aladhan.Client() as client:
+        api = client.http.request = FakeAPI(timezone=TIMEZONE)
+        matrix = client.get_calendar_matrix(iter(LOCATIONS), DATE)
+
+    assert [endpoint.rsplit("/", 1)[1] for endpoint, _ in api.calls] == [
+        "calendarByAddress",
+        "calendar",
+        "calendarByCity",
+    ]
+    assert isinstance(matrix, CalendarMatrix)
+    assert matrix.shape == (5, 31, 11) and matrix.unique == 3
+    assert matrix.locations == LOCATIONS
+    assert matrix.calendar(0) is matrix.calendar(4)
+
+    month = month_payload(2021, 5, timezone=TIMEZONE)
+    expected = ColumnarCalendar.from_raw(month)
+    assert matrix[3, 30, "Isha"] == expected.local["Isha"][30]
+    assert matrix.get(3, 30, "Isha", utc=True) == expected.utc["Isha"][30]
+
+
+def test_calendar_matrix_bad_location():
+    with aladhan.Client() as client:
+        client.http.request = FakeAPI(timezone=TIMEZONE)
+        with pytest.raises(aladhan.exceptions.InvalidArgument):
+            client.get_calendar_matrix([((1, 2, 3), None)], DATE)
+
+
+def test_calendar_matrix_numpy():
+    np = pytest.importorskip("numpy")
+    with aladhan.Client() as client:
+        client.http.request = FakeAPI(timezone=TIMEZONE)
+        matrix = client.get_calendar_matrix(LOCATIONS, DATE)
+    array = matrix.to_numpy()
+    assert array.shape == matrix.shape and array.dtype == np.int32
+    assert array[3, 30, matrix.names.index("Isha")] == matrix[3, 30, "Isha"]
+    assert matrix.to_numpy(names=["Fajr"]).shape == (5, 31, 1)
+
+
+def test_calendar_matrix_different_lengths():
+    np = pytest.importorskip("numpy")
+    april, may = (
+        ColumnarCalendar.from_raw(month_payload(2021, m, timezone=TIMEZONE))
+        for m in (4, 5)
+    )
+    matrix = CalendarMatrix(["April", "May", "April"], [april, may], [0, 1, 0])
+    assert matrix.shape == (3, 31, 11)
+    array = matrix.to_numpy()
+    assert array.shape == matrix.shape and array.dtype == np.int32
+    assert isinstance(array, np.ma.MaskedArray)
+    assert array.mask[:, 30].all(axis=1).tolist() == [True, False, True]
+    assert not array.mask[:, :30].any()
+    assert array[1, 30, matrix.names.index("Isha")] == matrix[1, 30, "Isha"]
+    assert array[2, 29, 0] == matrix[2, 29, "Imsak"]
+
+
+@pytest.fixture
+def server(monkeypatch):
+    def calendar(path, query):
+        year, month = int(query["year"]), int(query["month"])
+        return 200, month_payload(year, month, timezone=TIMEZONE)
+
+    with StandInServer(limit=10) as server:
+        for endpoint, name in (
+            ("CALENDAR", "calendar"),
+            ("CALENDAR_BY_ADDRESS", "calendarByAddress"),
+            ("CALENDAR_BY_CITY", "calendarByCity"),
+        ):
+            server.routes[name] = calendar
+            monkeypatch.setattr("aladhan.http." + endpoint, server.url + name)
+        yield server
+
+
+@pytest.mark.asyncio
+async def test_async_calendar_matrix(server):
+    async with aladhan.Client(is_async=True) as client:
+        matrix = await client.get_calendar_matrix(LOCATIONS * 3, DATE)
+    assert len(server.hits) == 3
+    assert matrix.shape == (15, 31, 11)
+
+
+@pytest.mark.asyncio
+async def test_async_calendar_matrix_stays_under_rate_limit(server):
+    locations = [((i / 10, 21), None) for i in range(30)]
+    async with aladhan.Client(is_async=True) as client:
+        matrix = await client.get_calendar_matrix(locations, DATE)
+    assert matrix.unique == 30
+    assert len(server.hits) == 30
+    assert server.throttled == 0
@@ -0,0 +1,101 @@
+import pytest
+
+from aladhan.http import MAX_IN_FLIGHT
+from aladhan.planner import AsmaQuery, TimingsQuery, location_params, plan
+
+from .payloads import FakeAPI
+from .pms import *  # aladhan is imported from here
+
+
+def day(d, m=5, y=2021):
+    return aladhan.TimingsDateArg("%02d-%02d-%d" % (d, m, y))
+
+
+@pytest.fixture
+def client():
+    with aladhan.Client() as client:
+        client.http.request = FakeAPI()
+        yield client
+
+
+@pytest.mark.parametrize(*LOCATIONS)
+def test_location_params(location, kind):
+    assert location_params(location)[0] == kind
+
+
+def test_bad_location():
+    with pytest.raises(aladhan.exceptions.InvalidArgument):
+        location_params(("London",))
+
+
+def test_empty_asma_query():
+    with pytest.raises(aladhan.exceptions.InvalidArgument):
+        AsmaQuery()
+
+
+def test_plan_counts():
+    queries = [TimingsQuery("London", day(d)) for d in range(1, 32)]
+    queries += [TimingsQuery("London", day(1))] * 3  # duplicates
+    queries += [TimingsQuery((34, 4), day(1)), TimingsQuery((34.0, 4), day(1))]
+    queries += [AsmaQuery(1, 2), AsmaQuery(2, 99), AsmaQuery(5)]
+    p = plan(queries)
+    assert p.naive_requests == 39
+    # a month calendar, a single day and one asma call
+    assert p.planned_requests == 3
+
+
+def test_plan_annual():
+    queries = [TimingsQuery("London", day(1, m)) for m in range(1, 13, 2)]
+    queries.append(TimingsQuery("London", day(1, 1, 2022)))
+    assert plan(queries).planned_requests == 2
+
+
+def test_plan_execute(client):
+    tuned = aladhan.Parameters(tune=aladhan.Tune(Fajr=5, Isha=3))
+    queries = [
+        TimingsQuery("London", day(3)),
+        TimingsQuery("London", day(4), tuned),
+        TimingsQuery("London", day(5), aladhan.Parameters(method=3)),
+        AsmaQuery(99, 1),
+        TimingsQuery(("London", "GB"), day(3)),
+    ]
+    p = plan(queries)
+    assert p.planned_requests == 4
+    results = p.execute(client)
+    assert len(client.http.request.calls) == 4
+
+    for q, res in zip(queries, results):
+        if isinstance(q, AsmaQuery):
+            assert [i.number for i in res] == [99, 1]
+            continue
+        kind, _ = location_params(q.location)
+        getter = {
+            "address": client.get_timings_by_address,
+            "city": lambda loc, **kw: client.get_timings_by_city(*loc, **kw),
+        }[kind]
+        naive = getter(q.location, date=q.date, params=q.params)
+        assert [p.str_time for p in res] == [p.str_time for p in naive]
+        assert repr(res.data.meta.offset) == repr(naive.data.meta.offset)
+
+
+@pytest.mark.asyncio
+async def test_async_plan_execute():
+    async with aladhan.Client(True) as client:
+        api = client.http.request = FakeAPI(True)
+        queries = [TimingsQuery("London", day(d, 1)) for d in range(1, 10)]
+        queries += [TimingsQuery("Paris", day(1)), AsmaQuery(3)]
+        results = await plan(queries).execute(client)
+        assert api.max_in_flight == 3
+        assert [r.data.date.gregorian.day for r in results[:9]] == list(
+            range(1, 10)
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_plan_execute_bounded():
+    async with aladhan.Client(True) as client:
+        api = client.http.request = FakeAPI(True, 0.05)
+        queries = [TimingsQuery((i, 4), day(1)) for i in range(12)]
+        await plan(queries).execute(client)
+    assert len(api.calls) == 12
+    assert api.max_in_flight == MAX_IN_FLIGHT
@@ -0,0 +1,226 @@
+import datetime
+import gc
+import json
+import pickle
+import weakref
+
+import pytest
+import pytz
+
+from aladhan.data_classes import reattach
+
+from .payloads import day_payload
+from .pms import *  # aladhan is imported from here
+
+NAMES = (
+    "Imsak",
+    "Fajr",
+    "Sunrise",
+    "Dhuhr",
+    "Asr",
+    "Sunset",
+    "Maghrib",
+    "Isha",
+    "Midnight",
+    "Firstthird",
+    "Lastthird",
+)
+
+
+def expected(day, name):
+    date = datetime.datetime.strptime(day["date"]["readable"], "%d %b %Y")
+    time = datetime.datetime.strptime(day["timings"][name][:5], "%H:%M")
+    time = time.replace(date.year, date.month, date.day)
+    tz = pytz.timezone(day["meta"]["timezone"])
+    return time, time - tz.utcoffset(time), time.strftime("%H:%M %d-%m-%Y")
+
+
+@pytest.mark.parametrize("timezone", ["Asia/Riyadh", "America/New_York"])
+def test_timings(timezone):
+    day = day_payload(datetime.date(2021, 6, 9), timezone=timezone)
+    timings = aladhan.Data(**day, client=None).timings
+    assert timings.minutes[1] == timings.fajr.minutes
+    assert timings.fajr is timings.fajr
+    assert timings.prayer("Fajr") is timings.fajr
+    assert timings.prayer("Lastthird") is timings.last_third
+    with pytest.raises(ValueError):
+        timings.prayer("fajr")
+    assert [p.name for p in timings] == list(NAMES)
+    for prayer in timings:
+        assert (prayer.time, prayer.time_utc, prayer.str_time) == expected(
+            day, prayer.name
+        )
+
+
+def test_next_prayer_data():
+    day = day_payload(datetime.date(2021, 1, 9), timezone="Asia/Riyadh")
+    day["timings"] = {"Isha": day["timings"]["Isha"]}
+    prayer = aladhan.NextPrayerData(**day, client=None).prayer
+    assert (prayer.time, prayer.time_utc, prayer.str_time) == expected(
+        day, "Isha"
+    )
+
+
+def test_shared_date_types():
+    date = datetime.date(2021, 6, 9)
+    riyadh, london = (
+        json.loads(json.dumps(day_payload(date, timezone=timezone)))
+        for timezone in ("Asia/Riyadh", "Europe/London")
+    )
+    first = aladhan.Data(**riyadh, client=None).date
+    second = aladhan.Data(**london, client=None).date
+    assert first is not second
+    assert first.gregorian is second.gregorian and first.hijri is second.hijri
+    assert first.hijri.weekday is second.hijri.weekday
+
+    # a date that differs in anything else gets its own
+    london["date"]["hijri"]["holidays"] = ["Something"]
+    third = aladhan.Data(**london, client=None).date
+    assert third.gregorian is first.gregorian
+    assert third.hijri is not first.hijri
+    assert third.hijri.holidays == ("Something",)
+
+    # even when it's the same dict changed afterwards
+    london["date"]["hijri"]["holidays"].append("Else")
+    fourth = aladhan.Data(**london, client=None).date
+    assert fourth.hijri.holidays == ("Something", "Else")
+    assert third.hijri.holidays == ("Something",)
+
+
+def test_shared_date_types_read_only():
+    day = day_payload(datetime.date(2021, 6, 9), timezone="Asia/Riyadh")
+    hijri = aladhan.Data(**day, client=None).date.hijri
+    with pytest.raises(AttributeError):
+        hijri.day = 1
+    with pytest.raises(TypeError):
+        hijri.weekday["en"] = "Something"
+    with pytest.raises(AttributeError):
+        hijri.holidays.append("Something")
+    assert hijri.to_raw() == day["date"]["hijri"]
+    assert isinstance(hijri.to_raw()["holidays"], list)
+
+
+def test_pickle():
+    day = day_payload(datetime.date(2021, 3, 28), timezone="Europe/London")
+    data = aladhan.Data(**day, client=object())
+    data.timings.fajr  # built before pickling, isha isn't
+    loaded = pickle.loads(pickle.dumps(data))
+    assert loaded.client is None
+    assert loaded.timings.data is loaded and loaded.meta.data is loaded
+    assert loaded.date.gregorian.date == data.date.gregorian.date
+    assert loaded.date.hijri.month == data.date.hijri.month
+    assert str(loaded.meta.timezone) == "Europe/London"
+    assert loaded.meta.method is data.meta.method
+    assert loaded.meta.offset.value == data.meta.offset.value
+    assert loaded.date.readable == data.date.readable
+    assert loaded.timings.minutes == data.timings.minutes
+    for before, after in zip(data.timings, loaded.timings):
+        assert after.data is loaded
+        assert (after.time, after.time_utc, after.str_time) == (
+            before.time,
+            before.time_utc,
+            before.str_time,
+        )
+
+    client = object()
+    day["timings"] = {"Isha": day["timings"]["Isha"]}
+    data = aladhan.NextPrayerData(**day, client=None)
+    with reattach(client):
+        loaded = pickle.loads(pickle.dumps(data))
+    assert loaded.client is client and loaded.prayer.data is loaded
+    assert loaded.prayer.time_utc == data.prayer.time_utc
+    assert pickle.loads(pickle.dumps(data)).client is None
+
+
+def test_next_prayer_weak_backrefs():
+    day = day_payload(datetime.date(2021, 1, 9), timezone="Asia/Riyadh")
+    day["timings"] = {"Isha": day["timings"]["Isha"]}
+    client = aladhan.Client(weak_backrefs=True)
+    prayer = aladhan.NextPrayerData(**day, client=client).prayer
+    data = prayer.data  # kept alive by its prayer
+    assert data.prayer is prayer and data.meta.data is data
+    assert (prayer.time, prayer.time_utc, prayer.str_time) == expected(
+        day, "Isha"
+    )
+    del prayer
+    assert data.prayer.name == "Isha" and data.prayer.data is data
+
+    loaded = pickle.loads(pickle.dumps(data))
+    assert loaded.prayer.minutes == data.prayer.minutes
+    assert loaded.meta.data is loaded
+    gc.disable()
+    try:  # freed without the garbage collector
+        ref = weakref.ref(loaded)
+        del loaded
+        assert ref() is None
+    finally:
+        gc.enable()
+    client.close()
+
+
+def test_raw_round_trip():
+    day = day_payload(datetime.date(2021, 3, 28), timezone="Europe/London")
+    data = aladhan.Data.from_raw(day)
+    raw = data.to_raw()
+    assert raw["date"] == day["date"]
+    assert raw["timings"] == {n: t[:5] for n, t in day["timings"].items()}
+    meta = dict(day["meta"], method=raw["meta"]["method"])
+    assert raw["meta"] == meta and raw["meta"]["method"]["id"] == 2
+    assert json.loads(json.dumps(raw)) == raw
+
+    again = aladhan.Data.from_raw(raw, client="client")
+    assert again.client == "client" and again.timings.data is again
+    assert again.timings.minutes == data.timings.minutes
+    assert again.date.gregorian is data.date.gregorian
+    assert [p.time_utc for p in again.timings] == [
+        p.time_utc for p in data.timings
+    ]
+    assert aladhan.Date.from_raw(raw["date"]).hijri is data.date.hijri
+
+    day["timings"] = {"Isha": day["timings"]["Isha"]}
+    prayer = aladhan.NextPrayerData.from_raw(day)
+    raw = prayer.to_raw()
+    assert raw["timings"] == {"Isha": day["timings"]["Isha"][:5]}
+    again = aladhan.NextPrayerData.from_raw(raw)
+    assert again.prayer.time_utc == prayer.prayer.time_utc
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda d: d.pop("meta"),
+        lambda d: d["timings"].pop("Fajr"),
+        lambda d: d["date"]["hijri"].pop("month"),
+        lambda d: d["meta"].update(timezone="Nowhere/Land"),
+        lambda d: d["timings"].update(Fajr="soon"),
+        lambda d: d.update(date=[]),
+    ],
+)
+def test_invalid_raw(change):
+    day = day_payload(datetime.date(2021, 3, 28))
+    change(day)
+    with pytest.raises(ValueError):
+        aladhan.Data.from_raw(day)
+
+
+def test_lean_objects():
+    day = day_payload(datetime.date(2021, 6, 9), timezone="Asia/Riyadh")
+    timings = aladhan.Data(**day, client=None).timings
+    other = aladhan.Data(**day, client=None).timings
+    assert timings.minutes == other.minutes
+    assert all(a is b for a, b in zip(timings.minutes, other.minutes))
+
+    day["timings"] = {"Isha": day["timings"]["Isha"]}
+    prayer = aladhan.NextPrayerData(**day, client=None).prayer
+    data = timings.data
+    for obj in (
+        data,
+        data.meta,
+        data.date,
+        data.date.gregorian,
+        timings,
+        timings.fajr,
+        prayer,
+        prayer.data,
+    ):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from aladhan.http import _SyncRequester
+from aladhan.ratelimit import AIMDRateLimiter
+
+from .server import StandInServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_additive_increase():
+    limiter = AIMDRateLimiter(rate=4, max_rate=12, clock=FakeClock())
+    headers = {"RateLimit-Limit": "14", "RateLimit-Remaining": "13"}
+    for _ in range(4):  # about one second worth of responses
+        limiter.update(200, headers)
+    assert 7 < limiter.rate < 9
+    for _ in range(100):
+        limiter.update(200, headers)
+    assert limiter.rate == 12
+
+
+def test_multiplicative_decrease():
+    clock = FakeClock()
+    limiter = AIMDRateLimiter(rate=12, clock=clock)
+    limiter.update(429, {"Retry-After": "1"})
+    assert limiter.rate == 6
+    assert limiter.acquire() == pytest.approx(1)
+    # same window, a burst of 429s shouldn't collapse the rate
+    limiter.update(429, {"Retry-After": "1"})
+    assert limiter.rate == 6
+
+    clock.now += 5
+    limiter.update(200, {"RateLimit-Limit": "14", "RateLimit-Remaining": "1"})
+    assert limiter.rate == 3
+
+
+def test_ignores_missing_headers():
+    limiter = AIMDRateLimiter(rate=5, clock=FakeClock())
+    limiter.update(200, {})
+    assert limiter.rate == 5
+
+
+def test_converges_on_shifting_limit():
+    with StandInServer(limit=20) as server:
+        limiter = AIMDRateLimiter()
+        requester = _SyncRequester(rate_limiter=limiter)
+
+        def run(seconds):
+            done, end = 0, time.monotonic() + seconds
+            while time.monotonic() < end:
+                requester.request(server.url + "status")
+                done += 1
+            return done / seconds
+
+        run(1)  # ramping up
+        first = run(2)
+        server.limit = 8
+        run(1)  # adapting to the new limit
+        second = run(2)
+        requester.session.close()
+
+    assert first > 12
+    assert 4 <= second <= 10
+    assert server.throttled <= 3
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from aladhan.stream import CalendarParser
+
+from .payloads import month_payload, year_payload
+from .pms import *  # aladhan is imported from here
+from .server import StandInServer
+
+TIMEZONE = "Asia/Riyadh"
+
+
+def body(data):
+    res = {"code": 200, "status": "OK", "data": data}
+    return json.dumps(res, ensure_ascii=False, indent=1).encode()
+
+
+def parse(raw, size):
+    parser = CalendarParser()
+    days = []
+    for i in range(0, len(raw), size):
+        days.extend(parser.feed(raw[i : i + size]))
+    return days + parser.close()
+
+
+@pytest.mark.parametrize(*YEAR_CHUNK_SIZES)
+def test_parse_year(size):
+    data = year_payload(2021, timezone=TIMEZONE)
+    days = parse(body(data), size)
+    assert days == [day for month in data.values() for day in month]
+
+
+@pytest.mark.parametrize(*CHUNK_SIZES)
+def test_parse_month(size):
+    data = month_payload(2021, 2, timezone=TIMEZONE)
+    assert parse(body(data), size) == data
+
+
+def test_parse_is_incremental():
+    raw = body(month_payload(2021, 2, timezone=TIMEZONE))
+    parser = CalendarParser()
+    half = parser.feed(raw[: len(raw) // 2])
+    assert 10 < len(half) < 18
+    assert len(half + parser.feed(raw[len(raw) // 2 :]) + parser.close()) == 28
+
+
+@pytest.mark.parametrize(*BAD_BODIES)
+def test_parse_bad_body(body):
+    with pytest.raises(json.JSONDecodeError):
+        parse(body, 3)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    def calendar(path, query):
+        if query["address"] == "nowhere":
+            return 400, "Unable to geocode address."
+        year = int(query["year"])
+        if query["annual"] == "true":
+            return 200, year_payload(year, timezone=TIMEZONE)
+        return 200, month_payload(year, int(query["month"]), timezone=TIMEZONE)
+
+    with StandInServer(limit=1000) as server:
+        server.routes["calendarByAddress"] = calendar
+        monkeypatch.setattr(
+            "aladhan.http.CALENDAR_BY_ADDRESS",
+            server.url + "calendarByAddress",
+        )
+        yield server
+
+
+def test_stream_calendar(server):
+    with aladhan.Client() as client:
+        date = aladhan.CalendarDateArg(2021)
+        days = client.get_calendar_by_address("Mecca", date, stream=True)
+        assert not server.hits  # nothing is sent before iterating
+        streamed = [t.data.date.gregorian.date for t in days]
+        calendar = client.get_calendar_by_address("Mecca", date)
+
+    assert streamed == [
+        t.data.date.gregorian.date for days in calendar.values() for t in days
+    ]
+    assert len(streamed) == 365
+
+
+def test_stream_calendar_error(server):
+    with aladhan.Client() as client:
+        date = aladhan.CalendarDateArg(2021, 1)
+        days = client.get_calendar_by_address("nowhere", date, stream=True)
+        with pytest.raises(aladhan.exceptions.BadRequest):
+            next(days)
+
+
+@pytest.mark.asyncio
+async def test_async_stream_calendar(server):
+    async with aladhan.Client(is_async=True) as client:
+        date = aladhan.CalendarDateArg(2021, 2)
+        days = client.get_calendar_by_address("Mecca", date, stream=True)
+        streamed = [t async for t in days]
+        with pytest.raises(aladhan.exceptions.BadRequest):
+            async for _ in client.get_calendar_by_address(
+                "nowhere", date, stream=True
+            ):
+                pass
+
+    assert [t.data.date.gregorian.day for t in streamed] == list(range(1, 29))
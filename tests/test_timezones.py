@@ -0,0 +1,145 @@
+import datetime
+
+import pytest
+import pytz
+
+from aladhan import timezones
+from aladhan.columnar import ColumnarCalendar, to_datetime
+from aladhan.timezones import day_offset, get_timezone, utc_offset
+
+from .payloads import day_payload, year_payload
+from .pms import *  # aladhan is imported from here
+
+LONDON = pytz.timezone("Europe/London")
+
+
+@pytest.fixture(autouse=True, params=timezones.BACKENDS)
+def backend(request):
+    try:
+        timezones.set_backend(request.param)
+    except ImportError:
+        pytest.skip("zoneinfo isn't available")
+    yield request.param
+    timezones.set_backend(None)
+
+
+def test_get_timezone(backend):
+    tz = get_timezone("Europe/London")
+    assert get_timezone("Europe/London") is tz
+    assert str(tz) == "Europe/London"
+    assert hasattr(tz, "localize") == (backend == "pytz")
+    for name in ("Nowhere/Nowhere", "../UTC"):
+        with pytest.raises(KeyError):
+            get_timezone(name)
+
+
+def test_backend():
+    with pytest.raises(ValueError):
+        timezones.set_backend("dateutil")
+    timezones.set_backend(None)
+    assert timezones.get_backend() in timezones.BACKENDS
+
+
+def hours(n):
+    return None if n is None else datetime.timedelta(hours=n)
+
+
+@pytest.mark.parametrize(*DAY_OFFSETS)
+def test_day_offset(timezone, day, expected):
+    offset = day_offset(get_timezone(timezone), datetime.date(*day))
+    assert offset == hours(expected)
+
+
+@pytest.mark.parametrize(*UTC_OFFSETS)
+def test_utc_offset(time, strict, expected):
+    tz = get_timezone("Europe/London")
+    offset = utc_offset(tz, datetime.datetime(*time), strict)
+    assert offset == hours(expected)
+
+
+def dst_day(date, **times):
+    day = day_payload(date, timezone="Europe/London")
+    day["timings"].update(times)
+    return day
+
+
+def test_ambiguous_prayer():
+    # the clocks go back from 02:00 BST to 01:00 GMT
+    day = dst_day(datetime.date(2021, 10, 31), Lastthird="01:30 (GMT)")
+    timings = aladhan.Data(**day, client=None).timings
+    expected = datetime.datetime(2021, 10, 31, 1, 30)
+    assert timings.last_third.time_utc == expected
+    assert timings.sunrise.time_utc == timings.sunrise.time
+
+
+def test_non_existent_prayer():
+    # the clocks go forward from 01:00 GMT to 02:00 BST
+    day = dst_day(datetime.date(2021, 3, 28), Lastthird="01:30 (GMT)")
+    timings = aladhan.Data(**day, client=None).timings
+    assert timings.last_third.time_utc is None
+    assert timings.fajr.time_utc == timings.fajr.time - hours(1)
+
+    calendar = ColumnarCalendar.from_raw(day)
+    utc = to_datetime(calendar.utc["Lastthird"][0])
+    assert utc == datetime.datetime(2021, 3, 28, 1, 30)  # read as GMT
+
+
+def reference_utc(time):
+    # one pytz call per time, the way it was done before
+    try:
+        return time - LONDON.utcoffset(time)
+    except pytz.AmbiguousTimeError:
+        return time - LONDON.utcoffset(time, is_dst=False)
+    except pytz.NonExistentTimeError:
+        return None
+
+
+def test_dst_calendar():
+    year = year_payload(2021, timezone="Europe/London")
+    for month in year.values():
+        for day in month:
+            for prayer in aladhan.Data(**day, client=None).timings:
+                assert prayer.time_utc == reference_utc(prayer.time)
+
+
+@pytest.mark.parametrize("timezone", pytz.common_timezones)
+def test_equivalent_offsets(timezone):
+    # every minute around the DST switches of 2021, against pytz
+    reference = pytz.timezone(timezone)
+    tz = get_timezone(timezone)
+    transitions = getattr(reference, "_utc_transition_times", [])
+    for i, transition in enumerate(transitions):
+        if transition.year != 2021:
+            continue
+        _, before, _ = reference._transition_info[i - 1]
+        local = transition + before
+        for minute in range(-150, 150):
+            time = local + datetime.timedelta(minutes=minute)
+            for strict in (True, False):
+                try:
+                    expected = reference.utcoffset(time, is_dst=None)
+                except pytz.AmbiguousTimeError:
+                    expected = reference.utcoffset(time, is_dst=False)
+                except pytz.NonExistentTimeError:
+                    expected = None
+                    if not strict:
+                        expected = reference.utcoffset(time, is_dst=False)
+                assert utc_offset(tz, time, strict) == expected, time
+
+
+def test_meta_timezone():
+    day = day_payload(datetime.date(2021, 5, 1), timezone="Europe/London")
+    meta = aladhan.Data(**day, client=None).meta
+    assert meta.timezone is get_timezone("Europe/London")
+    assert meta.parameters.timezonestring == "Europe/London"
+
+
+@pytest.mark.parametrize(*TIMEZONE_NAMES)
+def test_is_timezone(name, expected):
+    assert timezones.is_timezone(name) is expected
+    assert timezones.is_timezone(name) is expected  # memoized
+    if expected:
+        aladhan.Parameters(timezonestring=name)
+    else:
+        with pytest.raises(InvalidTimezone):
+            aladhan.Parameters(timezonestring=name)
@@ -0,0 +1,96 @@
+import datetime
+
+import pytest
+
+from aladhan.http import MAX_IN_FLIGHT
+from aladhan.planner import calendar_requests
+
+from .payloads import FakeAPI
+from .pms import *  # aladhan is imported from here
+
+START = aladhan.TimingsDateArg("15-03-2026")
+END = aladhan.TimingsDateArg("02-07-2026")
+
+
+def dates(timings):
+    return [
+        datetime.datetime.strptime(t.data.date.gregorian.date, "%d-%m-%Y")
+        for t in timings
+    ]
+
+
+def check(timings):
+    ds = dates(timings)
+    assert ds[0] == datetime.datetime(2026, 3, 15)
+    assert ds[-1] == datetime.datetime(2026, 7, 2)
+    assert all(b - a == datetime.timedelta(days=1) for a, b in zip(ds, ds[1:]))
+
+
+@pytest.mark.parametrize(*CALENDAR_REQUESTS)
+def test_calendar_requests(start, end, expected):
+    reqs = calendar_requests(datetime.date(*start), datetime.date(*end))
+    assert [(r.year, r.month) for r in reqs] == expected
+
+
+@pytest.fixture
+def client():
+    with aladhan.Client() as client:
+        client.http.request = FakeAPI(timezone="Africa/Algiers")
+        yield client
+
+
+@pytest.mark.parametrize(
+    ["getter", "args"],
+    [
+        ["get_timings_range", (3, 36.7)],
+        ["get_timings_range_by_address", ("Algiers",)],
+        ["get_timings_range_by_city", ("Algiers", "DZ")],
+    ],
+)
+def test_timings_range(client, getter, args):
+    check(getattr(client, getter)(*args, START, END))
+    assert len(client.http.request.calls) == 5  # one per month
+
+
+def test_timings_range_stream(client):
+    it = client.get_timings_range(
+        3, 36.7, aladhan.TimingsDateArg("20-12-2025"), START, stream=True
+    )
+    assert next(it).data.date.gregorian.date == "20-12-2025"
+    assert len(client.http.request.calls) == 1  # lazily fetched
+    assert len(list(it)) == 12 + 31 + 28 + 15 - 1
+
+
+def test_timings_range_errors(client):
+    with pytest.raises(ValueError):
+        client.get_timings_range(3, 36.7, END, START)
+
+
+@pytest.mark.asyncio
+async def test_async_timings_range():
+    async with aladhan.Client(True) as client:
+        api = client.http.request = FakeAPI(True, 0.1, timezone="Asia/Riyadh")
+        timings = await client.get_timings_range(
+            46.7, 24.7, aladhan.TimingsDateArg("15-11-2024"), END
+        )
+        assert len(api.calls) == api.max_in_flight == 4
+        assert dates(timings)[0] == datetime.datetime(2024, 11, 15)
+        assert len(timings) == 595
+
+        stream = client.get_timings_range(46.7, 24.7, START, END, stream=True)
+        check([t async for t in stream])
+
+
+@pytest.mark.asyncio
+async def test_async_timings_range_bounded():
+    async with aladhan.Client(True) as client:
+        api = client.http.request = FakeAPI(True, 0.05, timezone="Asia/Riyadh")
+        timings = await client.get_timings_range(
+            46.7,
+            24.7,
+            aladhan.TimingsDateArg("01-01-2015"),
+            aladhan.TimingsDateArg("31-12-2020"),
+        )
+    assert len(timings) == 2192
+    assert len(api.calls) == 6
+    assert api.max_in_flight == MAX_IN_FLIGHT